@@ -0,0 +1 @@
+"""Offline benchmarks for the eBay SDK (not shipped with the package)."""
@@ -0,0 +1,90 @@
+"""
+Benchmark: requests/HTTP/1.1 vs httpx/HTTP/2 transport at increasing concurrency.
+
+Both transports talk to local stand-in servers that add the same fixed latency
+per response. Loopback has no TLS, so this measures multiplexing and pool
+behavior only; real handshake savings against api.ebay.com come on top.
+
+    python -m benchmarks.http2 --requests 2000 --latency 0.02 --concurrency 1 8 32 128
+"""
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock
+
+from benchmarks.stand_in import H2StandIn, Http1StandIn
+from ebay_rest.base_client import BaseClient
+
+
+def _run(client: BaseClient, total: int, concurrency: int) -> dict[str, Any]:
+    latencies: list[float] = []
+
+    def call(_: int) -> None:
+        start = time.perf_counter()
+        client.get("/buy/browse/v1/item/v1|1234567890|0")
+        latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_second": round(total / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+def bench_transport(http2: bool, total: int, concurrency: int, latency: float) -> dict[str, Any]:
+    server_class = H2StandIn if http2 else Http1StandIn
+    with server_class(latency=latency) as server:
+        client = BaseClient(
+            auth_client=MagicMock(),
+            base_url=server.url,
+            user_access_token="bench",
+            pool_maxsize=concurrency if not http2 else 4,
+            pool_block=True,
+            http2=http2,
+        )
+        # Warm up so both transports start with open connections
+        _run(client, min(concurrency, total), concurrency)
+        result = _run(client, total, concurrency)
+        result["server_connections"] = server.connections
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="requests per run")
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency in seconds")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = []
+    for concurrency in args.concurrency:
+        for http2 in (False, True):
+            result = bench_transport(http2, args.requests, concurrency, args.latency)
+            result.update(transport="http2" if http2 else "http1.1", concurrency=concurrency)
+            results.append(result)
+            if not args.json:
+                print(
+                    f"{result['transport']:>8}  c={concurrency:<4} "
+                    f"{result['requests_per_second']:>9.1f} req/s  "
+                    f"p50={result['p50_ms']:>7.2f}ms  p99={result['p99_ms']:>7.2f}ms  "
+                    f"connections={result['server_connections']}"
+                )
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Minimal local HTTP/1.1 and HTTP/2 (h2c) stand-in servers for transport benchmarks."""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+BODY = json.dumps({"itemId": "v1|1234567890|0", "title": "Stand-in item"}).encode("utf-8")
+
+
+class _Http1Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _CountingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), _Http1Handler)
+        self.latency = latency
+        self.connections = 0
+
+    def get_request(self):
+        request = super().get_request()
+        self.connections += 1
+        return request
+
+
+class Http1StandIn:
+    """Threaded HTTP/1.1 keep-alive server answering every request after ``latency`` seconds."""
+
+    def __init__(self, latency: float = 0.02):
+        self._server = _CountingHTTPServer(latency)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    def __enter__(self) -> "Http1StandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class H2StandIn:
+    """
+    Cleartext HTTP/2 (prior knowledge) server built on the ``h2`` state machine.
+
+    Every stream is answered after ``latency`` seconds from a timer thread, so
+    many requests are in flight on one connection at once.
+    """
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.connections = 0
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen(1024)
+        self._closed = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._sock.getsockname()[1]}"
+
+    def __enter__(self) -> "H2StandIn":
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._closed.set()
+        self._sock.close()
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        h2conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        lock = threading.Lock()
+
+        def respond(stream_id: int) -> None:
+            with lock:
+                try:
+                    h2conn.send_headers(
+                        stream_id,
+                        [
+                            (":status", "200"),
+                            ("content-type", "application/json"),
+                            ("content-length", str(len(BODY))),
+                        ],
+                    )
+                    h2conn.send_data(stream_id, BODY, end_stream=True)
+                    sock.sendall(h2conn.data_to_send())
+                except Exception:
+                    pass
+
+        with lock:
+            h2conn.initiate_connection()
+            sock.sendall(h2conn.data_to_send())
+
+        try:
+            while not self._closed.is_set():
+                data = sock.recv(65535)
+                if not data:
+                    return
+                with lock:
+                    events = h2conn.receive_data(data)
+                    for event in events:
+                        if isinstance(event, h2.events.DataReceived):
+                            h2conn.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                        elif isinstance(event, h2.events.StreamEnded):
+                            timer = threading.Timer(self.latency, respond, args=(event.stream_id,))
+                            timer.daemon = True
+                            timer.start()
+                    sock.sendall(h2conn.data_to_send())
+        except OSError:
+            return
+        finally:
+            sock.close()
@@ -0,0 +1,390 @@
+"""
+Benchmark suite for SDK hot paths, with baseline comparison.
+
+Runs offline: micro-benchmarks use in-memory payloads and the end-to-end runs
+use the local fake eBay server from ebay_rest.testing.
+
+    python -m benchmarks.suite                                 # human-readable table
+    python -m benchmarks.suite --json > results.json           # machine-readable
+    python -m benchmarks.suite --save-baseline baseline.json   # record a baseline
+    python -m benchmarks.suite --baseline baseline.json --fail-on-regression
+
+Results are keyed by benchmark name; each has a ``value``, its ``unit`` and
+whether ``lower`` or ``higher`` is better, so runs compare across releases.
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from ebay_rest import EbayClient
+from ebay_rest.auth import OAuth2Client
+from ebay_rest.base_client import BaseClient
+from ebay_rest.browse.models import SearchResponse
+from ebay_rest.cache import MemoryCache, SQLiteCache, TieredCache, cache_key
+from ebay_rest.inventory.models import InventoryItemsResponse
+from ebay_rest.orders.models import OrdersResponse
+from ebay_rest.pagination import paginate
+from ebay_rest.testing import FakeEbayApi, FakeEbayServer, data
+from ebay_rest.transport import TransportResponse
+
+PAGE_SIZES = (50, 200)
+CONCURRENCY = (1, 4, 16, 64, 256)
+
+Result = dict[str, Any]
+
+
+def _time_per_op(func: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """Best-of-``repeat`` seconds per call, each round lasting about ``min_time``."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()  # calls needed for a 0.2s round
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _micro(value_seconds: float, per: str = "op") -> Result:
+    return {"value": round(value_seconds * 1e6, 3), "unit": f"us/{per}", "better": "lower"}
+
+
+def _page_payload(kind: str, size: int) -> bytes:
+    if kind == "search":
+        body = {"itemSummaries": [data.item_summary(i) for i in range(size)], "total": 100_000}
+    elif kind == "orders":
+        body = {"orders": [data.order(i) for i in range(size)], "total": 100_000}
+    else:
+        body = {"inventoryItems": [data.inventory_item(i) for i in range(size)], "total": 100_000}
+    body.update(
+        limit=size, offset=0, href="https://api.ebay.com/x", next="https://api.ebay.com/x?offset=1"
+    )
+    return json.dumps(body).encode("utf-8")
+
+
+def bench_decode_and_validate(min_time: float, repeat: int) -> dict[str, Result]:
+    """Response handling (_handle_response) plus pydantic validation of list pages."""
+    client = BaseClient(auth_client=OAuth2Client("bench", "bench"), base_url="https://api.ebay.com")
+    models = {
+        "search": SearchResponse,
+        "orders": OrdersResponse,
+        "inventory": InventoryItemsResponse,
+    }
+    results = {}
+    for kind, model in models.items():
+        for size in PAGE_SIZES:
+            response = TransportResponse(
+                200, {"Content-Type": "application/json"}, _page_payload(kind, size)
+            )
+
+            def decode() -> Any:
+                return client._handle_response(response)
+
+            def decode_and_validate() -> Any:
+                return model(**client._handle_response(response))
+
+            results[f"decode.{kind}.{size}"] = _micro(
+                _time_per_op(decode, min_time, repeat), "page"
+            )
+            results[f"decode_validate.{kind}.{size}"] = _micro(
+                _time_per_op(decode_and_validate, min_time, repeat), "page"
+            )
+    return results
+
+
+def bench_headers(min_time: float, repeat: int) -> dict[str, Result]:
+    """Building request headers with a user token and with a cached app token."""
+    auth = OAuth2Client("bench", "bench")
+    auth.access_token = "app"
+    auth.token_expires_at = time.time() + 3600
+    user = BaseClient(auth_client=auth, base_url="https://api.ebay.com", user_access_token="t")
+    app = BaseClient(auth_client=auth, base_url="https://api.ebay.com")
+    return {
+        "headers.user_token": _micro(_time_per_op(user._get_headers, min_time, repeat)),
+        "headers.app_token": _micro(_time_per_op(app._get_headers, min_time, repeat)),
+    }
+
+
+def bench_pagination(min_time: float, repeat: int, items: int = 10_000) -> dict[str, Result]:
+    """paginate() overhead per item over pre-built pages (no I/O, no parsing)."""
+    page_size = 200
+    pages = {
+        offset: {
+            "items": [{"i": i} for i in range(offset, min(offset + page_size, items))],
+            "limit": page_size,
+            "offset": offset,
+            "next": (
+                f"https://api.ebay.com/x?offset={offset + page_size}"
+                if offset + page_size < items
+                else None
+            ),
+        }
+        for offset in range(0, items, page_size)
+    }
+
+    last_page = {"items": [], "limit": page_size, "offset": items, "next": None}
+
+    def fetch(offset: int = 0, **_: Any) -> dict[str, Any]:
+        return pages.get(offset, last_page)
+
+    def drain() -> None:
+        for _ in paginate(fetch):
+            pass
+
+    return {"pagination.per_item": _micro(_time_per_op(drain, min_time, repeat) / items, "item")}
+
+
+def bench_cache(min_time: float, repeat: int) -> dict[str, Result]:
+    """Cache backends in isolation, storing get_item responses (no HTTP)."""
+    value = data.item(1)
+    keys = [
+        cache_key("https://api.ebay.com", f"/buy/browse/v1/item/{data.item_id(i)}", None, "app")
+        for i in range(2)
+    ]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        disk = SQLiteCache(f"{directory}/cache.db")
+        # One-entry L1 read with alternating keys: every get misses L1 and promotes from L2
+        promoting = TieredCache(MemoryCache(max_entries=1), disk)
+        backends = {
+            "memory": MemoryCache(),
+            "sqlite": disk,
+            "tiered": TieredCache(MemoryCache(), disk),
+        }
+        for name, backend in backends.items():
+            backend.set(keys[0], value, 3600)
+            results[f"cache.{name}.get_hit"] = _micro(
+                _time_per_op(lambda: backend.get(keys[0]), min_time, repeat)
+            )
+            results[f"cache.{name}.set"] = _micro(
+                _time_per_op(lambda: backend.set(keys[1], value, 3600), min_time, repeat)
+            )
+        turn = itertools.count()
+        results["cache.tiered.get_l2_hit"] = _micro(
+            _time_per_op(lambda: promoting.get(keys[next(turn) % 2]), min_time, repeat)
+        )
+        disk.close()
+    return results
+
+
+IMPORT_SCENARIOS = {
+    "import.package": "import ebay_rest",
+    "import.client": "from ebay_rest import EbayClient",
+    "import.cold_start_browse": "from ebay_rest import EbayClient; EbayClient('a', 'b').browse",
+    # What every cold start paid before sub-clients and models were lazy
+    "import.all_modules": (
+        "import ebay_rest.browse.client, ebay_rest.inventory.client, "
+        "ebay_rest.orders.client, ebay_rest.account.client"
+    ),
+}
+
+
+def _interpreter_seconds(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def bench_import(repeat: int) -> dict[str, Result]:
+    """Cold-start cost in fresh interpreters, net of bare interpreter startup."""
+    startup = min(_interpreter_seconds("pass") for _ in range(repeat))
+    results = {}
+    for name, code in IMPORT_SCENARIOS.items():
+        best = min(_interpreter_seconds(code) for _ in range(repeat))
+        results[name] = {
+            "value": round(max(best - startup, 0.0) * 1e3, 3),
+            "unit": "ms",
+            "better": "lower",
+        }
+    return results
+
+
+def bench_end_to_end(
+    requests_per_level: int,
+    concurrency_levels: tuple[int, ...] = CONCURRENCY,
+    latency: float = 0.0,
+) -> dict[str, Result]:
+    """Browse get_item throughput against the local fake server."""
+    results: dict[str, Result] = {}
+    api = FakeEbayApi(items=100_000, latency=latency)
+    with FakeEbayServer(api) as server:
+        for concurrency in concurrency_levels:
+            client = EbayClient(
+                "bench",
+                "bench",
+                base_url=server.url,
+                user_access_token="bench",
+                pool_maxsize=concurrency,
+                pool_block=True,
+            )
+            latencies: list[float] = []
+
+            def call(index: int) -> None:
+                start = time.perf_counter()
+                client.browse.get_item(data.item_id(index))
+                latencies.append(time.perf_counter() - start)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(call, range(concurrency)))  # open connections first
+                latencies.clear()
+                started = time.perf_counter()
+                list(executor.map(call, range(requests_per_level)))
+                elapsed = time.perf_counter() - started
+            client.base_client.close()
+
+            latencies.sort()
+            results[f"e2e.get_item.c{concurrency}"] = {
+                "value": round(requests_per_level / elapsed, 1),
+                "unit": "req/s",
+                "better": "higher",
+                "p50_ms": round(statistics.median(latencies) * 1000, 3),
+                "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000, 3),
+            }
+    return results
+
+
+def run(
+    quick: bool = False,
+    only: Optional[list[str]] = None,
+    concurrency: tuple[int, ...] = CONCURRENCY,
+) -> dict[str, Any]:
+    """
+    Run the suite.
+
+    Args:
+        quick: Shorter timing rounds and fewer end-to-end requests (noisier)
+        only: Run only benchmark groups whose name starts with one of these prefixes
+        concurrency: Concurrency levels for the end-to-end runs
+
+    Returns:
+        Dictionary with ``meta`` (environment) and ``results`` (by benchmark name)
+    """
+    min_time, repeat = (0.05, 3) if quick else (0.2, 5)
+    groups: dict[str, Callable[[], dict[str, Result]]] = {
+        "decode": lambda: bench_decode_and_validate(min_time, repeat),
+        "headers": lambda: bench_headers(min_time, repeat),
+        "pagination": lambda: bench_pagination(min_time, repeat),
+        "cache": lambda: bench_cache(min_time, repeat),
+        "import": lambda: bench_import(repeat * 3),
+        "e2e": lambda: bench_end_to_end(200 if quick else 2000, concurrency),
+    }
+    results: dict[str, Result] = {}
+    for name, group in groups.items():
+        if only and not any(name.startswith(prefix) or prefix.startswith(name) for prefix in only):
+            continue
+        results.update(group())
+    if only:
+        results = {
+            name: result
+            for name, result in results.items()
+            if any(name.startswith(prefix) for prefix in only)
+        }
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10
+) -> dict[str, Any]:
+    """
+    Compare a run against a baseline run.
+
+    Args:
+        current: Output of run()
+        baseline: Earlier output of run()
+        threshold: Relative slowdown that counts as a regression (default: 10%)
+
+    Returns:
+        Dictionary with per-benchmark ``change`` (positive means slower/worse)
+        and the list of ``regressions``
+    """
+    comparison: dict[str, Any] = {}
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("value") or result.get("unit") != previous.get("unit"):
+            continue
+        if result["better"] == "lower":
+            change = result["value"] / previous["value"] - 1
+        else:
+            change = previous["value"] / result["value"] - 1 if result["value"] else float("inf")
+        comparison[name] = {
+            "baseline": previous["value"],
+            "current": result["value"],
+            "unit": result["unit"],
+            "change": round(change, 4),
+        }
+        if change > threshold:
+            regressions.append(name)
+    return {"threshold": threshold, "benchmarks": comparison, "regressions": regressions}
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    comparison = report.get("comparison", {}).get("benchmarks", {})
+    for name, result in report["results"].items():
+        line = f"{name:<36} {result['value']:>12,.3f} {result['unit']:<10}"
+        if "p99_ms" in result:
+            line += f" p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms"
+        if name in comparison:
+            line += f"  ({comparison[name]['change']:+.1%} vs baseline)"
+        print(line)
+    regressions = report.get("comparison", {}).get("regressions")
+    if regressions:
+        print(
+            f"\nRegressions over {report['comparison']['threshold']:.0%}: {', '.join(regressions)}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--quick", action="store_true", help="shorter, noisier run")
+    parser.add_argument(
+        "--only", nargs="+", help="benchmark name prefixes, e.g. decode e2e.get_item.c1"
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(CONCURRENCY))
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="write results to this file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="regression threshold (default 0.10)"
+    )
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 on regressions")
+    args = parser.parse_args(argv)
+
+    report = run(quick=args.quick, only=args.only, concurrency=tuple(args.concurrency))
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["comparison"] = compare(report, json.load(f), args.threshold)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({"meta": report["meta"], "results": report["results"]}, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_table(report)
+
+    if args.fail_on_regression and report.get("comparison", {}).get("regressions"):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
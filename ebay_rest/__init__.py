@@ -2,10 +2,63 @@
 eBay REST API SDK for Python.
 
 A modern, professional SDK for interacting with eBay's REST APIs.
+
+Exports are imported on first use, so ``import ebay_rest`` stays cheap.
 """
 
-from ebay_rest.client import EbayClient
+from typing import TYPE_CHECKING
+
+from ebay_rest._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ebay_rest.circuit import CircuitBreaker
+    from ebay_rest.client import EbayClient
+    from ebay_rest.concurrency import AdaptiveLimiter, fan_out
+    from ebay_rest.credentials import UserCredentials
+    from ebay_rest.deadline import use_deadline
+    from ebay_rest.hedging import HedgePolicy
+    from ebay_rest.priority import Priority, use_priority
+    from ebay_rest.quota import QuotaLedger
+    from ebay_rest.ratelimit import SharedTokenBucket, TokenBucket
+    from ebay_rest.scheduler import RequestScheduler
+    from ebay_rest.token_vault import SQLiteTokenStore, TokenVault
 
-__all__ = ["EbayClient"]
+__all__ = [
+    "AdaptiveLimiter",
+    "CircuitBreaker",
+    "EbayClient",
+    "HedgePolicy",
+    "Priority",
+    "QuotaLedger",
+    "RequestScheduler",
+    "SQLiteTokenStore",
+    "SharedTokenBucket",
+    "TokenBucket",
+    "TokenVault",
+    "UserCredentials",
+    "fan_out",
+    "use_deadline",
+    "use_priority",
+]
 __version__ = "0.1.0"
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AdaptiveLimiter": "ebay_rest.concurrency",
+        "CircuitBreaker": "ebay_rest.circuit",
+        "EbayClient": "ebay_rest.client",
+        "HedgePolicy": "ebay_rest.hedging",
+        "Priority": "ebay_rest.priority",
+        "QuotaLedger": "ebay_rest.quota",
+        "RequestScheduler": "ebay_rest.scheduler",
+        "SQLiteTokenStore": "ebay_rest.token_vault",
+        "SharedTokenBucket": "ebay_rest.ratelimit",
+        "TokenBucket": "ebay_rest.ratelimit",
+        "TokenVault": "ebay_rest.token_vault",
+        "UserCredentials": "ebay_rest.credentials",
+        "fan_out": "ebay_rest.concurrency",
+        "use_deadline": "ebay_rest.deadline",
+        "use_priority": "ebay_rest.priority",
+    },
+)
@@ -0,0 +1,34 @@
+"""Lazy package exports (PEP 562 module ``__getattr__``)."""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's ``__getattr__`` and ``__dir__`` that import exports on first use.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> module defining it
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at package level
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value  # later lookups no longer reach __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
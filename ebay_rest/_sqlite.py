@@ -0,0 +1,77 @@
+"""SQLite plumbing shared by the on-disk cache, quota ledger and rate limiter."""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ConnectionPerThread:
+    """
+    One SQLite connection per thread (and per process) on a shared file.
+
+    sqlite3 connections must not be shared across threads or inherited across
+    ``fork()``, so each thread lazily opens its own and a forked child starts
+    over. The file is created with owner-only permissions and switched to WAL
+    mode, so readers never block and writers in other processes wait on the
+    busy timeout instead of failing.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        """
+        Initialize connection set.
+
+        Args:
+            path: Database file path (created ``0600`` if missing)
+            busy_timeout: Seconds a writer waits for the lock (default: 5)
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self.get().execute("PRAGMA journal_mode=WAL")
+
+    def get(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        if os.getpid() != self._pid:
+            self._local = threading.local()
+            self._connections = []
+            self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can reach every thread's connection
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close this process's connections."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Hold SQLite's write lock for a read-modify-write, committing on success."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
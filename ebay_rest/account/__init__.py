@@ -1,6 +1,19 @@
 """Account API module for accessing account information."""
 
-from ebay_rest.account.client import AccountClient
+from typing import TYPE_CHECKING
 
-__all__ = ["AccountClient"]
+from ebay_rest._lazy import lazy_exports
 
+if TYPE_CHECKING:
+    from ebay_rest.account.cache import AccountProfileCache
+    from ebay_rest.account.client import AccountClient
+
+__all__ = ["AccountClient", "AccountProfileCache"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AccountClient": "ebay_rest.account.client",
+        "AccountProfileCache": "ebay_rest.account.cache",
+    },
+)
@@ -0,0 +1,299 @@
+"""Cached view of the seller account profile and selling limits."""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from ebay_rest.account.models import AccountProfile, SellingLimit
+from ebay_rest.utils import logger
+
+
+def _calendar_month() -> str:
+    return time.strftime("%Y-%m", time.gmtime())
+
+
+class AccountProfileCache:
+    """
+    Time-based cache over the Account API privilege endpoint.
+
+    Keeps the last AccountProfile in memory so listing code can pre-flight
+    selling limits without a network hop. The profile is refreshed lazily once
+    it is older than ``ttl`` or, after ``start_background_refresh()``, by a
+    daemon thread that keeps it warm.
+
+    eBay reports ``sellingLimit`` as the cap for the whole selling period (a
+    calendar month), not what is left of it. Local reservations therefore
+    carry across refreshes and are only cleared when the period changes.
+    """
+
+    def __init__(
+        self,
+        fetch_profile: Callable[[], AccountProfile],
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        max_stale: Optional[float] = None,
+        selling_period: Callable[[], str] = _calendar_month,
+    ):
+        """
+        Initialize account profile cache.
+
+        Args:
+            fetch_profile: Callable returning a fresh AccountProfile from the API
+            ttl: Seconds before a cached profile is considered stale (default: 300)
+            clock: Monotonic clock used for expiry checks
+            max_stale: Longest the background refresher may keep serving a
+                profile after its last successful fetch (default: 3 * ttl)
+            selling_period: Returns the current selling period; reservations
+                are cleared when it changes (default: UTC calendar month)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+
+        self._fetch_profile = fetch_profile
+        self.ttl = ttl
+        self.max_stale = max_stale if max_stale is not None else 3 * ttl
+        self._clock = clock
+        self._selling_period = selling_period
+        self._period: Optional[str] = None
+        self._lock = threading.RLock()
+        self._profile: Optional[AccountProfile] = None
+        self._fetched_at: Optional[float] = None
+        self._selling_limit: Optional[SellingLimit] = None
+        self._reserved_quantity = 0
+        self._reserved_amount = 0.0
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the profile was last fetched, or None if never fetched."""
+        if self._fetched_at is None:
+            return None
+        return self._clock() - self._fetched_at
+
+    def is_stale(self) -> bool:
+        """Return True if there is no cached profile or it is older than ttl."""
+        age = self.age
+        return age is None or age >= self.ttl
+
+    def refresh(self) -> AccountProfile:
+        """
+        Fetch the profile from the API and replace the cached copy.
+
+        Local reservations are kept: the selling limit is a cap for the whole
+        period, so a new fetch does not say how much of it has been used.
+
+        Returns:
+            Freshly fetched AccountProfile
+        """
+        profile = self._fetch_profile()
+        with self._lock:
+            self._profile = profile
+            self._fetched_at = self._clock()
+            self._selling_limit = profile.selling_limit
+            self._roll_period()
+        return profile
+
+    def get_profile(self, force_refresh: bool = False) -> AccountProfile:
+        """
+        Return the cached profile, fetching it first if missing or stale.
+
+        Args:
+            force_refresh: Always fetch from the API
+
+        Returns:
+            Cached or freshly fetched AccountProfile
+        """
+        if not force_refresh:
+            profile = self._fresh_profile()
+            if profile is not None:
+                return profile
+        return self.refresh()
+
+    def invalidate(self) -> None:
+        """Drop the cached profile so the next lookup fetches it again; reservations are kept."""
+        with self._lock:
+            self._profile = None
+            self._fetched_at = None
+            self._selling_limit = None
+
+    def selling_limit(self) -> Optional[SellingLimit]:
+        """
+        Return the seller's selling limit from the cached profile.
+
+        Returns:
+            SellingLimit as reported by eBay, or None if the account has none
+        """
+        with self._lock:
+            if self._fresh_profile() is not None:
+                return self._selling_limit
+        return self.get_profile().selling_limit
+
+    def remaining_capacity(self) -> Optional[SellingLimit]:
+        """
+        Return the selling limit left after local reservations.
+
+        This never hits the network while the cached profile is fresh, so it is
+        cheap enough to call before every listing batch.
+
+        Returns:
+            SellingLimit with the remaining quantity/amount, or None if unlimited
+        """
+        limit = self.selling_limit()
+        if limit is None:
+            return None
+
+        with self._lock:
+            self._roll_period()
+            quantity = limit.quantity
+            if quantity is not None:
+                quantity = max(quantity - self._reserved_quantity, 0)
+            amount = limit.amount
+            if amount is not None:
+                amount = max(amount - self._reserved_amount, 0.0)
+        return SellingLimit(amount=amount, currency=limit.currency, quantity=quantity)
+
+    def can_list(self, quantity: int = 1, amount: float = 0.0) -> bool:
+        """
+        Pre-flight check for a listing batch against the remaining capacity.
+
+        Args:
+            quantity: Number of items the batch will list
+            amount: Total value the batch will list
+
+        Returns:
+            True if the batch fits within the remaining selling limit
+        """
+        remaining = self.remaining_capacity()
+        if remaining is None:
+            return True
+        if remaining.quantity is not None and quantity > remaining.quantity:
+            return False
+        if remaining.amount is not None and amount > remaining.amount:
+            return False
+        return True
+
+    def reserve(self, quantity: int = 1, amount: float = 0.0) -> None:
+        """
+        Record capacity consumed locally since the last refresh.
+
+        Args:
+            quantity: Number of items listed
+            amount: Total value listed
+        """
+        if quantity < 0 or amount < 0:
+            raise ValueError("quantity and amount must be >= 0")
+        with self._lock:
+            self._roll_period()
+            self._reserved_quantity += quantity
+            self._reserved_amount += amount
+
+    def export_state(self) -> Optional[dict[str, Any]]:
+        """
+        Return the cached profile for a warm-start snapshot.
+
+        Returns:
+            Dictionary with the profile, its age and the ttl, or None if there is
+            no fresh profile
+        """
+        with self._lock:
+            if self._profile is None or self.is_stale():
+                return None
+            return {
+                "profile": self._profile.model_dump(mode="json", by_alias=True, exclude_none=True),
+                "age": self.age,
+                "ttl": self.ttl,
+                "reserved_quantity": self._reserved_quantity,
+                "reserved_amount": self._reserved_amount,
+                "period": self._period,
+            }
+
+    def restore_state(self, state: dict[str, Any], elapsed: float = 0.0) -> bool:
+        """
+        Load a profile exported by ``export_state()``.
+
+        Args:
+            state: Output of export_state()
+            elapsed: Seconds since the state was exported, added to its age
+
+        Returns:
+            True if the profile was loaded; False if it would already be stale
+        """
+        age = state.get("age", 0.0) + max(elapsed, 0.0)
+        if age >= self.ttl:
+            return False
+        profile = AccountProfile.model_validate(state["profile"])
+        with self._lock:
+            self._profile = profile
+            self._fetched_at = self._clock() - age
+            self._selling_limit = profile.selling_limit
+            self._period = state.get("period")
+            self._reserved_quantity = state.get("reserved_quantity", 0)
+            self._reserved_amount = state.get("reserved_amount", 0.0)
+            self._roll_period()
+        return True
+
+    def start_background_refresh(self, interval: Optional[float] = None) -> None:
+        """
+        Refresh the profile periodically on a daemon thread.
+
+        Args:
+            interval: Seconds between refreshes (default: ttl)
+        """
+        with self._lock:
+            if self.is_background_refresh_running():
+                return
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._refresh_loop,
+                args=(self._stop_event, interval or self.ttl),
+                name="ebay-account-profile-refresh",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread if it is running."""
+        with self._lock:
+            stop_event, thread = self._stop_event, self._thread
+            self._stop_event = None
+            self._thread = None
+        if stop_event is not None:
+            stop_event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def is_background_refresh_running(self) -> bool:
+        """Return True if the background refresh thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _fresh_profile(self) -> Optional[AccountProfile]:
+        with self._lock:
+            if self._profile is None:
+                return None
+            if not self.is_stale():
+                return self._profile
+            # The background thread owns freshness while it is running, but a
+            # profile it has failed to refresh for max_stale is not served
+            if self.is_background_refresh_running() and self.age < self.max_stale:
+                return self._profile
+            return None
+
+    def _roll_period(self) -> None:
+        """Clear reservations once a new selling period has started (caller holds the lock)."""
+        period = self._selling_period()
+        if period != self._period:
+            if self._period is not None:
+                self._reserved_quantity = 0
+                self._reserved_amount = 0.0
+            self._period = period
+
+    def _refresh_loop(self, stop_event: threading.Event, interval: float) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the last good profile; try again next interval
+                logger.warning("Account profile refresh failed: %s", e)
+            if stop_event.wait(interval):
+                return
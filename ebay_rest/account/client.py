@@ -1,5 +1,9 @@
 """Account API client for accessing account information."""
 
+import threading
+from typing import Optional
+
+from ebay_rest.account.cache import AccountProfileCache
 from ebay_rest.account.models import (
     AccountProfile,
     PaymentPoliciesResponse,
@@ -26,6 +30,8 @@ class AccountClient:
         """
         self.base_client = base_client
         self.sandbox = sandbox
+        self._profile_cache: Optional[AccountProfileCache] = None
+        self._profile_cache_lock = threading.Lock()
 
     def get_account_profile(self) -> dict:
         """
@@ -38,7 +44,7 @@ class AccountClient:
         response_data = self.base_client.get(endpoint)
 
         try:
-            profile = AccountProfile(**response_data)
+            profile = self.base_client.parse(AccountProfile, response_data)
             return profile.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
@@ -47,12 +53,42 @@ class AccountClient:
         """Alias for get_account_profile for clarity."""
         return self.get_account_profile()
 
+    def get_profile_cache(
+        self, ttl: float = 300.0, background_refresh: bool = False
+    ) -> AccountProfileCache:
+        """
+        Get the shared cached view of the account profile.
+
+        The cache is created on first call; later calls return the same instance
+        and ignore the arguments.
+
+        Args:
+            ttl: Seconds before the cached profile is refetched (default: 300)
+            background_refresh: Keep the profile warm from a daemon thread
+
+        Returns:
+            AccountProfileCache bound to this client
+        """
+        with self._profile_cache_lock:
+            if self._profile_cache is None:
+                self._profile_cache = AccountProfileCache(self._fetch_account_profile, ttl=ttl)
+                if background_refresh:
+                    self._profile_cache.start_background_refresh()
+            return self._profile_cache
+
+    def _fetch_account_profile(self) -> AccountProfile:
+        endpoint = "/sell/account/v1/privilege"
+        # The profile cache keeps its own TTL, so its refreshes must reach eBay
+        self.base_client.invalidate(endpoint)
+        response_data = self.base_client.get(endpoint)
+        return self.base_client.parse(AccountProfile, response_data)
+
     def list_return_policies(self, marketplace_id: str) -> dict:
         """List return policies for a marketplace."""
         endpoint = "/sell/account/v1/return_policy"
         response_data = self.base_client.get(endpoint, params={"marketplace_id": marketplace_id})
         try:
-            parsed = ReturnPoliciesResponse(**response_data)
+            parsed = self.base_client.parse(ReturnPoliciesResponse, response_data)
             return parsed.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
@@ -62,7 +98,7 @@ class AccountClient:
         endpoint = "/sell/account/v1/payment_policy"
         response_data = self.base_client.get(endpoint, params={"marketplace_id": marketplace_id})
         try:
-            parsed = PaymentPoliciesResponse(**response_data)
+            parsed = self.base_client.parse(PaymentPoliciesResponse, response_data)
             return parsed.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
@@ -72,7 +108,7 @@ class AccountClient:
         endpoint = "/sell/account/v1/shipping_policy"
         response_data = self.base_client.get(endpoint, params={"marketplace_id": marketplace_id})
         try:
-            parsed = ShippingPoliciesResponse(**response_data)
+            parsed = self.base_client.parse(ShippingPoliciesResponse, response_data)
             return parsed.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
@@ -1,12 +1,14 @@
 """OAuth2 authentication client for eBay API."""
 
 import base64
+import threading
 import time
-from typing import Optional
+from typing import Any, Optional
 
 import requests
 
-from ebay_rest.errors import AuthError
+from ebay_rest.deadline import cap_timeout, time_remaining
+from ebay_rest.errors import AuthError, DeadlineExceeded
 
 
 class OAuth2Client:
@@ -14,9 +16,16 @@ class OAuth2Client:
     OAuth2 client for managing eBay API authentication.
 
     Handles access token retrieval, refresh, and expiration checking.
+    Safe to share across threads; concurrent callers wait for a single refresh.
     """
 
-    def __init__(self, client_id: str, client_secret: str, sandbox: bool = False):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        sandbox: bool = False,
+        oauth_url: Optional[str] = None,
+    ):
         """
         Initialize OAuth2 client.
 
@@ -24,15 +33,19 @@ class OAuth2Client:
             client_id: eBay application client ID
             client_secret: eBay application client secret
             sandbox: Whether to use sandbox environment
+            oauth_url: Optional token endpoint overriding the environment's (e.g. a local fake)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.sandbox = sandbox
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[float] = None
+        self._lock = threading.RLock()
 
         # Set OAuth URL based on sandbox flag
-        if sandbox:
+        if oauth_url:
+            self.oauth_url = oauth_url
+        elif sandbox:
             self.oauth_url = "https://api.sandbox.ebay.com/identity/v1/oauth2/token"
         else:
             self.oauth_url = "https://api.ebay.com/identity/v1/oauth2/token"
@@ -49,17 +62,22 @@ class OAuth2Client:
 
         Raises:
             AuthError: If token retrieval fails
+            DeadlineExceeded: If the active deadline passes before a token arrives
         """
         # Check if token is expired or missing
         if self.is_expired():
-            # Fetch new token
-            self.refresh_token()
+            with self._lock:
+                # Another thread may have refreshed while we waited for the lock
+                if self.is_expired():
+                    # Fetch new token
+                    self.refresh_token()
 
         # Return the stored access token (should be valid at this point)
-        if not self.access_token:
+        token = self.access_token
+        if not token:
             raise AuthError("Failed to obtain access token")
 
-        return self.access_token
+        return token
 
     def refresh_token(self) -> str:
         """
@@ -70,7 +88,9 @@ class OAuth2Client:
 
         Raises:
             AuthError: If token refresh fails
+            DeadlineExceeded: If the active deadline passes before a token arrives
         """
+        timeout = cap_timeout(30)
         try:
             # Create Basic Auth header
             credentials = f"{self.client_id}:{self.client_secret}"
@@ -89,7 +109,7 @@ class OAuth2Client:
             }
 
             # Make POST request to OAuth token endpoint
-            response = requests.post(self.oauth_url, headers=headers, data=data, timeout=30)
+            response = requests.post(self.oauth_url, headers=headers, data=data, timeout=timeout)
 
             # Check for HTTP errors
             if response.status_code != 200:
@@ -111,18 +131,23 @@ class OAuth2Client:
 
             # Parse response
             token_data = response.json()
-            self.access_token = token_data.get("access_token")
+            access_token = token_data.get("access_token")
             expires_in = token_data.get("expires_in", 7200)  # Default to 2 hours
 
-            # Calculate expiration time
-            self.token_expires_at = time.time() + expires_in
+            with self._lock:
+                self.access_token = access_token
+                # Calculate expiration time
+                self.token_expires_at = time.time() + expires_in
 
-            if not self.access_token:
+            if not access_token:
                 raise AuthError("Access token not found in response", response_data=token_data)
 
-            return self.access_token
+            return access_token
 
         except requests.RequestException as e:
+            if time_remaining() == 0.0:
+                # Our own shortened timeout, not a failure of the token endpoint
+                raise DeadlineExceeded(f"Deadline passed during token refresh: {e}")
             raise AuthError(f"Network error during token refresh: {str(e)}")
         except KeyError as e:
             raise AuthError(f"Invalid token response format: missing key {str(e)}")
@@ -152,6 +177,45 @@ class OAuth2Client:
         buffer_seconds = 60
         return current_time >= (self.token_expires_at - buffer_seconds)
 
+    def export_state(self) -> Optional[dict[str, Any]]:
+        """
+        Return the cached app token for a warm-start snapshot.
+
+        Returns:
+            Dictionary with the token, its expiry and scope, or None if there is
+            no unexpired token
+        """
+        with self._lock:
+            if self.is_expired():
+                return None
+            return {
+                "access_token": self.access_token,
+                "expires_at": self.token_expires_at,
+                "scope": self.scope,
+            }
+
+    def restore_state(self, state: dict[str, Any]) -> bool:
+        """
+        Adopt an app token exported by ``export_state()``.
+
+        Args:
+            state: Output of export_state()
+
+        Returns:
+            True if the token was adopted; False if it has expired or was
+            issued for a different scope
+        """
+        if state.get("scope") != self.scope:
+            return False
+        with self._lock:
+            previous = self.access_token, self.token_expires_at
+            self.access_token = state.get("access_token")
+            self.token_expires_at = state.get("expires_at")
+            if self.is_expired():
+                self.access_token, self.token_expires_at = previous
+                return False
+        return True
+
     def build_auth_header(self) -> dict[str, str]:
         """
         Build Authorization header for API requests.
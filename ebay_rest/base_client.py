@@ -1,26 +1,84 @@
 """Base HTTP client for eBay API requests."""
 
-from typing import Any, Optional
+import asyncio
+import contextvars
+import functools
+import inspect
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional, TypeVar, Union
+from urllib.parse import urlsplit
 
 import requests
 
 from ebay_rest.auth import OAuth2Client
+from ebay_rest.cache.base import CacheBackend
+from ebay_rest.cache.keys import cache_key
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.deadline import cap_timeout, check_deadline, time_remaining, use_deadline
 from ebay_rest.errors import (
     AuthError,
+    DeadlineExceeded,
     EbayAPIError,
     NotFoundError,
+    QuotaExhausted,
     RateLimitExceeded,
     ServerError,
     ValidationError,
 )
+from ebay_rest.hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    ON_ERROR,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    HookRegistry,
+    RequestEvent,
+    TokenRefreshEvent,
+)
+from ebay_rest.metrics import ClientMetrics, RequestTiming, api_family, endpoint_template
+from ebay_rest.priority import Priority
+from ebay_rest.transport import RequestsTransport, ResponseLike, Transport
 from ebay_rest import oauth
 
+if TYPE_CHECKING:
+    from ebay_rest.circuit import CircuitBreaker
+    from ebay_rest.concurrency import AdaptiveLimiter
+    from ebay_rest.hedging import HedgePolicy
+    from ebay_rest.quota import QuotaLedger
+    from ebay_rest.ratelimit import RateLimiter
+    from ebay_rest.scheduler import RequestScheduler
+
+ModelT = TypeVar("ModelT")
+
+# Credentials scoped to the current thread/task by BaseClient.use_credentials()
+_active_credentials: contextvars.ContextVar[Optional[UserCredentials]] = contextvars.ContextVar(
+    "ebay_rest_active_credentials", default=None
+)
+
+# Sentinel for "caller did not say which token it saw"
+_UNSET: Any = object()
+
+DEFAULT_USER_TOKEN_SCOPES = [
+    "https://api.ebay.com/oauth/api_scope/sell.inventory.readonly",
+    "https://api.ebay.com/oauth/api_scope/sell.fulfillment.readonly",
+    "https://api.ebay.com/oauth/api_scope/sell.account.readonly",
+]
+
+# GETs cached by default: listings, inventory and account settings change slowly or
+# only through this client, while order state moves on eBay's side
+DEFAULT_CACHE_PATHS = ("/buy/browse/", "/sell/inventory/", "/sell/account/")
+
 
 class BaseClient:
     """
     Base HTTP client for making requests to eBay API.
 
     Handles authentication, error mapping, and common HTTP operations.
+    A single instance is safe to share across threads.
     """
 
     def __init__(
@@ -33,6 +91,27 @@ class BaseClient:
         user_token_scopes: Optional[list[str]] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_idle_time: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        http2: bool = False,
+        transport: Optional[Transport] = None,
+        token_url: Optional[str] = None,
+        metrics: Union[bool, ClientMetrics] = True,
+        hooks: Optional[HookRegistry] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_ttl: float = 300.0,
+        cache_paths: tuple[str, ...] = DEFAULT_CACHE_PATHS,
+        negative_cache_ttl: float = 60.0,
+        quota: Optional["QuotaLedger"] = None,
+        scheduler: Optional["RequestScheduler"] = None,
+        limiter: Optional["AdaptiveLimiter"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        circuit_breaker: Optional["CircuitBreaker"] = None,
+        hedge: Optional["HedgePolicy"] = None,
     ):
         """
         Initialize base client.
@@ -46,18 +125,171 @@ class BaseClient:
             user_token_scopes: Optional list of OAuth scopes for token refresh
             client_id: Optional client ID for token refresh (from auth_client if not provided)
             client_secret: Optional client secret for token refresh (from auth_client if not provided)
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum keep-alive connections per host; size this to the
+                number of threads sharing the client (default: 10)
+            pool_block: Wait for a free connection instead of opening (and later
+                discarding) extra ones when the pool is exhausted (default: False)
+            max_idle_time: Close pooled connections after the client has been idle
+                this many seconds, before the server drops them (default: never)
+            connect_timeout: Seconds to wait for a connection (default: timeout)
+            read_timeout: Seconds to wait for response data (default: timeout)
+            http2: Multiplex requests over HTTP/2 connections using httpx
+                (requires ``pip install 'ebay-rest[http2]'``). pool_maxsize then
+                caps connections rather than concurrent requests.
+            transport: Custom Transport (e.g. Urllib3Transport or FakeTransport);
+                when given, the pool and http2 settings above are ignored
+            token_url: Optional OAuth token endpoint for user token refresh,
+                overriding the environment's (e.g. a local fake server)
+            metrics: Record request timings (default: True); pass a ClientMetrics
+                to share one collector between clients, or False to disable
+            hooks: HookRegistry to share between clients (default: a new, empty one)
+            cache: Response cache for GET requests: a MemoryCache, a SQLiteCache
+                shared by every process on the host, a TieredCache of the two,
+                or any other CacheBackend (default: no caching)
+            cache_ttl: Seconds GET responses stay cached; override per call with
+                ``get(..., cache_ttl=...)`` (default: 300)
+            cache_paths: Path prefixes whose GETs use cache_ttl by default; other
+                paths are cached only when a call passes cache_ttl (default:
+                Browse, Inventory and Account)
+            negative_cache_ttl: Seconds a 404 from a cached GET is remembered and
+                re-raised without a request, capped at the call's cache_ttl; 0
+                disables negative caching (default: 60)
+            quota: QuotaLedger that counts calls against daily limits, refuses
+                them locally by priority, and falls back to stale cache entries
+                as the budget runs low (default: no quota tracking)
+            scheduler: RequestScheduler that admits requests by priority when
+                more are waiting than it allows in flight (default: none)
+            limiter: AdaptiveLimiter that adjusts the requests allowed in flight
+                to 429s, server errors and latency (default: none)
+            rate_limiter: TokenBucket, or SharedTokenBucket for a rate shared
+                by every process on the host, pacing calls (default: none)
+            circuit_breaker: CircuitBreaker that fails calls to an API family
+                returning 5xx or timing out with CircuitOpenError, without
+                sending them, until it recovers (default: none)
+            hedge: HedgePolicy that sends a second copy of slow idempotent GETs
+                and takes the first answer (default: no hedging)
         """
         self.auth_client = auth_client
         self.base_url = base_url.rstrip("/")
         self.sandbox = sandbox
-        self.session = requests.Session()
+        if transport is None:
+            if http2:
+                from ebay_rest.http2 import Http2Transport
+
+                # Without TLS there is no ALPN, so plain http:// (local stand-ins) needs
+                # prior knowledge
+                transport = Http2Transport(
+                    max_connections=pool_maxsize,
+                    keepalive_expiry=max_idle_time,
+                    prior_knowledge=self.base_url.startswith("http://"),
+                )
+            else:
+                transport = RequestsTransport(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block,
+                    max_idle_time=max_idle_time,
+                )
+        self.transport: Transport = transport
         self.timeout = 30  # Default timeout in seconds
-        self.user_access_token = user_access_token
-        self.user_refresh_token = user_refresh_token
-        self.user_token_scopes = user_token_scopes or []
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # Default credentials, used when no per-seller credentials are in scope
+        self.credentials = UserCredentials(
+            access_token=user_access_token,
+            refresh_token=user_refresh_token,
+            scopes=user_token_scopes,
+        )
         # Store client credentials for refresh calls
         self.client_id = client_id or auth_client.client_id
         self.client_secret = client_secret or auth_client.client_secret
+        self.token_url = token_url
+        if isinstance(metrics, ClientMetrics):
+            self.metrics: Optional[ClientMetrics] = metrics
+        else:
+            self.metrics = ClientMetrics() if metrics else None
+        self.hooks = hooks if hooks is not None else HookRegistry()
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.cache_paths = cache_paths
+        self.negative_cache_ttl = negative_cache_ttl
+        self.quota = quota
+        self.scheduler = scheduler
+        self.limiter = limiter
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedge = hedge
+
+    @property
+    def session(self) -> Any:
+        """The calling thread's requests.Session, for transports that have one."""
+        return getattr(self.transport, "session", None)
+
+    @property
+    def user_access_token(self) -> Optional[str]:
+        """User access token of the default credentials."""
+        return self.credentials.access_token
+
+    @user_access_token.setter
+    def user_access_token(self, value: Optional[str]) -> None:
+        self.credentials.access_token = value
+
+    @property
+    def user_refresh_token(self) -> Optional[str]:
+        """Refresh token of the default credentials."""
+        return self.credentials.refresh_token
+
+    @user_refresh_token.setter
+    def user_refresh_token(self, value: Optional[str]) -> None:
+        self.credentials.refresh_token = value
+
+    @property
+    def user_token_scopes(self) -> list[str]:
+        """Refresh scopes of the default credentials."""
+        return self.credentials.scopes
+
+    @user_token_scopes.setter
+    def user_token_scopes(self, value: list[str]) -> None:
+        self.credentials.scopes = value
+
+    def _current_credentials(self) -> UserCredentials:
+        """Return the credentials in scope for this call, falling back to the defaults."""
+        return _active_credentials.get() or self.credentials
+
+    @contextmanager
+    def use_credentials(self, credentials: UserCredentials) -> Iterator[UserCredentials]:
+        """
+        Scope calls made in this thread/task to a seller's credentials.
+
+        The connection pool and app token stay shared; only the bearer token
+        and its refresh state change.
+
+        Args:
+            credentials: Seller credentials to use inside the block
+
+        Yields:
+            The active credentials
+        """
+        reset_token = _active_credentials.set(credentials)
+        try:
+            yield credentials
+        finally:
+            _active_credentials.reset(reset_token)
+
+    def as_user(self, credentials: "UserCredentials | str") -> "UserScopedClient":
+        """
+        Return a view of this client bound to a seller's credentials.
+
+        Args:
+            credentials: UserCredentials or a bare user access token
+
+        Returns:
+            UserScopedClient sharing this client's transport and pool
+        """
+        if isinstance(credentials, str):
+            credentials = UserCredentials(access_token=credentials)
+        return UserScopedClient(self, credentials)
 
     def _get_headers(self) -> dict[str, str]:
         """
@@ -66,9 +298,15 @@ class BaseClient:
         Returns:
             Dictionary of HTTP headers
         """
+        credentials = self._current_credentials()
+
+        if credentials.needs_refresh():
+            # Missing or known to be expired: refresh before sending instead of eating a 401
+            self._refresh_user_token_if_needed(credentials, stale_token=credentials.access_token)
+
         # Use override token for Sell APIs if provided
-        if self.user_access_token:
-            headers = {"Authorization": f"Bearer {self.user_access_token}"}
+        if credentials.access_token:
+            headers = {"Authorization": f"Bearer {credentials.access_token}"}
         else:
             headers = self.auth_client.build_auth_header()
 
@@ -89,75 +327,112 @@ class BaseClient:
         """
         Override the access token used for requests (e.g., Sell API user token).
 
+        This changes the default credentials shared by every caller; use
+        ``as_user()`` or ``use_credentials()`` to act for several sellers at once.
+
         Args:
-            token: Bearer token string or None to revert to client credentials.
+            token: Bearer token string or None to revert to client credentials
+                (this also drops the stored refresh token).
             refresh_token: Optional refresh token for automatic token refresh.
             scopes: Optional list of OAuth scopes for token refresh.
         """
-        self.user_access_token = token
-        if refresh_token is not None:
-            self.user_refresh_token = refresh_token
-        if scopes is not None:
-            self.user_token_scopes = scopes
+        _set_tokens(self.credentials, token, refresh_token, scopes)
 
-    def _refresh_user_token_if_needed(self) -> str:
+    def _refresh_user_token_if_needed(
+        self,
+        credentials: Optional[UserCredentials] = None,
+        stale_token: Any = _UNSET,
+    ) -> str:
         """
         Refresh user access token using refresh token if available.
 
+        Refreshes are single-flight per seller: concurrent callers that saw the
+        same stale token wait for one refresh and reuse its result.
+
+        Args:
+            credentials: Credentials to refresh (default: the ones in scope)
+            stale_token: Token the caller saw fail; skip refreshing if it already changed
+
         Returns:
             New access token string
 
         Raises:
             AuthError: If refresh token is not available or refresh fails
         """
-        if not self.user_refresh_token:
-            raise AuthError("Refresh token not available for automatic token refresh")
-
-        if not self.user_token_scopes:
-            # Default to common Sell API scopes if not provided
-            self.user_token_scopes = [
-                "https://api.ebay.com/oauth/api_scope/sell.inventory.readonly",
-                "https://api.ebay.com/oauth/api_scope/sell.fulfillment.readonly",
-                "https://api.ebay.com/oauth/api_scope/sell.account.readonly",
-            ]
+        credentials = credentials or self._current_credentials()
 
+        with credentials.lock:
+            if (
+                stale_token is not _UNSET
+                and credentials.access_token
+                and credentials.access_token != stale_token
+            ):
+                # Another caller refreshed while we waited for the lock
+                return credentials.access_token
+
+            if not credentials.refresh_token:
+                raise AuthError("Refresh token not available for automatic token refresh")
+
+            if not credentials.scopes:
+                # Default to common Sell API scopes if not provided
+                credentials.scopes = list(DEFAULT_USER_TOKEN_SCOPES)
+
+            started = time.perf_counter()
+            refresh_error: Optional[AuthError] = None
+            try:
+                return self._refresh_user_token(credentials)
+            except AuthError as e:
+                refresh_error = e
+                raise
+            finally:
+                if self.hooks.enabled:
+                    self.hooks.emit(
+                        ON_TOKEN_REFRESH,
+                        TokenRefreshEvent(
+                            list(credentials.scopes), time.perf_counter() - started, refresh_error
+                        ),
+                    )
+
+    def _refresh_user_token(self, credentials: UserCredentials) -> str:
+        """Exchange the refresh token for a new access token (caller holds the lock)."""
         try:
             # Call refresh_user_token
             environment = "sandbox" if self.sandbox else "production"
+            refresh_options: dict[str, Any] = {}
+            if self.token_url:
+                refresh_options["token_url"] = self.token_url
             token_response = oauth.refresh_user_token(
                 client_id=self.client_id,
                 client_secret=self.client_secret,
-                refresh_token=self.user_refresh_token,
-                scopes=self.user_token_scopes,
+                refresh_token=credentials.refresh_token,
+                scopes=credentials.scopes,
                 environment=environment,
+                **refresh_options,
             )
 
             # Extract new access token
-            new_access_token = token_response.get("access_token")
-            if not new_access_token:
+            if not token_response.get("access_token"):
                 raise AuthError("Access token not found in refresh response")
 
-            # Update stored access token
-            self.user_access_token = new_access_token
-
-            # Optionally update refresh token if a new one is provided
-            new_refresh_token = token_response.get("refresh_token")
-            if new_refresh_token:
-                self.user_refresh_token = new_refresh_token
-
-            return new_access_token
+            # Update stored access token (and refresh token if rotated)
+            return credentials.update(token_response)
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
+            if time_remaining() == 0.0:
+                # Our own shortened timeout, not a failure of the token endpoint
+                raise DeadlineExceeded(f"Deadline passed during token refresh: {e}")
             raise AuthError(f"Network error during token refresh: {str(e)}")
         except Exception as e:
             raise AuthError(f"Failed to refresh user token: {str(e)}")
 
-    def _handle_response(self, response: requests.Response) -> dict[str, Any]:
+    def _handle_response(self, response: ResponseLike) -> dict[str, Any]:
         """
         Handle API response and map errors appropriately.
 
         Args:
-            response: requests.Response object
+            response: Transport response (requests.Response or compatible)
 
         Returns:
             JSON response data as dictionary
@@ -239,111 +514,551 @@ class BaseClient:
         # Success - return parsed JSON or empty dict
         return response_data if response_data is not None else {}
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    def _request_timeout(self) -> Union[float, tuple[float, float]]:
+        """Return the requests timeout: a (connect, read) tuple if either is configured."""
+        if self.connect_timeout is None and self.read_timeout is None:
+            return self.timeout
+        return (
+            self.connect_timeout if self.connect_timeout is not None else self.timeout,
+            self.read_timeout if self.read_timeout is not None else self.timeout,
+        )
+
+    def close_idle_connections(self) -> None:
+        """Close pooled keep-alive connections if the transport supports it."""
+        close_idle = getattr(self.transport, "close_idle_connections", None)
+        if close_idle is not None:
+            close_idle()
+
+    def pool_stats(self) -> dict[str, Any]:
         """
-        Make a GET request to the API.
+        Report the transport's connection pool configuration and usage.
+
+        Returns:
+            Dictionary of pool statistics (shape depends on the transport)
+        """
+        return self.transport.pool_stats()
+
+    def close(self) -> None:
+        """Close the transport and its pooled connections, and stop the hedging threads."""
+        if self.hedge is not None:
+            self.hedge.close()
+        self.transport.close()
+
+    def warm_up(self, connections: int = 1, app_token: bool = True) -> dict[str, Any]:
+        """
+        Pay connection and token setup costs before the first real call.
+
+        Resolves the API and OAuth hosts, fetches the app token (and refreshes
+        the user token if it is missing or expired), then opens up to
+        ``connections`` pooled keep-alive connections by sending concurrent
+        unauthenticated ``GET /`` requests. Warm-up is best effort: failures
+        are reported, not raised, and the first real call will surface them.
+        Warm-up traffic bypasses metrics and hooks.
+
+        Args:
+            connections: Connections to open, capped at pool_maxsize (default: 1)
+            app_token: Fetch the application token (default: True)
+
+        Returns:
+            Dictionary with ``resolved`` addresses per host, ``app_token`` and
+            ``user_token`` flags, ``connections`` opened, ``errors`` and
+            ``elapsed`` seconds
+        """
+        started = time.perf_counter()
+        report: dict[str, Any] = {
+            "resolved": {},
+            "app_token": False,
+            "user_token": False,
+            "connections": 0,
+            "errors": [],
+        }
+
+        for url in (self.base_url, getattr(self.auth_client, "oauth_url", None)):
+            if not url:
+                continue
+            parts = urlsplit(url)
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            try:
+                addresses = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+                report["resolved"][parts.hostname] = sorted({info[4][0] for info in addresses})
+            except OSError as e:
+                report["errors"].append(f"resolve {parts.hostname}: {e}")
+
+        credentials = self._current_credentials()
+        try:
+            if credentials.needs_refresh():
+                self._refresh_user_token_if_needed(
+                    credentials, stale_token=credentials.access_token
+                )
+                report["user_token"] = True
+            if app_token:
+                self.auth_client.get_access_token()
+                report["app_token"] = True
+        except Exception as e:
+            report["errors"].append(f"token: {e}")
+
+        connections = min(connections, getattr(self.transport, "pool_maxsize", connections))
+        if connections > 0:
+            # Hold every request until all threads are ready so they overlap
+            # and each takes its own connection instead of reusing one
+            barrier = threading.Barrier(connections)
+            url = f"{self.base_url}/"
+
+            def open_connection(_: int) -> bool:
+                try:
+                    barrier.wait(timeout=self.timeout)
+                    self.transport.send("GET", url, timeout=self._request_timeout())
+                    return True
+                except Exception as e:
+                    report["errors"].append(f"connect: {e}")
+                    return False
+
+            with ThreadPoolExecutor(max_workers=connections) as executor:
+                report["connections"] = sum(executor.map(open_connection, range(connections)))
+
+        report["elapsed"] = time.perf_counter() - started
+        return report
+
+    async def warm_up_async(self, connections: int = 1, app_token: bool = True) -> dict[str, Any]:
+        """Run ``warm_up()`` in a worker thread without blocking the event loop."""
+        return await asyncio.to_thread(self.warm_up, connections, app_token)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        json: Optional[dict[str, Any]],
+        headers: dict[str, str],
+        timing: Optional[RequestTiming] = None,
+    ) -> ResponseLike:
+        """Send one HTTP request through the transport, within the active deadline."""
+        timeout = cap_timeout(self._request_timeout())
+        start = time.perf_counter()
+        response = self.transport.send(
+            method,
+            url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=timeout,
+        )
+        if timing is not None:
+            timing.on_response(response, json, time.perf_counter() - start)
+        return response
+
+    def _hedged_send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        headers: dict[str, str],
+        timing: Optional[RequestTiming],
+    ) -> ResponseLike:
+        """Send an idempotent request through the hedge policy."""
+
+        def charge() -> bool:
+            # A hedge is an extra call against the daily quota, and optional: spend at BULK level
+            if self.quota is None:
+                return True
+            try:
+                self.quota.acquire(api_family(path), Priority.BULK)
+            except QuotaExhausted:
+                return False
+            return True
+
+        def send_hedge() -> ResponseLike:
+            # The hedge is a second real call: admit it like any other, at BULK priority
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            slot = self.scheduler.acquire(Priority.BULK) if self.scheduler is not None else None
+            try:
+                return self._admitted_send(method, path, url, params, headers)
+            finally:
+                if slot is not None:
+                    self.scheduler.release(slot)
+
+        start = time.perf_counter()
+        response = self.hedge.send(
+            method,
+            path,
+            lambda: self._send(method, url, params, None, headers),
+            charge,
+            send_hedge,
+        )
+        if timing is not None:
+            timing.on_response(response, None, time.perf_counter() - start)
+        return response
+
+    def _admitted_send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        headers: dict[str, str],
+    ) -> ResponseLike:
+        """Send a hedge under a concurrency limiter slot, reporting its outcome to the limiter."""
+        limiter = self.limiter
+        if limiter is None:
+            return self._send(method, url, params, None, headers)
+        ticket = limiter.acquire()
+        status: Optional[int] = None
+        try:
+            response = self._send(method, url, params, None, headers)
+            status = response.status_code
+            return response
+        finally:
+            limiter.release(
+                ticket,
+                congested=status is not None and (status == 429 or status >= 500),
+                succeeded=status is not None and status < 400,
+                endpoint=endpoint_template(method, path),
+            )
+
+    def _timed_headers(self, timing: Optional[RequestTiming]) -> dict[str, str]:
+        start = time.perf_counter()
+        headers = self._get_headers()
+        if timing is not None:
+            timing.add("token", time.perf_counter() - start)
+        return headers
+
+    def _timed_handle_response(
+        self, response: ResponseLike, timing: Optional[RequestTiming]
+    ) -> dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return self._handle_response(response)
+        finally:
+            if timing is not None:
+                timing.add("decode", time.perf_counter() - start)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """
+        Make a request to the API, refreshing the user token once on 401.
 
         Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
             path: API endpoint path (relative to base_url)
             params: Query parameters
+            json: JSON payload
 
         Returns:
             JSON response as dictionary
 
         Raises:
+            CircuitOpenError: If the circuit breaker holds calls to this API
+            DeadlineExceeded: If the active deadline passes before the call completes
+            QuotaExhausted: If the quota ledger refuses the call
+            RateLimitExceeded: If the rate limiter would hold the call past its max_wait
             EbayAPIError: If request fails
         """
-        # Build full URL
-        url = f"{self.base_url}/{path.lstrip('/')}"
+        check_deadline(f"{method} {path}")
 
-        # Get headers
-        headers = self._get_headers()
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            # Fail fast before spending quota on an API that is down
+            circuit = breaker.circuit_key(method, path)
+            breaker.allow(circuit)
 
         try:
-            # Make GET request
-            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            # Pace before taking a scheduler slot, so sleeping callers don't hold one
+            paced = self.rate_limiter.acquire() if self.rate_limiter is not None else 0.0
+        except Exception:
+            if breaker is not None:
+                breaker.cancel(circuit)
+            raise
 
-            # Handle response and return data
-            return self._handle_response(response)
+        # Build full URL
+        url = f"{self.base_url}/{path.lstrip('/')}"
 
-        except AuthError as e:
-            # If 401 error and using user token with refresh token available, try to refresh
-            if (
-                e.status_code == 401
-                and self.user_access_token
-                and self.user_refresh_token
-            ):
-                try:
-                    # Refresh the token
-                    self._refresh_user_token_if_needed()
-                    # Retry the request with new token
-                    headers = self._get_headers()
-                    response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-                    return self._handle_response(response)
-                except Exception:
-                    # If refresh or retry fails, raise original error
-                    raise e
+        credentials = self._current_credentials()
+        metrics = self.metrics
+        timing = metrics.start(method, path) if metrics is not None else None
+        if timing is not None and paced:
+            timing.add("queue", paced)
+        hooks = self.hooks if self.hooks.enabled else None
+        event: Optional[RequestEvent] = None
+        response: Optional[ResponseLike] = None
+
+        quota = self.quota
+        scheduler = self.scheduler
+        limiter = self.limiter
+        slot: Optional[Priority] = None
+        ticket: Optional[float] = None
+        failure: Optional[Exception] = None
+        unreachable = False
+        sent = False
+
+        try:
+            # Slot waits give up at the deadline, so they sit inside the cleanup below
+            if scheduler is not None:
+                start = time.perf_counter()
+                slot = scheduler.acquire()
+                if timing is not None:
+                    timing.add("queue", time.perf_counter() - start)
+
+            if limiter is not None:
+                start = time.perf_counter()
+                ticket = limiter.acquire()
+                if timing is not None:
+                    timing.add("queue", time.perf_counter() - start)
+
+            if quota is not None:
+                # Charge once admitted, so a call that gives up in a queue costs nothing,
+                # and before building headers: no token refresh for a call that won't go out
+                family = api_family(path)
+                quota.acquire(family)
+
+            # Get headers
+            headers = self._timed_headers(timing)
+            sent_token = credentials.access_token
+            if hooks is not None:
+                event = RequestEvent(method, path, url, params, json, headers)
+                event.timing = timing
+                hooks.emit(BEFORE_REQUEST, event)
+
+            sent = True
+            try:
+                if self.hedge is not None and json is None and self.hedge.applies(method, path):
+                    response = self._hedged_send(method, path, url, params, headers, timing)
+                else:
+                    response = self._send(method, url, params, json, headers, timing)
+
+                # Handle response and return data
+                return self._timed_handle_response(response, timing)
+
+            except AuthError as e:
+                # If 401 error and using user token with refresh token available, try to refresh
+                if (
+                    e.status_code == 401
+                    and credentials.access_token
+                    and credentials.refresh_token
+                ):
+                    try:
+                        if timing is not None:
+                            timing.retries += 1
+                            metrics.record_retry("token_refresh")
+                        # Refresh the token
+                        self._refresh_user_token_if_needed(credentials, stale_token=sent_token)
+                        # Retry the request with new token
+                        headers = self._timed_headers(timing)
+                        if event is not None:
+                            event.status_code = e.status_code
+                            event.attempt += 1
+                            event.retry_reason = "token_refresh"
+                            event.headers = headers
+                            hooks.emit(ON_RETRY, event)
+                        response = self._send(method, url, params, json, headers, timing)
+                        return self._timed_handle_response(response, timing)
+                    except DeadlineExceeded:
+                        raise
+                    except Exception:
+                        # If refresh or retry fails, raise original error
+                        raise e
+                raise
+
+            except RateLimitExceeded as e:
+                if quota is not None and e.retry_after:
+                    quota.block(family, e.retry_after)
+                raise
+
+            except requests.RequestException as e:
+                if timing is not None:
+                    timing.error = type(e).__name__
+                if time_remaining() == 0.0:
+                    # Our own shortened timeout, not a sign the API is down
+                    raise DeadlineExceeded(f"Deadline passed during {method} {path}: {e}")
+                unreachable = True
+                raise EbayAPIError(f"Network error during {method} request: {str(e)}")
+        except Exception as e:
+            failure = e
+            if event is not None:
+                event.error = e
             raise
+        finally:
+            if breaker is not None:
+                if not sent or isinstance(failure, DeadlineExceeded):
+                    # Never sent, or cut short by our own deadline: says nothing about the API
+                    breaker.cancel(circuit)
+                else:
+                    breaker.record(circuit, failed=unreachable or isinstance(failure, ServerError))
+            if ticket is not None:
+                # 429s and 5xx mean eBay is pushing back; other errors say nothing about load
+                limiter.release(
+                    ticket,
+                    congested=isinstance(failure, (RateLimitExceeded, ServerError)),
+                    succeeded=failure is None,
+                    endpoint=endpoint_template(method, path),
+                )
+                if metrics is not None:
+                    metrics.set_gauge("concurrency_limit", limiter.limit)
+            if slot is not None:
+                scheduler.release(slot)
+            if event is not None:
+                self._emit_completion(event, response)
+            if timing is not None:
+                metrics.finish(timing)
+
+    def _emit_completion(self, event: RequestEvent, response: Optional[ResponseLike]) -> None:
+        """Fire after_response (if a response arrived) and on_error (if the call failed)."""
+        event.elapsed = time.perf_counter() - event.started
+        if response is not None:
+            event.response = response
+            event.status_code = response.status_code
+            self.hooks.emit(AFTER_RESPONSE, event)
+        if event.error is not None:
+            self.hooks.emit(ON_ERROR, event)
+
+    def parse(self, model: type[ModelT], data: Any) -> ModelT:
+        """
+        Validate response data into a pydantic model, timing the validation.
 
-        except requests.RequestException as e:
-            raise EbayAPIError(f"Network error during GET request: {str(e)}")
+        Args:
+            model: Pydantic model class
+            data: Response dictionary from get/post/put/delete
 
-    def post(self, path: str, json: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        Returns:
+            Model instance (validation errors propagate unchanged)
         """
-        Make a POST request to the API.
+        if self.metrics is None:
+            return model(**data)
+        start = time.perf_counter()
+        try:
+            return model(**data)
+        finally:
+            self.metrics.record_validation(model.__name__, time.perf_counter() - start)
+
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        Make a GET request to the API.
+
+        With a cache configured, successful responses under ``cache_paths``
+        are cached per request and credential scope, and served from the
+        cache until they expire. A 404 is cached for ``negative_cache_ttl``
+        and re-raised as NotFoundError on repeat calls. With a quota ledger,
+        expired entries are still served while the family's budget is low
+        or when the ledger refuses the call.
 
         Args:
             path: API endpoint path (relative to base_url)
-            json: JSON payload
+            params: Query parameters
+            cache_ttl: Seconds to cache this response (default: the client's
+                cache_ttl for paths under cache_paths, else no caching; 0
+                bypasses the cache)
+            deadline: Seconds the call may take in all, token refresh included
+                (default: the enclosing use_deadline block, if any)
 
         Returns:
             JSON response as dictionary
 
         Raises:
+            NotFoundError: If the resource does not exist (possibly from cache)
+            QuotaExhausted: If the quota ledger refuses the call and nothing is cached
+            DeadlineExceeded: If the deadline passes first
             EbayAPIError: If request fails
         """
-        # Build full URL
-        url = f"{self.base_url}/{path.lstrip('/')}"
-
-        # Get headers
-        headers = self._get_headers()
-
+        if deadline is not None:
+            with use_deadline(deadline):
+                return self.get(path, params=params, cache_ttl=cache_ttl)
+        cache = self.cache
+        if cache is None:
+            return self._request("GET", path, params=params)
+        ttl = cache_ttl
+        if ttl is None:
+            ttl = self.cache_ttl if ("/" + path.lstrip("/")).startswith(self.cache_paths) else 0
+        if ttl <= 0:
+            return self._request("GET", path, params=params)
+
+        key = self._cache_key(path, params)
+        entry = cache.get(key)
+        if entry is not None:
+            if entry["fresh_until"] > time.time():
+                return self._serve_cached(entry, stale=False)
+            if self.quota is not None and self.quota.prefer_stale(api_family(path)):
+                return self._serve_cached(entry, stale=True)
+        if self.metrics is not None:
+            self.metrics.record_cache("miss")
         try:
-            # Make POST request
-            response = self.session.post(url, json=json, headers=headers, timeout=self.timeout)
+            response_data = self._request("GET", path, params=params)
+        except NotFoundError as e:
+            negative_ttl = min(self.negative_cache_ttl, ttl)
+            if negative_ttl > 0:
+                not_found = {"message": e.message, "response_data": e.response_data}
+                self._store_cached(key, {"not_found": not_found}, negative_ttl)
+            raise
+        except QuotaExhausted:
+            if entry is not None:
+                return self._serve_cached(entry, stale=True)
+            raise
+        self._store_cached(key, {"body": response_data}, ttl)
+        return response_data
+
+    def _serve_cached(self, entry: dict[str, Any], stale: bool) -> dict[str, Any]:
+        """Return a cached response body, or re-raise a cached 404."""
+        not_found = entry.get("not_found")
+        if self.metrics is not None:
+            self.metrics.record_cache(
+                "negative_hit" if not_found is not None else "stale_hit" if stale else "hit"
+            )
+        if not_found is not None:
+            raise NotFoundError(
+                not_found["message"], status_code=404, response_data=not_found["response_data"]
+            )
+        return entry["body"]
+
+    def _store_cached(self, key: str, entry: dict[str, Any], ttl: float) -> None:
+        # Wall clock, since the entry may be read by another process
+        entry["fresh_until"] = time.time() + ttl
+        # Kept past expiry so the quota ledger can fall back to it
+        stale_ttl = self.quota.stale_ttl if self.quota is not None else 0.0
+        self.cache.set(key, entry, ttl + stale_ttl)
+
+    def _cache_key(self, path: str, params: Optional[dict[str, Any]]) -> str:
+        credentials = self._current_credentials()
+        if credentials.access_token or credentials.refresh_token:
+            scope = credentials.scope_id
+        else:
+            scope = f"app:{self.client_id}"
+        return cache_key(self.base_url, path, params, scope)
 
-            # Handle response and return data
-            return self._handle_response(response)
+    def invalidate(self, path: str) -> None:
+        """
+        Drop the cached GET of a resource, e.g. after changing it.
 
-        except AuthError as e:
-            # If 401 error and using user token with refresh token available, try to refresh
-            if (
-                e.status_code == 401
-                and self.user_access_token
-                and self.user_refresh_token
-            ):
-                try:
-                    # Refresh the token
-                    self._refresh_user_token_if_needed()
-                    # Retry the request with new token
-                    headers = self._get_headers()
-                    response = self.session.post(url, json=json, headers=headers, timeout=self.timeout)
-                    return self._handle_response(response)
-                except Exception:
-                    # If refresh or retry fails, raise original error
-                    raise e
-            raise
+        post/put/delete do this for their own path; call it for resources a
+        request changes indirectly (such as the items of a bulk update).
 
-        except requests.RequestException as e:
-            raise EbayAPIError(f"Network error during POST request: {str(e)}")
+        Args:
+            path: API endpoint path of the resource
+        """
+        if self.cache is not None:
+            self.cache.delete(self._cache_key(path, None))
 
-    def put(self, path: str, json: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    def post(
+        self, path: str, json: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
         """
-        Make a PUT request to the API.
+        Make a POST request to the API.
 
         Args:
             path: API endpoint path (relative to base_url)
             json: JSON payload
+            deadline: Seconds the call may take in all (default: the enclosing
+                use_deadline block, if any)
 
         Returns:
             JSON response as dictionary
@@ -351,48 +1066,51 @@ class BaseClient:
         Raises:
             EbayAPIError: If request fails
         """
-        # Build full URL
-        url = f"{self.base_url}/{path.lstrip('/')}"
-
-        # Get headers
-        headers = self._get_headers()
-
+        if deadline is not None:
+            with use_deadline(deadline):
+                return self.post(path, json=json)
         try:
-            # Make PUT request
-            response = self.session.put(url, json=json, headers=headers, timeout=self.timeout)
+            return self._request("POST", path, json=json)
+        finally:
+            self.invalidate(path)
 
-            # Handle response and return data
-            return self._handle_response(response)
+    def put(
+        self, path: str, json: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
+        """
+        Make a PUT request to the API.
 
-        except AuthError as e:
-            # If 401 error and using user token with refresh token available, try to refresh
-            if (
-                e.status_code == 401
-                and self.user_access_token
-                and self.user_refresh_token
-            ):
-                try:
-                    # Refresh the token
-                    self._refresh_user_token_if_needed()
-                    # Retry the request with new token
-                    headers = self._get_headers()
-                    response = self.session.put(url, json=json, headers=headers, timeout=self.timeout)
-                    return self._handle_response(response)
-                except Exception:
-                    # If refresh or retry fails, raise original error
-                    raise e
-            raise
+        Args:
+            path: API endpoint path (relative to base_url)
+            json: JSON payload
+            deadline: Seconds the call may take in all (default: the enclosing
+                use_deadline block, if any)
 
-        except requests.RequestException as e:
-            raise EbayAPIError(f"Network error during PUT request: {str(e)}")
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            EbayAPIError: If request fails
+        """
+        if deadline is not None:
+            with use_deadline(deadline):
+                return self.put(path, json=json)
+        try:
+            return self._request("PUT", path, json=json)
+        finally:
+            self.invalidate(path)
 
-    def delete(self, path: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    def delete(
+        self, path: str, params: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
         """
         Make a DELETE request to the API.
 
         Args:
             path: API endpoint path (relative to base_url)
             params: Query parameters
+            deadline: Seconds the call may take in all (default: the enclosing
+                use_deadline block, if any)
 
         Returns:
             JSON response as dictionary (may be empty for successful deletes)
@@ -400,38 +1118,111 @@ class BaseClient:
         Raises:
             EbayAPIError: If request fails
         """
-        # Build full URL
-        url = f"{self.base_url}/{path.lstrip('/')}"
+        if deadline is not None:
+            with use_deadline(deadline):
+                return self.delete(path, params=params)
+        try:
+            return self._request("DELETE", path, params=params)
+        finally:
+            self.invalidate(path)
+
+
+def _set_tokens(
+    credentials: UserCredentials,
+    token: Optional[str],
+    refresh_token: Optional[str],
+    scopes: Optional[list[str]],
+) -> None:
+    """Replace a credential's tokens; a None token reverts to application tokens."""
+    with credentials.lock:
+        credentials.access_token = token
+        credentials.expires_at = None
+        if token is None:
+            # A stored refresh token would otherwise fetch a user token on the next call
+            credentials.refresh_token = None
+        elif refresh_token is not None:
+            credentials.refresh_token = refresh_token
+        if scopes is not None:
+            credentials.scopes = scopes
 
-        # Get headers
-        headers = self._get_headers()
 
-        try:
-            # Make DELETE request
-            response = self.session.delete(url, params=params, headers=headers, timeout=self.timeout)
+class UserScopedClient:
+    """
+    View of a BaseClient that acts on behalf of one seller.
 
-            # Handle response and return data
-            return self._handle_response(response)
+    Every call runs under ``BaseClient.use_credentials()``, so thousands of
+    sellers can share one session, connection pool and app token. Attributes
+    not defined here are read from the underlying client; its methods are
+    wrapped so they too run with this seller's credentials.
+    """
 
-        except AuthError as e:
-            # If 401 error and using user token with refresh token available, try to refresh
-            if (
-                e.status_code == 401
-                and self.user_access_token
-                and self.user_refresh_token
-            ):
-                try:
-                    # Refresh the token
-                    self._refresh_user_token_if_needed()
-                    # Retry the request with new token
-                    headers = self._get_headers()
-                    response = self.session.delete(url, params=params, headers=headers, timeout=self.timeout)
-                    return self._handle_response(response)
-                except Exception:
-                    # If refresh or retry fails, raise original error
-                    raise e
-            raise
+    def __init__(self, base_client: BaseClient, credentials: UserCredentials):
+        """
+        Initialize user-scoped view.
 
-        except requests.RequestException as e:
-            raise EbayAPIError(f"Network error during DELETE request: {str(e)}")
+        Args:
+            base_client: Shared BaseClient that owns the transport
+            credentials: Seller credentials used for every call
+        """
+        self._base_client = base_client
+        self.credentials = credentials
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._base_client, name)
+        if not inspect.ismethod(value):
+            return value
+
+        @functools.wraps(value)
+        def as_seller(*args: Any, **kwargs: Any) -> Any:
+            with self._base_client.use_credentials(self.credentials):
+                return value(*args, **kwargs)
+
+        return as_seller
+
+    def set_user_access_token(
+        self,
+        token: Optional[str],
+        refresh_token: Optional[str] = None,
+        scopes: Optional[list[str]] = None,
+    ) -> None:
+        """Replace this seller's tokens without touching the shared client."""
+        _set_tokens(self.credentials, token, refresh_token, scopes)
+
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Make a GET request as this seller."""
+        with self._base_client.use_credentials(self.credentials):
+            return self._base_client.get(
+                path, params=params, cache_ttl=cache_ttl, deadline=deadline
+            )
 
+    def invalidate(self, path: str) -> None:
+        """Drop this seller's cached GET of a resource."""
+        with self._base_client.use_credentials(self.credentials):
+            self._base_client.invalidate(path)
+
+    def post(
+        self, path: str, json: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Make a POST request as this seller."""
+        with self._base_client.use_credentials(self.credentials):
+            return self._base_client.post(path, json=json, deadline=deadline)
+
+    def put(
+        self, path: str, json: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Make a PUT request as this seller."""
+        with self._base_client.use_credentials(self.credentials):
+            return self._base_client.put(path, json=json, deadline=deadline)
+
+    def delete(
+        self, path: str, params: Optional[dict[str, Any]] = None, deadline: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Make a DELETE request as this seller."""
+        with self._base_client.use_credentials(self.credentials):
+            return self._base_client.delete(path, params=params, deadline=deadline)
@@ -1,6 +1,12 @@
 """Browse API module for searching and retrieving item information."""
 
-from ebay_rest.browse.client import BrowseClient
+from typing import TYPE_CHECKING
+
+from ebay_rest._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ebay_rest.browse.client import BrowseClient
 
 __all__ = ["BrowseClient"]
 
+__getattr__, __dir__ = lazy_exports(__name__, {"BrowseClient": "ebay_rest.browse.client"})
@@ -84,7 +84,7 @@ class BrowseClient:
         # Parse response into SearchResponse model
         # Handle both camelCase (eBay API) and snake_case (our models)
         try:
-            search_response = SearchResponse(**response_data)
+            search_response = self.base_client.parse(SearchResponse, response_data)
             # Convert back to dict for flexibility, but with parsed items
             return {
                 "items": [item.model_dump() for item in search_response.items],
@@ -130,7 +130,7 @@ class BrowseClient:
 
         # Parse response into Item model
         try:
-            item = Item(**response_data)
+            item = self.base_client.parse(Item, response_data)
             # Convert back to dict for flexibility
             return item.model_dump()
         except Exception:
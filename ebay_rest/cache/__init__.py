@@ -0,0 +1,26 @@
+"""Response caches for BaseClient GET requests."""
+
+from typing import TYPE_CHECKING
+
+from ebay_rest._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ebay_rest.cache.base import CacheBackend, CacheEntry
+    from ebay_rest.cache.keys import cache_key
+    from ebay_rest.cache.memory import MemoryCache
+    from ebay_rest.cache.sqlite import SQLiteCache
+    from ebay_rest.cache.tiered import TieredCache
+
+__all__ = ["CacheBackend", "CacheEntry", "MemoryCache", "SQLiteCache", "TieredCache", "cache_key"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CacheBackend": "ebay_rest.cache.base",
+        "CacheEntry": "ebay_rest.cache.base",
+        "MemoryCache": "ebay_rest.cache.memory",
+        "SQLiteCache": "ebay_rest.cache.sqlite",
+        "TieredCache": "ebay_rest.cache.tiered",
+        "cache_key": "ebay_rest.cache.keys",
+    },
+)
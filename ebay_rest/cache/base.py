@@ -0,0 +1,34 @@
+"""Cache backend interface."""
+
+from typing import Any, Iterable, NamedTuple, Optional, Protocol, runtime_checkable
+
+
+class CacheEntry(NamedTuple):
+    """A cached value and the seconds it has left to live."""
+
+    value: Any
+    ttl: float
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Stores decoded GET responses by key, each with its own time to live.
+
+    Implementations must be safe to call from many threads at once and treat
+    their own failures as misses: a cache may make calls faster but must
+    never make them fail. Anything with these four methods (a Redis or
+    memcached wrapper, say) can be passed as ``BaseClient(cache=...)``.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        ...
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
@@ -0,0 +1,27 @@
+"""Cache key normalization."""
+
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+
+def cache_key(base_url: str, path: str, params: Optional[Mapping[str, Any]], scope: str) -> str:
+    """
+    Build a stable cache key for a GET request.
+
+    Params are sorted and ``None`` values dropped, so equivalent requests share
+    a key regardless of argument order. ``scope`` keeps responses fetched with
+    one seller's token (or one app's token) from being served to another.
+
+    Args:
+        base_url: API root, so sandbox and production never collide
+        path: Request path
+        params: Query parameters
+        scope: Credential scope, e.g. ``UserCredentials.scope_id``
+
+    Returns:
+        Hex digest key
+    """
+    normalized = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    material = json.dumps([base_url.rstrip("/"), "/" + path.lstrip("/"), normalized, scope])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
@@ -0,0 +1,109 @@
+"""In-process LRU response cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from ebay_rest.cache.base import CacheEntry
+
+
+class MemoryCache:
+    """
+    Least-recently-used cache held in this process's memory.
+
+    Lookups cost a dictionary access under a lock, with no serialization, so
+    this is the fastest backend and the natural L1 of a TieredCache. Cached
+    values are returned as-is rather than copied: treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize memory cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is dropped
+                (default: 1024)
+            clock: Monotonic clock for expiry
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key (see cache_key)
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._lookup(key, self._clock())
+        return None if entry is None else entry.value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Live entries by key; missing and expired keys are omitted
+        """
+        now = self._clock()
+        found = {}
+        for key in keys:
+            entry = self._lookup(key, now)
+            if entry is not None:
+                found[key] = entry
+        return found
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value for ``ttl`` seconds, evicting the least recently used
+        entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Decoded response data
+            ttl: Seconds until the entry expires
+        """
+        if ttl <= 0:
+            return
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: str, now: float) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return CacheEntry(value, expires_at - now)
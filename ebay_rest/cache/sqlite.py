@@ -0,0 +1,235 @@
+"""SQLite-backed response cache shared by every process on a host."""
+
+import itertools
+import json
+import sqlite3
+import time
+import zlib
+from typing import Any, Callable, Iterable, Optional
+
+from ebay_rest._sqlite import ConnectionPerThread, write_transaction
+from ebay_rest.cache.base import CacheEntry
+from ebay_rest.utils import logger
+
+# Stay well under SQLite's limit on bound parameters per statement
+_MAX_BATCH = 500
+
+
+class SQLiteCache:
+    """
+    Disk cache for decoded GET responses, safe across threads and processes.
+
+    The database runs in WAL mode so readers never block each other or the
+    writer, and concurrent writers wait on SQLite's busy timeout instead of
+    failing. Values are stored as zlib-compressed JSON with an absolute expiry.
+    Reads only write to drop an entry that cannot be decoded; when the file
+    grows past ``max_bytes`` the entries closest to expiry are evicted
+    (expired ones first).
+
+    Cache errors (a locked or full disk, a corrupt entry) are logged and
+    treated as misses, so the cache can only make calls faster, never fail
+    them. The file may hold seller data and is created with owner-only
+    permissions.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        compress_level: int = 6,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize SQLite cache.
+
+        Args:
+            path: Database file path (created if missing)
+            max_bytes: Approximate limit on stored payload bytes (default: 256 MiB)
+            compress_level: zlib level for payloads, 0-9 (default: 6)
+            busy_timeout: Seconds a writer waits for the lock (default: 5)
+            clock: Wall clock for expiry; shared across processes, so not monotonic
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._connections = ConnectionPerThread(path, busy_timeout)
+        self._writes = itertools.count(1)
+        # Checking the total size is a table scan, so only do it every few writes
+        self._evict_every = 64
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key (see cache_key)
+
+        Returns:
+            Decoded JSON value or None
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        try:
+            return _decode(row[0])
+        except (zlib.error, ValueError) as e:
+            self._drop_corrupt(key, e)
+            return None
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """
+        Look up several keys with one query per 500 keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Live entries by key; missing and expired keys are omitted
+        """
+        keys = list(keys)
+        now = self._clock()
+        found = {}
+        corrupt = []
+        try:
+            conn = self._connect()
+            for start in range(0, len(keys), _MAX_BATCH):
+                batch = keys[start:start + _MAX_BATCH]
+                rows = conn.execute(
+                    f"SELECT key, value, expires_at FROM responses "
+                    f"WHERE key IN ({', '.join('?' * len(batch))}) AND expires_at > ?",
+                    (*batch, now),
+                )
+                for key, blob, expires_at in rows:
+                    try:
+                        found[key] = CacheEntry(_decode(blob), expires_at - now)
+                    except (zlib.error, ValueError) as e:
+                        corrupt.append((key, e))
+        except sqlite3.Error as e:
+            logger.warning("Response cache read failed: %s", e)
+        for key, error in corrupt:
+            self._drop_corrupt(key, error)
+        return found
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a JSON-serializable value for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Decoded response data
+            ttl: Seconds until the entry expires
+        """
+        if ttl <= 0:
+            return
+        blob = zlib.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8"), self.compress_level
+        )
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, size) "
+                "VALUES (?, ?, ?, ?)",
+                (key, blob, self._clock() + ttl, len(blob)),
+            )
+            if next(self._writes) % self._evict_every == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        try:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning("Response cache delete failed: %s", e)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        try:
+            self._connect().execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            logger.warning("Response cache clear failed: %s", e)
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then the entries closest to expiry until the
+        stored payloads fit in ``max_bytes``.
+
+        Returns:
+            Number of entries removed
+        """
+        with write_transaction(self._connect()) as conn:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                # Free down to 90% so the next few writes do not evict again
+                excess = total - int(self.max_bytes * 0.9)
+                freed = 0
+                victims = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM responses ORDER BY expires_at"
+                ):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                removed += len(victims)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """
+        Report entry count and stored payload bytes.
+
+        Returns:
+            Dictionary with ``entries`` and ``bytes`` (zeros if the database
+            cannot be read)
+        """
+        try:
+            entries, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Response cache stats failed: %s", e)
+            return {"entries": 0, "bytes": 0}
+        return {"entries": entries, "bytes": size}
+
+    def close(self) -> None:
+        """Close this process's connections."""
+        self._connections.close()
+
+    def _drop_corrupt(self, key: str, error: Exception) -> None:
+        logger.warning("Dropping unreadable response cache entry: %s", error)
+        self.delete(key)
+
+
+def _decode(blob: bytes) -> Any:
+    # JSONDecodeError and UnicodeDecodeError are both ValueErrors
+    return json.loads(zlib.decompress(blob))
@@ -0,0 +1,94 @@
+"""Two-level response cache."""
+
+from typing import Any, Iterable, Optional
+
+from ebay_rest.cache.base import CacheBackend, CacheEntry
+
+
+class TieredCache:
+    """
+    A fast local cache (L1) in front of a larger shared one (L2).
+
+    Reads try L1 first; an L2 hit is copied into L1 for the rest of its
+    lifetime, capped at ``l1_ttl``. Writes and deletes go to both levels.
+
+    With a MemoryCache over a SQLiteCache, each worker answers repeat reads
+    from memory and shares everything else through the file. A write in one
+    process only clears that process's L1, so ``l1_ttl`` bounds how long
+    other workers can keep serving the old copy.
+
+    ::
+
+        cache = TieredCache(MemoryCache(max_entries=2048), SQLiteCache("/var/tmp/ebay.db"))
+    """
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend, l1_ttl: Optional[float] = 30.0):
+        """
+        Initialize tiered cache.
+
+        Args:
+            l1: Fast, usually per-process cache
+            l2: Shared cache consulted on L1 misses
+            l1_ttl: Longest an entry lives in L1 (default: 30s; None for no cap)
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+
+    def _l1_ttl(self, ttl: float) -> float:
+        return ttl if self.l1_ttl is None else min(ttl, self.l1_ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value from L1, else from L2 (promoting it), else None.
+
+        Args:
+            key: Cache key (see cache_key)
+
+        Returns:
+            Cached value or None
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+        entry = self.l2.get_many([key]).get(key)
+        if entry is None:
+            return None
+        self.l1.set(key, entry.value, self._l1_ttl(entry.ttl))
+        return entry.value
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """
+        Look up several keys, asking L2 only for the ones L1 does not have.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Live entries by key; missing keys are omitted
+        """
+        keys = list(keys)
+        found = self.l1.get_many(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            for key, entry in self.l2.get_many(missing).items():
+                self.l1.set(key, entry.value, self._l1_ttl(entry.ttl))
+                found[key] = entry
+        return found
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value in both levels.
+
+        Args:
+            key: Cache key
+            value: Decoded response data
+            ttl: Seconds until the entry expires (capped at ``l1_ttl`` in L1)
+        """
+        self.l2.set(key, value, ttl)
+        self.l1.set(key, value, self._l1_ttl(ttl))
+
+    def delete(self, key: str) -> None:
+        """Remove a key from both levels."""
+        self.l2.delete(key)
+        self.l1.delete(key)
@@ -0,0 +1,195 @@
+"""Circuit breakers that fail calls to a broken API fast."""
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from ebay_rest.errors import CircuitOpenError
+from ebay_rest.metrics import api_family, endpoint_template
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "trips")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.trips = 0
+
+
+class CircuitBreaker:
+    """
+    Stops calling an API family (or endpoint) that keeps failing, while others carry on.
+
+    Each key has its own circuit:
+
+    - ``closed``: calls go out; ``failure_threshold`` consecutive 5xx responses
+      or network errors (timeouts included) open it,
+    - ``open``: calls fail at once with CircuitOpenError, without a request,
+      for ``reset_timeout`` seconds,
+    - ``half_open``: up to ``half_open_max_calls`` trial calls go out; one
+      success closes the circuit, one failure opens it again.
+
+    Any answer other than a 5xx (a 404, a 429, a validation error) counts as
+    success: the API is up, even if the call was wrong.
+
+    ::
+
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        client = EbayClient(client_id, client_secret, circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        key: str = "family",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (default: 5)
+            reset_timeout: Seconds a circuit stays open before trial calls (default: 30)
+            half_open_max_calls: Trial calls allowed at once while half-open (default: 1)
+            key: ``"family"`` for one circuit per API family (``sell.fulfillment``)
+                or ``"endpoint"`` for one per path template
+                (``GET /sell/fulfillment/v1/order/{id}``) (default: "family")
+            clock: Monotonic clock
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be >= 1")
+        if key not in ("family", "endpoint"):
+            raise ValueError('key must be "family" or "endpoint"')
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.key = key
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def circuit_key(self, method: str, path: str) -> str:
+        """Return the circuit a call belongs to."""
+        if self.key == "endpoint":
+            return endpoint_template(method, path)
+        return api_family(path)
+
+    def allow(self, key: str) -> None:
+        """
+        Let a call through, or refuse it.
+
+        Every allowed call must be followed by record(), or cancel() if it is
+        not sent after all.
+
+        Args:
+            key: Circuit key (see circuit_key)
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial calls already out
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - self._clock()
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"{key} is failing; calls held for {remaining:.1f}s",
+                        key=key,
+                        retry_after=math.ceil(remaining),
+                    )
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenError(f"{key} is failing; a trial call is in progress", key=key)
+            circuit.probes += 1
+
+    def record(self, key: str, failed: bool) -> None:
+        """
+        Report how an allowed call ended.
+
+        Args:
+            key: Circuit key
+            failed: The call got a 5xx or no answer at all
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[key] = _Circuit()
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+                if failed:
+                    self._open(circuit)
+                else:
+                    circuit.state = CLOSED
+                    circuit.failures = 0
+            elif circuit.state == CLOSED:
+                circuit.failures = circuit.failures + 1 if failed else 0
+                if circuit.failures >= self.failure_threshold:
+                    self._open(circuit)
+            # Calls sent before the circuit opened change nothing while it is open
+
+    def cancel(self, key: str) -> None:
+        """Hand back the trial slot of an allowed call that was never sent."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+    def state(self, key: str) -> str:
+        """Return a circuit's state: ``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return CLOSED if circuit is None else self._state(circuit, self._clock())
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close one circuit, or all of them."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        """
+        Report every circuit that has seen a failure.
+
+        Returns:
+            Per key: ``state``, consecutive ``failures`` and ``trips`` (times opened)
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                key: {
+                    "state": self._state(circuit, now),
+                    "failures": circuit.failures,
+                    "trips": circuit.trips,
+                }
+                for key, circuit in self._circuits.items()
+            }
+
+    def _state(self, circuit: _Circuit, now: float) -> str:
+        if circuit.state == OPEN and now >= circuit.opened_at + self.reset_timeout:
+            return HALF_OPEN
+        return circuit.state
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.failures = 0
+        circuit.probes = 0
+        circuit.trips += 1
@@ -1,11 +1,22 @@
 """Main client class for eBay REST API SDK."""
 
-from ebay_rest.account.client import AccountClient
+import asyncio
+import copy
+import importlib
+import time
+from typing import TYPE_CHECKING, Any
+
 from ebay_rest.auth import OAuth2Client
 from ebay_rest.base_client import BaseClient
-from ebay_rest.browse.client import BrowseClient
-from ebay_rest.inventory.client import InventoryClient
-from ebay_rest.orders.client import OrdersClient
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.snapshot import SNAPSHOT_VERSION, read_snapshot, write_snapshot
+
+if TYPE_CHECKING:
+    from ebay_rest.account.client import AccountClient
+    from ebay_rest.browse.client import BrowseClient
+    from ebay_rest.inventory.client import InventoryClient
+    from ebay_rest.orders.client import OrdersClient
+    from ebay_rest.token_vault import TokenVault
 
 
 class EbayClient:
@@ -13,6 +24,7 @@ class EbayClient:
     Main client for eBay REST API.
 
     Provides access to all eBay API modules: Browse, Inventory, Orders, and Account.
+    Each module client (and its models) is imported and built on first access.
     """
 
     def __init__(
@@ -23,6 +35,9 @@ class EbayClient:
         user_access_token: str | None = None,
         user_refresh_token: str | None = None,
         user_token_scopes: list[str] | None = None,
+        token_vault: "TokenVault | None" = None,
+        base_url: str | None = None,
+        **base_client_options: Any,
     ):
         """
         Initialize eBay client.
@@ -35,24 +50,34 @@ class EbayClient:
             user_refresh_token: Optional refresh token for automatic token refresh
             user_token_scopes: Optional list of OAuth scopes for token refresh.
                 Defaults to common Sell API scopes if not provided.
+            token_vault: Optional TokenVault holding tokens for many sellers (see as_seller)
+            base_url: Optional API root overriding the environment's, e.g. a local
+                FakeEbayServer; OAuth tokens are then requested from it too
+            **base_client_options: Extra BaseClient settings such as pool_maxsize,
+                pool_block, max_idle_time, connect_timeout and read_timeout
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.sandbox = sandbox
+        self.token_vault = token_vault
+
+        token_url = None
+        if base_url:
+            base_url = base_url.rstrip("/")
+            token_url = f"{base_url}/identity/v1/oauth2/token"
+            base_client_options["token_url"] = token_url
 
         # Initialize OAuth2 client
         self.auth = OAuth2Client(
             client_id=client_id,
             client_secret=client_secret,
             sandbox=sandbox,
+            oauth_url=token_url,
         )
 
-        # TODO: Set base URLs based on sandbox flag
-        # Production: https://api.ebay.com
-        # Sandbox: https://api.sandbox.ebay.com
-
         # Initialize base HTTP client
-        base_url = "https://api.sandbox.ebay.com" if sandbox else "https://api.ebay.com"
+        if not base_url:
+            base_url = "https://api.sandbox.ebay.com" if sandbox else "https://api.ebay.com"
         self.base_client = BaseClient(
             auth_client=self.auth,
             base_url=base_url,
@@ -62,13 +87,82 @@ class EbayClient:
             user_token_scopes=user_token_scopes,
             client_id=client_id,
             client_secret=client_secret,
+            **base_client_options,
         )
 
         # Initialize API module clients
-        self.browse = BrowseClient(base_client=self.base_client, sandbox=sandbox)
-        self.inventory = InventoryClient(base_client=self.base_client, sandbox=sandbox)
-        self.orders = OrdersClient(base_client=self.base_client, sandbox=sandbox)
-        self.account = AccountClient(base_client=self.base_client, sandbox=sandbox)
+        self._init_api_clients()
+
+    def _init_api_clients(self) -> None:
+        # Module clients built so far, by attribute name
+        self._api_clients: dict[str, Any] = {}
+
+    def _api_client(self, name: str, module: str, class_name: str) -> Any:
+        client = self._api_clients.get(name)
+        if client is None:
+            client_class = getattr(importlib.import_module(module), class_name)
+            # setdefault keeps the first instance if two threads race here
+            client = self._api_clients.setdefault(
+                name, client_class(base_client=self.base_client, sandbox=self.sandbox)
+            )
+        return client
+
+    @property
+    def browse(self) -> "BrowseClient":
+        """Browse API client."""
+        return self._api_client("browse", "ebay_rest.browse.client", "BrowseClient")
+
+    @property
+    def inventory(self) -> "InventoryClient":
+        """Inventory API client."""
+        return self._api_client("inventory", "ebay_rest.inventory.client", "InventoryClient")
+
+    @property
+    def orders(self) -> "OrdersClient":
+        """Orders API client."""
+        return self._api_client("orders", "ebay_rest.orders.client", "OrdersClient")
+
+    @property
+    def account(self) -> "AccountClient":
+        """Account API client."""
+        return self._api_client("account", "ebay_rest.account.client", "AccountClient")
+
+    def as_user(self, credentials: UserCredentials | str) -> "EbayClient":
+        """
+        Return a view of this client that acts on behalf of one seller.
+
+        The view shares the session, connection pool and app token with this
+        client; only the user token and its refresh state are per seller, so
+        serving many sellers does not multiply connections.
+
+        Args:
+            credentials: UserCredentials for the seller, or a bare access token
+
+        Returns:
+            EbayClient whose API modules use the given credentials
+        """
+        view = copy.copy(self)
+        view.base_client = self.base_client.as_user(credentials)
+        view._init_api_clients()
+        return view
+
+    def as_seller(self, seller_id: str) -> "EbayClient":
+        """
+        Return a view of this client acting for a seller stored in the token vault.
+
+        Args:
+            seller_id: Seller identifier used when the tokens were added to the vault
+
+        Returns:
+            EbayClient whose API modules use the seller's credentials
+
+        Raises:
+            ValueError: If the client was created without a token_vault
+            AuthError: If the vault has no tokens for the seller
+        """
+        if self.token_vault is None:
+            raise ValueError("as_seller() requires EbayClient(token_vault=...)")
+        return self.as_user(self.token_vault.get(seller_id))
 
     def set_user_access_token(
         self,
@@ -81,12 +175,153 @@ class EbayClient:
 
         Pass a user token obtained via the Authorization Code flow to call
         seller endpoints (inventory, orders, account). Pass None to revert
-        to application (client-credentials) tokens.
+        to application (client-credentials) tokens. This changes the token for
+        every caller of this client; use ``as_user()`` to serve several sellers.
 
         Args:
             token: User access token string or None to revert to client credentials
+                (this also drops the stored refresh token)
             refresh_token: Optional refresh token for automatic token refresh
             scopes: Optional list of OAuth scopes for token refresh
         """
         self.base_client.set_user_access_token(token, refresh_token=refresh_token, scopes=scopes)
 
+    def warm_up(
+        self, connections: int = 1, app_token: bool = True, account_profile: bool = False
+    ) -> dict[str, Any]:
+        """
+        Open connections and fetch tokens before the first user-facing call.
+
+        Args:
+            connections: Pooled connections to open (default: 1)
+            app_token: Fetch the application token (default: True)
+            account_profile: Also load the cached account profile (Sell API user token required)
+
+        Returns:
+            BaseClient.warm_up() report, plus an ``account_profile`` flag
+        """
+        report = self.base_client.warm_up(connections=connections, app_token=app_token)
+        report["account_profile"] = False
+        if account_profile:
+            try:
+                self.account.get_profile_cache().get_profile()
+                report["account_profile"] = True
+            except Exception as e:
+                report["errors"].append(f"account_profile: {e}")
+        return report
+
+    async def warm_up_async(
+        self, connections: int = 1, app_token: bool = True, account_profile: bool = False
+    ) -> dict[str, Any]:
+        """Run ``warm_up()`` in a worker thread without blocking the event loop."""
+        return await asyncio.to_thread(self.warm_up, connections, app_token, account_profile)
+
+    def snapshot(self, path: str | None = None) -> dict[str, Any]:
+        """
+        Capture reusable state so a later process can start warm.
+
+        The snapshot holds the unexpired app token, the unexpired user access
+        token (never the refresh token) and the fresh cached account profile,
+        each with its expiry or age, plus the adaptive limiter's learned limit
+        and the token bucket's level when the client has them. The response
+        cache is not included; an in-memory cache starts cold, and a
+        ``SQLiteCache`` file already outlives the process. A
+        ``SharedTokenBucket`` keeps its level in its own file.
+
+        Args:
+            path: Optional file to write as gzipped JSON (created ``0600``)
+
+        Returns:
+            The snapshot dictionary
+        """
+        state: dict[str, Any] = {
+            "version": SNAPSHOT_VERSION,
+            "created_at": time.time(),
+            "client_id": self.client_id,
+            "base_url": self.base_client.base_url,
+        }
+        app_token = self.auth.export_state()
+        if app_token is not None:
+            state["app_token"] = app_token
+
+        credentials = self.base_client.credentials
+        with credentials.lock:
+            if credentials.access_token and not credentials.is_expired():
+                state["user_token"] = {
+                    "access_token": credentials.access_token,
+                    "expires_at": credentials.expires_at,
+                    "scope_id": credentials.scope_id,
+                }
+
+        account = self._api_clients.get("account")
+        if account is not None and account._profile_cache is not None:
+            profile = account._profile_cache.export_state()
+            if profile is not None:
+                state["account_profile"] = profile
+
+        for name in ("limiter", "rate_limiter"):
+            export_state = getattr(getattr(self.base_client, name), "export_state", None)
+            if export_state is not None:
+                state[name] = export_state()
+
+        if path is not None:
+            write_snapshot(path, state)
+        return state
+
+    def restore(self, source: str | dict[str, Any]) -> list[str]:
+        """
+        Load state captured by ``snapshot()``, typically right after construction.
+
+        Anything expired by now is skipped, as is a snapshot taken for another
+        application, environment or seller. A missing or unreadable file just
+        means a cold start.
+
+        Args:
+            source: Snapshot file path or dictionary
+
+        Returns:
+            Names of the restored parts (``app_token``, ``user_token``,
+            ``account_profile``, ``limiter``, ``rate_limiter``)
+        """
+        state = read_snapshot(source) if isinstance(source, str) else source
+        if not state:
+            return []
+        if (
+            state.get("client_id") != self.client_id
+            or state.get("base_url") != self.base_client.base_url
+        ):
+            return []
+
+        restored = []
+        if "app_token" in state and self.auth.restore_state(state["app_token"]):
+            restored.append("app_token")
+
+        user_token = state.get("user_token")
+        credentials = self.base_client.credentials
+        if user_token:
+            with credentials.lock:
+                has_tokens = credentials.access_token or credentials.refresh_token
+                if not has_tokens or credentials.scope_id == user_token.get("scope_id"):
+                    expires_at = user_token.get("expires_at")
+                    if expires_at is None or time.time() < expires_at - 60:
+                        credentials.access_token = user_token["access_token"]
+                        credentials.expires_at = expires_at
+                        restored.append("user_token")
+
+        profile = state.get("account_profile")
+        if profile:
+            cache = self.account.get_profile_cache(ttl=profile.get("ttl", 300.0))
+            if cache.restore_state(profile, elapsed=time.time() - state.get("created_at", 0.0)):
+                restored.append("account_profile")
+
+        limiter = self.base_client.limiter
+        if state.get("limiter") and hasattr(limiter, "restore_state"):
+            if limiter.restore_state(state["limiter"]):
+                restored.append("limiter")
+
+        rate_limiter = self.base_client.rate_limiter
+        if state.get("rate_limiter") and hasattr(rate_limiter, "restore_state"):
+            elapsed = time.time() - state.get("created_at", 0.0)
+            if rate_limiter.restore_state(state["rate_limiter"], elapsed=elapsed):
+                restored.append("rate_limiter")
+        return restored
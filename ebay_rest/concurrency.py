@@ -0,0 +1,257 @@
+"""Adaptive concurrency limiting and concurrent fan-out helpers."""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from ebay_rest.deadline import time_remaining
+from ebay_rest.errors import DeadlineExceeded
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Baseline:
+    __slots__ = ("baseline", "slow_streak")
+
+    def __init__(self, latency: float):
+        self.baseline = latency
+        self.slow_streak = 0
+
+
+class AdaptiveLimiter:
+    """
+    Caps requests in flight at a limit that tracks what eBay will currently accept (AIMD).
+
+    While calls succeed at healthy latency and the limit is actually in use,
+    the limit grows by one per round of ``limit`` successes (additive
+    increase). A throttle (429), a server error, or ``slow_samples`` calls in
+    a row to one endpoint slower than ``latency_tolerance`` times that
+    endpoint's baseline cut it by ``backoff`` (multiplicative decrease).
+    Baselines are kept per endpoint, so slow endpoints do not make fast ones
+    look congested, and a single tail-latency outlier is not a signal.
+    Failures of calls sent before the last cut are ignored, so one burst of
+    errors cuts the limit once, not once per request. Callers beyond the
+    limit wait.
+
+    ::
+
+        limiter = AdaptiveLimiter(initial_limit=8, max_limit=64)
+        client = EbayClient(client_id, client_secret, pool_maxsize=64, limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        smoothing: float = 0.05,
+        slow_samples: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize adaptive limiter.
+
+        Args:
+            initial_limit: Starting limit (default: 4)
+            min_limit: Floor for the limit (default: 1)
+            max_limit: Ceiling for the limit; keep it at most the pool size (default: 64)
+            backoff: Factor applied to the limit on congestion (default: 0.5)
+            latency_tolerance: Latency, as a multiple of the baseline, treated as
+                congestion; None to react to errors only (default: 2.0)
+            smoothing: Weight of each new sample in the latency baseline (default: 0.05)
+            slow_samples: Consecutive slow calls to one endpoint treated as
+                congestion (default: 3)
+            clock: Monotonic clock
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("need 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be between 0 and 1")
+        if slow_samples < 1:
+            raise ValueError("slow_samples must be >= 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.slow_samples = slow_samples
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latencies: dict[str, _Baseline] = {}
+        self._last_decrease = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may start.
+
+        Returns:
+            Start time to pass to release()
+
+        Raises:
+            DeadlineExceeded: If the active deadline passes before a slot is free
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                left = time_remaining()
+                if left is not None and left <= 0:
+                    raise DeadlineExceeded("Deadline passed waiting for a concurrency slot")
+                self._condition.wait(left)
+            self._in_flight += 1
+        return self._clock()
+
+    def release(
+        self,
+        started: float,
+        congested: bool = False,
+        succeeded: bool = True,
+        endpoint: str = "",
+    ) -> None:
+        """
+        Report how a request ended and free its slot.
+
+        Args:
+            started: Value returned by acquire()
+            congested: eBay pushed back (429 or 5xx)
+            succeeded: The call returned a response worth learning from; False
+                for errors that say nothing about load (e.g. 404, bad input)
+            endpoint: Endpoint the call went to, for its latency baseline
+                (e.g. ``metrics.endpoint_template(method, path)``)
+        """
+        now = self._clock()
+        latency = now - started
+        with self._condition:
+            saturated = self._in_flight * 2 >= self._limit
+            self._in_flight -= 1
+            if not congested and succeeded:
+                congested = self._observe(endpoint, latency)
+            if congested:
+                if started >= self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_decrease = now
+                    self._decreases += 1
+            elif succeeded and saturated and self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                self._increases += 1
+            self._condition.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report limiter state.
+
+        Returns:
+            Dictionary with ``limit``, ``in_flight``, ``baseline_latency`` per
+            endpoint, ``increases`` and ``decreases``
+        """
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "baseline_latency": {
+                    endpoint: latencies.baseline for endpoint, latencies in self._latencies.items()
+                },
+                "increases": self._increases,
+                "decreases": self._decreases,
+            }
+
+    def export_state(self) -> dict[str, Any]:
+        """
+        Return the learned limit for a warm-start snapshot.
+
+        Returns:
+            Dictionary with the current ``limit``
+        """
+        with self._condition:
+            return {"limit": self._limit}
+
+    def restore_state(self, state: dict[str, Any]) -> bool:
+        """
+        Start from a limit exported by ``export_state()``, kept within min_limit and max_limit.
+
+        Args:
+            state: Output of export_state()
+
+        Returns:
+            True if the limit was adopted
+        """
+        limit = state.get("limit")
+        if not isinstance(limit, (int, float)):
+            return False
+        with self._condition:
+            self._limit = min(float(self.max_limit), max(float(self.min_limit), float(limit)))
+            self._condition.notify_all()
+        return True
+
+    def _observe(self, endpoint: str, latency: float) -> bool:
+        """Fold a latency into the endpoint's baseline; return True once it is persistently slow."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            self._latencies[endpoint] = _Baseline(latency)
+            return False
+        slow = (
+            self.latency_tolerance is not None
+            and latency > latencies.baseline * self.latency_tolerance
+        )
+        latencies.slow_streak = latencies.slow_streak + 1 if slow else 0
+        latencies.baseline += self.smoothing * (latency - latencies.baseline)
+        if latencies.slow_streak < self.slow_samples:
+            return False
+        latencies.slow_streak = 0
+        return True
+
+
+def fan_out(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 16,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Call ``func`` on every item from a thread pool and return results in input order.
+
+    Pair it with ``BaseClient(limiter=...)``: the limiter decides how many of
+    the workers' requests are in flight, so ``max_workers`` only needs to
+    match its ``max_limit``. Each worker inherits the caller's context, so
+    ``use_priority`` and ``use_credentials`` blocks apply to the calls.
+
+    ::
+
+        items = fan_out(client.browse.get_item, item_ids, max_workers=64)
+
+    Args:
+        func: Function taking one item
+        items: Inputs
+        max_workers: Threads (default: 16)
+        return_exceptions: Put exceptions in the results instead of raising the
+            first one after all calls finish (default: False)
+
+    Returns:
+        Results (or exceptions) in the order of ``items``
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # One context copy per call: a Context cannot be entered by two threads at once
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+    results: list[Any] = []
+    for future in futures:
+        error = future.exception()
+        if error is not None and not return_exceptions:
+            raise error
+        results.append(error if error is not None else future.result())
+    return results
+
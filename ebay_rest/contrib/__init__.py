@@ -0,0 +1 @@
+"""Integrations with third-party observability tools, built on ebay_rest.hooks."""
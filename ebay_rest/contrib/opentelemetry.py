@@ -0,0 +1,138 @@
+"""OpenTelemetry tracing for BaseClient requests (requires opentelemetry-api)."""
+
+import time
+from typing import Any, Optional
+
+from ebay_rest.hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    ON_ERROR,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    HookRegistry,
+    RequestEvent,
+    TokenRefreshEvent,
+)
+from ebay_rest.metrics import endpoint_template
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.propagate import inject
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    trace = None
+
+_SPAN = "otel_span"
+
+
+class OpenTelemetryHooks:
+    """
+    Trace every eBay API call as a CLIENT span.
+
+    ::
+
+        OpenTelemetryHooks().install(client.base_client.hooks)
+
+    Spans are named after the endpoint with IDs collapsed
+    (``GET /buy/browse/v1/item/{id}``), carry the HTTP semantic-convention
+    attributes, record retries as span events and end with an error status if
+    the call raises. Token refreshes get their own span. The trace context is
+    injected into the request headers so eBay-side logs can be correlated.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None, propagate: bool = True):
+        """
+        Initialize OpenTelemetry hooks.
+
+        Args:
+            tracer: Tracer to use (default: ``trace.get_tracer("ebay_rest")``)
+            propagate: Inject trace context headers into requests (default: True)
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed
+        """
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetryHooks requires opentelemetry-api; "
+                "install with: pip install 'ebay-rest[otel]'"
+            )
+        self.tracer = tracer if tracer is not None else trace.get_tracer("ebay_rest")
+        self.propagate = propagate
+
+    def install(self, hooks: HookRegistry) -> "OpenTelemetryHooks":
+        """Register the tracing hooks; returns self for chaining."""
+        hooks.register(BEFORE_REQUEST, self._before_request)
+        hooks.register(ON_RETRY, self._on_retry)
+        hooks.register(AFTER_RESPONSE, self._after_response)
+        hooks.register(ON_ERROR, self._on_error)
+        hooks.register(ON_TOKEN_REFRESH, self._on_token_refresh)
+        return self
+
+    def uninstall(self, hooks: HookRegistry) -> None:
+        """Remove the tracing hooks."""
+        hooks.unregister(BEFORE_REQUEST, self._before_request)
+        hooks.unregister(ON_RETRY, self._on_retry)
+        hooks.unregister(AFTER_RESPONSE, self._after_response)
+        hooks.unregister(ON_ERROR, self._on_error)
+        hooks.unregister(ON_TOKEN_REFRESH, self._on_token_refresh)
+
+    def _inject(self, event: RequestEvent, span: Any) -> None:
+        if self.propagate and event.headers is not None:
+            inject(event.headers, context=trace.set_span_in_context(span))
+
+    def _before_request(self, event: RequestEvent) -> None:
+        name = endpoint_template(event.method, event.path)
+        span = self.tracer.start_span(
+            name,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "url.full": event.url,
+                "url.template": name.partition(" ")[2],
+            },
+        )
+        event.context[_SPAN] = span
+        self._inject(event, span)
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        span = event.context.get(_SPAN)
+        if span is None:
+            return
+        span.add_event(
+            "retry",
+            {
+                "http.response.status_code": event.status_code or 0,
+                "ebay_rest.retry_reason": event.retry_reason or "",
+            },
+        )
+        span.set_attribute("http.request.resend_count", event.attempt - 1)
+        self._inject(event, span)  # the retry sends freshly built headers
+
+    def _after_response(self, event: RequestEvent) -> None:
+        span = event.context.get(_SPAN)
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status_code)
+        if event.error is None:
+            span.end()
+
+    def _on_error(self, event: RequestEvent) -> None:
+        span = event.context.pop(_SPAN, None)
+        if span is None:
+            return
+        span.set_attribute("error.type", type(event.error).__name__)
+        span.record_exception(event.error)
+        span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end()
+
+    def _on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        end = time.time_ns()
+        span = self.tracer.start_span(
+            "ebay_rest token refresh",
+            kind=SpanKind.CLIENT,
+            start_time=end - int(event.elapsed * 1e9),
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.end(end_time=end)
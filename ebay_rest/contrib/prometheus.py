@@ -0,0 +1,207 @@
+"""Prometheus text-format exporter for BaseClient requests (no dependencies)."""
+
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Sequence
+
+from ebay_rest.hooks import (
+    AFTER_RESPONSE,
+    ON_ERROR,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    HookRegistry,
+    RequestEvent,
+    TokenRefreshEvent,
+)
+from ebay_rest.metrics import DEFAULT_BUCKETS, Histogram, endpoint_template
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusExporter:
+    """
+    Count requests, errors, retries and token refreshes through hooks and
+    render them in the Prometheus text exposition format.
+
+    ::
+
+        exporter = PrometheusExporter().install(client.base_client.hooks)
+        exporter.serve(port=9464)  # http://127.0.0.1:9464/metrics
+
+    Endpoints are labelled with IDs collapsed (``/buy/browse/v1/item/{id}``)
+    so label cardinality stays bounded.
+    """
+
+    def __init__(self, namespace: str = "ebay_rest", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize exporter.
+
+        Args:
+            namespace: Metric name prefix (default: ebay_rest)
+            buckets: Duration histogram upper bounds in seconds
+        """
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._requests: Counter[tuple[str, str, str]] = Counter()
+        self._durations: dict[tuple[str, str], Histogram] = {}
+        self._errors: Counter[str] = Counter()
+        self._retries: Counter[str] = Counter()
+        self._token_refreshes: Counter[str] = Counter()
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+
+    def install(self, hooks: HookRegistry) -> "PrometheusExporter":
+        """Register this exporter's hooks; returns self for chaining."""
+        hooks.register(AFTER_RESPONSE, self._after_response)
+        hooks.register(ON_ERROR, self._on_error)
+        hooks.register(ON_RETRY, self._on_retry)
+        hooks.register(ON_TOKEN_REFRESH, self._on_token_refresh)
+        return self
+
+    def uninstall(self, hooks: HookRegistry) -> None:
+        """Remove this exporter's hooks."""
+        hooks.unregister(AFTER_RESPONSE, self._after_response)
+        hooks.unregister(ON_ERROR, self._on_error)
+        hooks.unregister(ON_RETRY, self._on_retry)
+        hooks.unregister(ON_TOKEN_REFRESH, self._on_token_refresh)
+
+    def gauge(self, name: str, help_text: str, fn: Callable[[], float]) -> "PrometheusExporter":
+        """
+        Export a value read at scrape time, e.g. an AdaptiveLimiter's limit.
+
+        ::
+
+            exporter.gauge("concurrency_limit", "Requests allowed in flight", lambda: limiter.limit)
+
+        Args:
+            name: Metric name, without the namespace prefix
+            help_text: HELP line
+            fn: Returns the current value
+
+        Returns:
+            self, for chaining
+        """
+        with self._lock:
+            self._gauges[name] = (help_text, fn)
+        return self
+
+    def _record(self, event: RequestEvent, status: str) -> None:
+        endpoint = endpoint_template(event.method, event.path).partition(" ")[2]
+        with self._lock:
+            self._requests[(event.method, endpoint, status)] += 1
+            histogram = self._durations.get((event.method, endpoint))
+            if histogram is None:
+                histogram = self._durations[(event.method, endpoint)] = Histogram(self.buckets)
+            histogram.observe(event.elapsed or 0.0)
+
+    def _after_response(self, event: RequestEvent) -> None:
+        self._record(event, str(event.status_code))
+
+    def _on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._errors[type(event.error).__name__] += 1
+        if event.response is None:
+            # No response (network failure), so after_response did not count it
+            self._record(event, "error")
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._retries[event.retry_reason or "unknown"] += 1
+
+    def _on_token_refresh(self, event: TokenRefreshEvent) -> None:
+        with self._lock:
+            self._token_refreshes["failure" if event.error else "success"] += 1
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text format."""
+        ns = self.namespace
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                f"# HELP {ns}_requests_total eBay API calls by final status",
+                f"# TYPE {ns}_requests_total counter",
+            ]
+            for (method, endpoint, status), count in sorted(self._requests.items()):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                lines.append(f"{ns}_requests_total{labels} {count}")
+
+            lines += [
+                f"# HELP {ns}_request_duration_seconds eBay API call duration including retries",
+                f"# TYPE {ns}_request_duration_seconds histogram",
+            ]
+            for (method, endpoint), histogram in sorted(self._durations.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    labels = _labels(method=method, endpoint=endpoint, le=repr(bound))
+                    lines.append(f"{ns}_request_duration_seconds_bucket{labels} {cumulative}")
+                labels = _labels(method=method, endpoint=endpoint, le="+Inf")
+                lines.append(f"{ns}_request_duration_seconds_bucket{labels} {histogram.count}")
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(f"{ns}_request_duration_seconds_sum{labels} {histogram.sum!r}")
+                lines.append(f"{ns}_request_duration_seconds_count{labels} {histogram.count}")
+
+            for name, help_text, label, counter in (
+                ("errors_total", "Failed eBay API calls by exception type", "type", self._errors),
+                ("retries_total", "Retried eBay API attempts by reason", "reason", self._retries),
+                (
+                    "token_refreshes_total",
+                    "User token refreshes by result",
+                    "result",
+                    self._token_refreshes,
+                ),
+            ):
+                lines += [f"# HELP {ns}_{name} {help_text}", f"# TYPE {ns}_{name} counter"]
+                for value, count in sorted(counter.items()):
+                    lines.append(f"{ns}_{name}{_labels(**{label: value})} {count}")
+            gauges = sorted(self._gauges.items())
+        # Read gauges outside the lock: fn may take locks of its own
+        for name, (help_text, fn) in gauges:
+            lines += [
+                f"# HELP {ns}_{name} {help_text}",
+                f"# TYPE {ns}_{name} gauge",
+                f"{ns}_{name} {fn()!r}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        """
+        Serve ``/metrics`` on a daemon thread.
+
+        Args:
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one (default: 9464)
+
+        Returns:
+            The running server; call ``shutdown()`` and ``server_close()`` to stop it
+        """
+        exporter = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="ebay-rest-metrics", daemon=True).start()
+        return server
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        key + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels.items()
+    )
+    return "{" + ",".join(escaped) + "}"
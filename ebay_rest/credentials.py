@@ -0,0 +1,104 @@
+"""Per-seller user credentials for Sell API calls."""
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class UserCredentials:
+    """
+    User access/refresh token pair for one seller.
+
+    Holds the per-seller refresh state so a single BaseClient (and its
+    connection pool) can serve many sellers. Instances are safe to share
+    between threads; refreshes are serialized through ``lock``.
+    """
+
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        scopes: Optional[list[str]] = None,
+        expires_at: Optional[float] = None,
+        seller_id: Optional[str] = None,
+    ):
+        """
+        Initialize user credentials.
+
+        Args:
+            access_token: User access token from the Authorization Code flow
+            refresh_token: Refresh token used to renew the access token
+            scopes: OAuth scopes requested on refresh
+            expires_at: Unix timestamp when the access token expires, if known
+            seller_id: Optional label identifying the seller
+        """
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.scopes = scopes or []
+        self.expires_at = expires_at
+        self.seller_id = seller_id
+        self.lock = threading.RLock()
+        # Called after every refresh, e.g. to persist rotated tokens
+        self.on_update: Optional[Callable[["UserCredentials"], None]] = None
+
+    def __repr__(self) -> str:
+        return f"UserCredentials(seller_id={self.seller_id!r}, expires_at={self.expires_at!r})"
+
+    @property
+    def scope_id(self) -> str:
+        """
+        Stable identifier for the seller these credentials act on behalf of.
+
+        Uses ``seller_id`` when set, otherwise a hash of the refresh token
+        (which outlives access tokens), so it never exposes a secret.
+        """
+        if self.seller_id:
+            return self.seller_id
+        secret = self.refresh_token or self.access_token or ""
+        return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+    def needs_refresh(self, buffer_seconds: int = 60) -> bool:
+        """Return True if the access token is missing or expired and can be refreshed."""
+        return bool(self.refresh_token) and self.is_expired(buffer_seconds)
+
+    def is_expired(self, buffer_seconds: int = 60) -> bool:
+        """
+        Check if the access token is known to be expired or about to expire.
+
+        Tokens without a known expiry are assumed valid; a 401 still triggers
+        a refresh for them.
+
+        Args:
+            buffer_seconds: Treat the token as expired this many seconds early
+
+        Returns:
+            True if the token is missing or past its expiry (minus buffer)
+        """
+        if not self.access_token:
+            return True
+        if self.expires_at is None:
+            return False
+        return time.time() >= (self.expires_at - buffer_seconds)
+
+    def update(self, token_response: dict[str, Any]) -> str:
+        """
+        Apply an OAuth token response to these credentials.
+
+        Args:
+            token_response: Parsed JSON from the token endpoint
+
+        Returns:
+            New access token string
+        """
+        access_token = token_response["access_token"]
+        with self.lock:
+            self.access_token = access_token
+            expires_in = token_response.get("expires_in")
+            self.expires_at = time.time() + expires_in if expires_in else None
+            # eBay only rotates the refresh token occasionally
+            if token_response.get("refresh_token"):
+                self.refresh_token = token_response["refresh_token"]
+            if self.on_update is not None:
+                self.on_update(self)
+        return access_token
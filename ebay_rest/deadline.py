@@ -0,0 +1,111 @@
+"""End-to-end deadlines, carried through a thread or task like the call priority."""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+from ebay_rest.errors import DeadlineExceeded
+
+# Absolute time.monotonic() by which the current call must finish
+_active_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "ebay_rest_active_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[float]:
+    """Return the ``time.monotonic()`` value calls must finish by, or None."""
+    return _active_deadline.get()
+
+
+def time_remaining() -> Optional[float]:
+    """Return the seconds left before the deadline (never negative), or None without one."""
+    expires_at = _active_deadline.get()
+    if expires_at is None:
+        return None
+    return max(expires_at - time.monotonic(), 0.0)
+
+
+def check_deadline(action: str = "call") -> None:
+    """
+    Give up if the deadline has passed.
+
+    Args:
+        action: What was about to start, for the error message
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    left = time_remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Deadline passed before {action}")
+
+
+def cap_timeout(timeout: Union[float, tuple[float, float]]) -> Union[float, tuple[float, float]]:
+    """
+    Shrink a requests-style timeout to the time left before the deadline.
+
+    Args:
+        timeout: Seconds, or a (connect, read) tuple
+
+    Returns:
+        The timeout, no longer than the remaining budget
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    left = time_remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Deadline passed before sending")
+    if isinstance(timeout, tuple):
+        return (min(timeout[0], left), min(timeout[1], left))
+    return min(timeout, left)
+
+
+@contextmanager
+def deadline_at(expires_at: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Apply an absolute deadline (``time.monotonic()`` value) inside the block.
+
+    An enclosing deadline that is earlier still wins; None leaves it as is.
+
+    Yields:
+        The deadline in force
+    """
+    outer = _active_deadline.get()
+    if expires_at is None or (outer is not None and outer <= expires_at):
+        yield outer
+        return
+    reset_token = _active_deadline.set(expires_at)
+    try:
+        yield expires_at
+    finally:
+        _active_deadline.reset(reset_token)
+
+
+@contextmanager
+def use_deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Give every call made inside the block a shared time budget.
+
+    The budget covers token refreshes, rate-limit waits and every request,
+    and each request's timeout shrinks to what is left. Once it runs out,
+    calls raise DeadlineExceeded instead of starting. Nested blocks can only
+    shorten it.
+
+    ::
+
+        with use_deadline(2.0):    # e.g. a web request's own budget
+            item = client.browse.get_item(item_id)
+            orders = client.orders.list_orders()
+
+    Args:
+        seconds: Budget from now (None for no deadline)
+
+    Yields:
+        The deadline in force, as a ``time.monotonic()`` value
+    """
+    with deadline_at(None if seconds is None else time.monotonic() + seconds) as expires_at:
+        yield expires_at
@@ -48,6 +48,31 @@ class RateLimitExceeded(EbayAPIError):
         self.retry_after = retry_after
 
 
+class QuotaExhausted(RateLimitExceeded):
+    """Raised locally, without calling eBay, when a call would overdraw the daily quota."""
+
+    def __init__(
+        self,
+        message: str = "Daily call quota exhausted",
+        family: str | None = None,
+        priority: int | None = None,
+        **kwargs,
+    ):
+        """
+        Initialize quota error.
+
+        Args:
+            message: Error message
+            family: API family whose budget is spent (e.g. "buy.browse")
+            priority: Priority of the rejected call
+            **kwargs: Additional arguments for RateLimitExceeded (retry_after is
+                the number of seconds until the quota resets)
+        """
+        super().__init__(message, **kwargs)
+        self.family = family
+        self.priority = priority
+
+
 class ServerError(EbayAPIError):
     """Raised when eBay API returns a server error (5xx)."""
 
@@ -55,6 +80,37 @@ class ServerError(EbayAPIError):
         super().__init__(message, **kwargs)
 
 
+class CircuitOpenError(ServerError):
+    """Raised locally, without calling eBay, while a circuit breaker holds a failing API."""
+
+    def __init__(
+        self,
+        message: str = "Circuit open",
+        key: str | None = None,
+        retry_after: int | None = None,
+        **kwargs,
+    ):
+        """
+        Initialize circuit open error.
+
+        Args:
+            message: Error message
+            key: Circuit that refused the call (API family or endpoint)
+            retry_after: Seconds until a trial call is allowed, if known
+            **kwargs: Additional arguments for ServerError
+        """
+        super().__init__(message, **kwargs)
+        self.key = key
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(EbayAPIError):
+    """Raised when a call's deadline (see deadline.use_deadline) runs out before it completes."""
+
+    def __init__(self, message: str = "Deadline exceeded", **kwargs):
+        super().__init__(message, **kwargs)
+
+
 class ValidationError(EbayAPIError):
     """Raised when request validation fails."""
 
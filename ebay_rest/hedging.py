@@ -0,0 +1,252 @@
+"""Hedged requests: a second copy of a slow idempotent GET, first answer wins."""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from ebay_rest.metrics import endpoint_template
+
+
+class _Latencies:
+    __slots__ = ("samples", "since_update", "delay")
+
+    def __init__(self, window: int):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.since_update = 0
+        self.delay: Optional[float] = None
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of a slow GET and returns whichever copy answers first.
+
+    For each endpoint (IDs collapsed, as in the metrics) the policy tracks
+    recent latencies. A call still unanswered at the ``percentile`` of those
+    latencies gets a second, identical request. Only GETs to ``paths`` are
+    hedged, since a duplicate must be harmless. Hedges are capped at ``budget``
+    of all hedgeable calls, so an overall slowdown cannot double the load.
+
+    Once an endpoint has a delay, its calls are sent from a pool of
+    ``max_workers`` threads so the caller can return as soon as either copy
+    answers. When every thread is busy, a call is sent from the caller's own
+    thread without a hedge instead of queueing, so the pool never limits
+    concurrency. Blocking transports cannot abort a request in flight. The
+    slower copy runs to completion in the background and its response is
+    dropped; a primary that answers before the hedge delay is never duplicated.
+
+    ::
+
+        client = EbayClient(client_id, client_secret, hedge=HedgePolicy(percentile=0.95))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        paths: tuple[str, ...] = ("/buy/browse/",),
+        min_samples: int = 20,
+        min_delay: float = 0.005,
+        window: int = 1000,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize hedge policy.
+
+        Args:
+            percentile: Latency quantile after which a call is hedged (default: 0.95)
+            budget: Hedges allowed as a fraction of hedgeable calls (default: 0.05)
+            paths: Path prefixes of idempotent GETs that may be hedged (default: Browse)
+            min_samples: Calls an endpoint needs before it is hedged (default: 20)
+            min_delay: Shortest wait before hedging, in seconds (default: 5ms)
+            window: Recent latencies kept per endpoint (default: 1000)
+            max_workers: Threads sending hedgeable calls and their hedges; calls
+                beyond them go out unhedged (default: 32)
+        """
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0.0 <= budget <= 1.0:
+            raise ValueError("budget must be between 0 and 1")
+        self.percentile = percentile
+        self.budget = budget
+        self.paths = tuple(paths)
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.window = window
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._latencies: dict[str, _Latencies] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._busy_workers = 0
+        self._calls = 0
+        self._hedges = 0
+        self._wins = 0
+
+    def applies(self, method: str, path: str) -> bool:
+        """Return True if a call may be hedged."""
+        return method == "GET" and path.startswith(self.paths)
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Return how long a call to an endpoint waits before hedging, or None while learning."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            return latencies.delay if latencies is not None else None
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a first (unhedged) request."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = _Latencies(self.window)
+            latencies.samples.append(seconds)
+            latencies.since_update += 1
+            # Re-sorting on every call would cost more than it saves; refresh in batches
+            if len(latencies.samples) >= self.min_samples and (
+                latencies.delay is None or latencies.since_update >= max(self.min_samples, 50)
+            ):
+                ordered = sorted(latencies.samples)
+                index = min(int(self.percentile * len(ordered)), len(ordered) - 1)
+                latencies.delay = max(ordered[index], self.min_delay)
+                latencies.since_update = 0
+
+    def send(
+        self,
+        method: str,
+        path: str,
+        send: Callable[[], Any],
+        charge: Optional[Callable[[], bool]] = None,
+        send_hedge: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Run ``send``, and a second copy of it if the first is slow.
+
+        Args:
+            method: HTTP method
+            path: API path, used to pick the endpoint's latency record
+            send: Sends the request and returns the response; may be called twice
+            charge: Called before sending a hedge; returning False skips it
+                (e.g. when the daily quota cannot spare the call)
+            send_hedge: Sends the hedge instead of ``send``, e.g. after waiting
+                for the same rate and concurrency limits as a first request
+
+        Returns:
+            The first response to arrive
+        """
+        endpoint = endpoint_template(method, path)
+        delay = self.delay(endpoint)
+        with self._lock:
+            self._calls += 1
+        if delay is None or not self._claim_worker():
+            # Still learning, or every thread is busy: send from the caller's thread
+            start = time.perf_counter()
+            response = send()
+            self.observe(endpoint, time.perf_counter() - start)
+            return response
+
+        executor = self._get_executor()
+
+        def send_primary() -> Any:
+            # Timed from when a thread picks the call up, not from submission
+            start = time.perf_counter()
+            try:
+                response = send()
+            finally:
+                self._release_worker()
+            # Only the first copy's latency: hedge wins would hide the tail being measured
+            self.observe(endpoint, time.perf_counter() - start)
+            return response
+
+        def send_second() -> Any:
+            try:
+                if primary.done():
+                    # The first copy answered while this one waited for a thread
+                    return primary.result()
+                return (send_hedge or send)()
+            finally:
+                self._release_worker()
+
+        # Each copy runs in the caller's context, so its deadline caps both
+        primary = executor.submit(contextvars.copy_context().run, send_primary)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._claim_worker():
+            return primary.result()
+        if not self._spend(charge):
+            self._release_worker()
+            return primary.result()
+
+        hedge = executor.submit(contextvars.copy_context().run, send_second)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _answered(future):
+                    if future is hedge:
+                        with self._lock:
+                            self._wins += 1
+                    return future.result()
+        # Neither copy got a usable answer: report the original request's outcome
+        return primary.result()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Report hedging activity.
+
+        Returns:
+            Dictionary with hedgeable ``calls``, ``hedges`` sent, hedge ``wins``
+            and the current ``delays`` per endpoint
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedges": self._hedges,
+                "wins": self._wins,
+                "delays": {
+                    endpoint: latencies.delay
+                    for endpoint, latencies in self._latencies.items()
+                    if latencies.delay is not None
+                },
+            }
+
+    def close(self) -> None:
+        """Stop the hedging threads once their calls finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _spend(self, charge: Optional[Callable[[], bool]]) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.budget * self._calls:
+                return False
+            self._hedges += 1
+        if charge is None or charge():
+            return True
+        with self._lock:
+            self._hedges -= 1
+        return False
+
+    def _claim_worker(self) -> bool:
+        with self._lock:
+            if self._busy_workers >= self.max_workers:
+                return False
+            self._busy_workers += 1
+            return True
+
+    def _release_worker(self) -> None:
+        with self._lock:
+            self._busy_workers -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ebay-rest-hedge"
+                )
+            return self._executor
+
+
+def _answered(future: Future) -> bool:
+    """A response that is not a server error; a fast 5xx must not beat a slow success."""
+    return future.exception() is None and getattr(future.result(), "status_code", 200) < 500
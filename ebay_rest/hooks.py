@@ -0,0 +1,148 @@
+"""Request/response event hooks for tracing and metrics."""
+
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+BEFORE_REQUEST = "before_request"
+AFTER_RESPONSE = "after_response"
+ON_RETRY = "on_retry"
+ON_TOKEN_REFRESH = "on_token_refresh"
+ON_ERROR = "on_error"
+EVENTS = (BEFORE_REQUEST, AFTER_RESPONSE, ON_RETRY, ON_TOKEN_REFRESH, ON_ERROR)
+
+Hook = Callable[[Any], None]
+
+
+class RequestEvent:
+    """
+    State of one BaseClient call, passed to every request hook.
+
+    The same object is passed to all hooks of a call, so hooks can keep
+    per-call state (e.g. an open span) in ``context`` instead of thread-locals;
+    that keeps them correct when calls run concurrently in threads or in
+    ``asyncio.to_thread`` workers.
+    """
+
+    __slots__ = (
+        "method", "path", "url", "params", "json", "headers", "attempt", "status_code",
+        "response", "error", "started", "elapsed", "retry_reason", "timing", "context",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        json: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]] = None,
+    ):
+        self.method = method
+        self.path = path
+        self.url = url
+        self.params = params
+        self.json = json
+        self.headers = headers
+        self.attempt = 1
+        self.status_code: Optional[int] = None
+        self.response: Any = None
+        self.error: Optional[BaseException] = None
+        self.started = time.perf_counter()
+        self.elapsed: Optional[float] = None  # seconds, whole call including retries
+        self.retry_reason: Optional[str] = None
+        self.timing: Any = None  # metrics.RequestTiming phase breakdown, if metrics are enabled
+        self.context: dict[str, Any] = {}
+
+
+class TokenRefreshEvent:
+    """Outcome of one user token refresh, passed to ``on_token_refresh`` hooks."""
+
+    __slots__ = ("scopes", "elapsed", "error")
+
+    def __init__(self, scopes: list[str], elapsed: float, error: Optional[BaseException] = None):
+        self.scopes = scopes
+        self.elapsed = elapsed
+        self.error = error
+
+
+class HookRegistry:
+    """
+    Callbacks invoked around BaseClient requests.
+
+    Events, in the order they fire for one call:
+
+    - ``before_request``: once, after headers are built and before the first send
+    - ``on_retry``: before each extra attempt; ``status_code`` is the failed
+      attempt's and ``retry_reason`` says why (e.g. ``token_refresh``)
+    - ``after_response``: once, with the final response and ``error`` already
+      set if that response is about to raise (not fired on network errors)
+    - ``on_error``: once, if the call raises
+    - ``on_token_refresh``: whenever a user token is refreshed, with a
+      TokenRefreshEvent
+
+    Hooks run synchronously in the thread making the call and must be plain
+    functions; exceptions they raise are logged and never reach the caller.
+    Registration is copy-on-write, so hooks can be added or removed while other
+    threads are dispatching, and dispatch with nothing registered is a single
+    attribute check in BaseClient.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hooks: dict[str, tuple[Hook, ...]] = {event: () for event in EVENTS}
+        self.enabled = False
+
+    def register(self, event: str, hook: Hook) -> Hook:
+        """
+        Register a hook for an event.
+
+        Args:
+            event: One of EVENTS
+            hook: Callable taking the event object
+
+        Returns:
+            The hook, so this can be used as a decorator via ``on()``
+
+        Raises:
+            ValueError: If the event name is unknown
+            TypeError: If the hook is a coroutine function (it would never be awaited)
+        """
+        if event not in self._hooks:
+            raise ValueError(f"Unknown hook event {event!r}; expected one of {', '.join(EVENTS)}")
+        if inspect.iscoroutinefunction(hook):
+            raise TypeError(
+                "Hooks must be synchronous; schedule async work from a regular function"
+            )
+        with self._lock:
+            self._hooks[event] = self._hooks[event] + (hook,)
+            self.enabled = True
+        return hook
+
+    def on(self, event: str) -> Callable[[Hook], Hook]:
+        """Decorator form of register()."""
+        return lambda hook: self.register(event, hook)
+
+    def unregister(self, event: str, hook: Hook) -> None:
+        """Remove a previously registered hook (no-op if it is not registered)."""
+        with self._lock:
+            self._hooks[event] = tuple(h for h in self._hooks.get(event, ()) if h != hook)
+            self.enabled = any(self._hooks.values())
+
+    def clear(self) -> None:
+        """Remove all hooks."""
+        with self._lock:
+            self._hooks = {event: () for event in EVENTS}
+            self.enabled = False
+
+    def emit(self, event: str, payload: Any) -> None:
+        """Call every hook registered for an event."""
+        for hook in self._hooks[event]:
+            try:
+                hook(payload)
+            except Exception:
+                logger.exception("ebay_rest %s hook %r failed", event, hook)
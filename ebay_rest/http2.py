@@ -0,0 +1,124 @@
+"""Optional HTTP/2 transport built on httpx."""
+
+from typing import Any, Optional
+
+import requests
+
+from ebay_rest.transport import Timeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    httpx = None
+
+
+class Http2Transport:
+    """
+    Transport that sends requests over HTTP/2 with ``httpx``.
+
+    Concurrent requests to the same host are multiplexed as streams over a few
+    connections instead of one TCP+TLS connection each. The client is
+    thread-safe, so one instance is shared by every thread of a BaseClient.
+    Network failures are re-raised as ``requests`` exceptions so BaseClient's
+    error mapping is unchanged.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        keepalive_expiry: Optional[float] = None,
+        prior_knowledge: bool = False,
+        **client_options: Any,
+    ):
+        """
+        Initialize HTTP/2 transport.
+
+        Args:
+            max_connections: Maximum connections per client (each carries many streams)
+            keepalive_expiry: Close idle connections after this many seconds (default: httpx's 5s)
+            prior_knowledge: Speak HTTP/2 without negotiation; needed for plain http:// URLs,
+                where there is no TLS handshake to negotiate it
+            **client_options: Extra keyword arguments for ``httpx.Client``
+
+        Raises:
+            ImportError: If httpx (with h2) is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires httpx: pip install 'ebay-rest[http2]'"
+            )
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else 5.0,
+        )
+        self.prior_knowledge = prior_knowledge
+        self._client = httpx.Client(
+            http2=True,
+            http1=not prior_knowledge,
+            limits=limits,
+            **client_options,
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> "httpx.Response":
+        """
+        Send a request and return the httpx response.
+
+        The response exposes ``status_code``, ``headers``, ``text`` and ``json()``
+        like ``requests.Response``.
+
+        Raises:
+            requests.Timeout: If the request times out
+            requests.ConnectionError: For other transport failures
+        """
+        if params:
+            # requests drops None values; httpx would send them as empty strings
+            params = {key: value for key, value in params.items() if value is not None}
+        try:
+            return self._client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=_to_httpx_timeout(timeout),
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Report open connections and how many negotiated HTTP/2.
+
+        Returns:
+            Dictionary with ``connections``, ``idle`` and ``http2_connections`` counts
+        """
+        pool = getattr(self._client._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            "connections": len(connections),
+            "idle": sum(1 for conn in connections if conn.is_idle()),
+            "http2_connections": sum(1 for conn in connections if "HTTP/2" in conn.info()),
+        }
+
+    def close(self) -> None:
+        """Close all connections."""
+        self._client.close()
+
+
+def _to_httpx_timeout(timeout: Timeout) -> Any:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
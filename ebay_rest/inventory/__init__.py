@@ -1,6 +1,12 @@
 """Inventory API module for managing inventory items."""
 
-from ebay_rest.inventory.client import InventoryClient
+from typing import TYPE_CHECKING
+
+from ebay_rest._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ebay_rest.inventory.client import InventoryClient
 
 __all__ = ["InventoryClient"]
 
+__getattr__, __dir__ = lazy_exports(__name__, {"InventoryClient": "ebay_rest.inventory.client"})
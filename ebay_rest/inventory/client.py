@@ -47,7 +47,7 @@ class InventoryClient:
         response_data = self.base_client.get(endpoint)
 
         try:
-            item = InventoryItem(**response_data)
+            item = self.base_client.parse(InventoryItem, response_data)
             return item.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
@@ -85,7 +85,7 @@ class InventoryClient:
         response_data = self.base_client.get(endpoint, params=params)
 
         try:
-            collection = InventoryItemsResponse(**response_data)
+            collection = self.base_client.parse(InventoryItemsResponse, response_data)
             return {
                 "inventory_items": [
                     item.model_dump(by_alias=False, exclude_none=True) for item in collection.inventory_items
@@ -172,9 +172,17 @@ class InventoryClient:
             raise ValueError("requests must be list, BulkInventoryItemRequest, or dict")
 
         endpoint = "/sell/inventory/v1/bulk_create_or_replace_inventory_item"
-        response_data = self.base_client.post(endpoint, json=payload)
         try:
-            parsed = BulkInventoryItemResponse(**response_data)
+            response_data = self.base_client.post(endpoint, json=payload)
+        finally:
+            # Even a failed bulk call may have replaced some items
+            for request in payload.get("requests", []):
+                if request.get("sku"):
+                    self.base_client.invalidate(
+                        f"/sell/inventory/v1/inventory_item/{request['sku']}"
+                    )
+        try:
+            parsed = self.base_client.parse(BulkInventoryItemResponse, response_data)
             return parsed.model_dump(by_alias=False, exclude_none=True)
         except Exception:
             return response_data
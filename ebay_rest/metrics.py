@@ -0,0 +1,330 @@
+"""Request timing breakdown and latency histograms for BaseClient."""
+
+import contextvars
+import json
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from typing import Any, Optional, Sequence
+
+# Upper bounds in seconds; anything slower lands in the +Inf bucket
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# queue: waiting for a RequestScheduler slot
+# token: header building incl. token acquisition/refresh
+# ttfb: send until response headers, incl. waiting for a pooled connection
+# body: reading the response body
+# decode: JSON decoding and status mapping (_handle_response)
+# validate: pydantic model validation (BaseClient.parse)
+PHASES = ("queue", "token", "ttfb", "body", "decode", "validate")
+
+# Path segments following these collection names are resource IDs
+_COLLECTIONS = frozenset(
+    {"item", "order", "inventory_item", "offer", "location", "return_policy",
+     "payment_policy", "fulfillment_policy", "shipping_policy"}
+)
+_VERSION = re.compile(r"v\d+")
+_ID_CHARS = re.compile(r"[\d|%]")
+
+# RequestTiming of this thread/task's latest call, for parse() to annotate; None while a
+# request is in flight or when the call was answered from cache
+_last_timing: contextvars.ContextVar[Optional["RequestTiming"]] = contextvars.ContextVar(
+    "ebay_rest_last_timing", default=None
+)
+
+
+def endpoint_template(method: str, path: str) -> str:
+    """
+    Collapse resource IDs in a path so metrics are grouped per endpoint.
+
+    ``GET /buy/browse/v1/item/v1|123|0`` becomes ``GET /buy/browse/v1/item/{id}``.
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    template = []
+    previous = ""
+    for segment in segments:
+        if previous in _COLLECTIONS or (
+            _ID_CHARS.search(segment) and not _VERSION.fullmatch(segment)
+        ):
+            template.append("{id}")
+        else:
+            template.append(segment)
+        previous = segment
+    return f"{method} /{'/'.join(template)}"
+
+
+def api_family(path: str) -> str:
+    """
+    Return the API family eBay meters a path under.
+
+    ``/buy/browse/v1/item/v1|123|0`` belongs to ``buy.browse``.
+    """
+    return ".".join([part for part in path.split("?", 1)[0].split("/") if part][:2])
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Recording is a binary search and a list increment; percentiles are
+    estimated as the upper bound of the bucket they fall in. Not locked on its
+    own; ClientMetrics serializes updates.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        """Record one measurement in seconds."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0 < q <= 1), or None if empty."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(upper, self.max) if self.max is not None else upper
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return counts and summary statistics.
+
+        ``buckets`` maps each upper bound (and ``+Inf``) to the number of
+        measurements in that bucket (not cumulative).
+        """
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class RequestTiming:
+    """Breakdown of one BaseClient request (including its retries)."""
+
+    __slots__ = (
+        "method", "endpoint", "started", "total", "phases", "status_codes",
+        "retries", "bytes_in", "bytes_out", "error",
+    )
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.endpoint = endpoint_template(method, path)
+        self.started = time.perf_counter()
+        self.total = 0.0
+        self.phases: dict[str, float] = {}
+        self.status_codes: list[int] = []
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.error: Optional[str] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase (retries accumulate)."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def on_response(self, response: Any, request_json: Any, seconds: float) -> None:
+        """Split transport time into TTFB and body read, and count bytes."""
+        ttfb = _elapsed_seconds(response)
+        if ttfb is None or ttfb > seconds:
+            ttfb = seconds
+        self.add("ttfb", ttfb)
+        self.add("body", seconds - ttfb)
+        self.status_codes.append(response.status_code)
+        self.bytes_in += len(getattr(response, "content", b"") or b"")
+        self.bytes_out += _request_body_size(response, request_json)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "status": self.status_codes[-1] if self.status_codes else None,
+            "total": self.total,
+            "phases": dict(self.phases),
+            "retries": self.retries,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "error": self.error,
+        }
+
+
+class ClientMetrics:
+    """
+    Thread-safe request metrics for one or more clients.
+
+    Collects per-endpoint latency histograms, per-phase histograms, status
+    code, retry and error counters, byte totals and the last few request
+    breakdowns. Read everything at once with ``snapshot()``.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_endpoints: int = 200,
+        recent: int = 100,
+    ):
+        """
+        Initialize client metrics.
+
+        Args:
+            buckets: Histogram upper bounds in seconds (default: 1ms to 30s)
+            max_endpoints: Distinct endpoint histograms kept before folding the
+                rest into ``OTHER`` (bounds memory if paths carry unusual IDs)
+            recent: Number of recent request breakdowns kept (default: 100)
+        """
+        self.buckets = tuple(buckets)
+        self.max_endpoints = max_endpoints
+        self._lock = threading.Lock()
+        self._recent: deque[RequestTiming] = deque(maxlen=recent)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._requests = 0
+            self._bytes_in = 0
+            self._bytes_out = 0
+            self._status_codes: Counter[int] = Counter()
+            self._retries: Counter[str] = Counter()
+            self._errors: Counter[str] = Counter()
+            self._cache: Counter[str] = Counter()
+            self._gauges: dict[str, float] = {}
+            self._endpoints: dict[str, Histogram] = {}
+            self._phases = {phase: Histogram(self.buckets) for phase in PHASES}
+            self._validation: dict[str, Histogram] = {}
+            self._recent.clear()
+
+    def start(self, method: str, path: str) -> RequestTiming:
+        """Begin timing a request."""
+        _last_timing.set(None)
+        return RequestTiming(method, path)
+
+    def finish(self, timing: RequestTiming) -> None:
+        """Record a finished request."""
+        timing.total = time.perf_counter() - timing.started
+        with self._lock:
+            self._requests += 1
+            self._bytes_in += timing.bytes_in
+            self._bytes_out += timing.bytes_out
+            self._status_codes.update(timing.status_codes)
+            if timing.error is not None:
+                self._errors[timing.error] += 1
+            histogram = self._endpoints.get(timing.endpoint)
+            if histogram is None:
+                key = timing.endpoint if len(self._endpoints) < self.max_endpoints else "OTHER"
+                histogram = self._endpoints.setdefault(key, Histogram(self.buckets))
+            histogram.observe(timing.total)
+            for phase, seconds in timing.phases.items():
+                self._phases[phase].observe(seconds)
+            self._recent.append(timing)
+        _last_timing.set(timing)
+
+    def record_retry(self, reason: str) -> None:
+        """Count a retried request by reason (e.g. ``token_refresh``)."""
+        with self._lock:
+            self._retries[reason] += 1
+
+    def record_cache(self, outcome: str) -> None:
+        """Count a response cache lookup by outcome (``hit``, ``negative_hit`` or ``miss``)."""
+        # A new call: validation after a hit must not land on an earlier request
+        _last_timing.set(None)
+        with self._lock:
+            self._cache[outcome] += 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Record the current value of a gauge (e.g. ``concurrency_limit``)."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def record_validation(self, model_name: str, seconds: float) -> None:
+        """Record model validation time, adding it to this thread's last request unless cached."""
+        timing = _last_timing.get()
+        with self._lock:
+            histogram = self._validation.get(model_name)
+            if histogram is None:
+                histogram = self._validation[model_name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+            self._phases["validate"].observe(seconds)
+            if timing is not None:
+                timing.add("validate", seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return all metrics as plain data.
+
+        Returns:
+            Dictionary with ``requests``, ``bytes_in``, ``bytes_out``,
+            ``status_codes``, ``retries``, ``errors``, ``cache`` lookups,
+            ``gauges``, ``endpoints`` and
+            ``phases`` and ``validation`` histograms (see Histogram.snapshot),
+            and ``recent`` per-request breakdowns (oldest first)
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "bytes_in": self._bytes_in,
+                "bytes_out": self._bytes_out,
+                "status_codes": {
+                    str(code): count for code, count in sorted(self._status_codes.items())
+                },
+                "retries": dict(self._retries),
+                "errors": dict(self._errors),
+                "cache": dict(self._cache),
+                "gauges": dict(self._gauges),
+                "endpoints": {name: hist.snapshot() for name, hist in self._endpoints.items()},
+                "phases": {name: hist.snapshot() for name, hist in self._phases.items()},
+                "validation": {name: hist.snapshot() for name, hist in self._validation.items()},
+                "recent": [timing.as_dict() for timing in self._recent],
+            }
+
+
+def _elapsed_seconds(response: Any) -> Optional[float]:
+    # requests/httpx report a timedelta, TransportResponse a float (or None)
+    try:
+        elapsed = getattr(response, "elapsed", None)
+    except RuntimeError:
+        # httpx raises if the response never recorded its timing
+        return None
+    if hasattr(elapsed, "total_seconds"):
+        elapsed = elapsed.total_seconds()
+    return float(elapsed) if isinstance(elapsed, (int, float)) else None
+
+
+def _request_body_size(response: Any, request_json: Any) -> int:
+    request = getattr(response, "request", None)
+    body = getattr(request, "body", None)
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    if request_json is None:
+        return 0
+    return len(json.dumps(request_json).encode("utf-8"))
@@ -8,6 +8,8 @@ from typing import Iterable
 
 import requests
 
+from ebay_rest.deadline import cap_timeout
+
 
 AUTH_URLS = {
     "sandbox": "https://auth.sandbox.ebay.com/oauth2/authorize",
@@ -61,6 +63,7 @@ def exchange_authorization_code(
     code: str,
     redirect_uri: str,
     environment: str = "sandbox",
+    token_url: str | None = None,
 ) -> dict:
     """
     Exchange an authorization code for access + refresh tokens.
@@ -71,6 +74,7 @@ def exchange_authorization_code(
         code: Authorization code returned from consent
         redirect_uri: Same redirect URI used during consent (URL encoded)
         environment: "sandbox" or "production"
+        token_url: Optional token endpoint overriding the environment's (e.g. a local fake)
     """
     return _token_request(
         client_id,
@@ -81,6 +85,7 @@ def exchange_authorization_code(
             "redirect_uri": redirect_uri,
         },
         environment,
+        token_url,
     )
 
 
@@ -90,6 +95,7 @@ def refresh_user_token(
     refresh_token: str,
     scopes: Iterable[str],
     environment: str = "sandbox",
+    token_url: str | None = None,
 ) -> dict:
     """
     Refresh a user access token using the stored refresh token.
@@ -100,6 +106,7 @@ def refresh_user_token(
         refresh_token: Refresh token obtained from previous exchange
         scopes: Scopes to request for the refreshed token
         environment: "sandbox" or "production"
+        token_url: Optional token endpoint overriding the environment's (e.g. a local fake)
     """
     return _token_request(
         client_id,
@@ -110,6 +117,7 @@ def refresh_user_token(
             "scope": " ".join(scopes),
         },
         environment,
+        token_url,
     )
 
 
@@ -118,6 +126,7 @@ def _token_request(
     client_secret: str,
     data: dict,
     environment: str,
+    token_url: str | None = None,
 ) -> dict:
     if environment not in TOKEN_URLS:
         raise ValueError("environment must be 'sandbox' or 'production'")
@@ -128,7 +137,9 @@ def _token_request(
         "Authorization": f"Basic {auth_header}",
     }
 
-    response = requests.post(TOKEN_URLS[environment], headers=headers, data=data, timeout=30)
+    response = requests.post(
+        token_url or TOKEN_URLS[environment], headers=headers, data=data, timeout=cap_timeout(30)
+    )
     response.raise_for_status()
     return response.json()
 
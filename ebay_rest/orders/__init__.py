@@ -1,6 +1,12 @@
 """Orders API module for retrieving and managing orders."""
 
-from ebay_rest.orders.client import OrdersClient
+from typing import TYPE_CHECKING
+
+from ebay_rest._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ebay_rest.orders.client import OrdersClient
 
 __all__ = ["OrdersClient"]
 
+__getattr__, __dir__ = lazy_exports(__name__, {"OrdersClient": "ebay_rest.orders.client"})
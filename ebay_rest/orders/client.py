@@ -69,7 +69,7 @@ class OrdersClient:
         response_data = self.base_client.get(endpoint, params=params)
 
         try:
-            orders_response = OrdersResponse(**response_data)
+            orders_response = self.base_client.parse(OrdersResponse, response_data)
             return {
                 "orders": [order.model_dump() for order in orders_response.orders],
                 "href": orders_response.href,
@@ -107,7 +107,7 @@ class OrdersClient:
         response_data = self.base_client.get(endpoint)
 
         try:
-            order = Order(**response_data)
+            order = self.base_client.parse(Order, response_data)
             return order.model_dump()
         except Exception:
             return response_data
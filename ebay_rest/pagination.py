@@ -1,8 +1,12 @@
 """Pagination utilities for eBay API responses."""
 
+import time
 from typing import Any, Callable, Generator, Optional
 from urllib.parse import parse_qs, urlparse
 
+from ebay_rest.concurrency import fan_out
+from ebay_rest.deadline import check_deadline, deadline_at
+
 
 def paginate(
     client_method: Callable,
@@ -13,6 +17,7 @@ def paginate(
     next_key: str = "next",
     offset_param: str = "offset",
     limit_param: str = "limit",
+    deadline: Optional[float] = None,
     **kwargs: Any,
 ) -> Generator[dict[str, Any], None, None]:
     """
@@ -29,18 +34,28 @@ def paginate(
         next_key: Response key that contains next page URL (default "next")
         offset_param: Query parameter used for offset-based pagination
         limit_param: Query parameter used for per-page limit
+        deadline: Seconds from the first page request within which every page
+            must be fetched; time spent by the consumer between pages counts
+            (default: the enclosing use_deadline block, if any)
         **kwargs: Keyword arguments to pass to client_method
 
     Yields:
         Individual items from paginated responses
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before a page is fetched
     """
 
     emitted = 0
     page_count = 0
     request_kwargs = dict(kwargs)
+    expires_at = time.monotonic() + deadline if deadline is not None else None
 
     while True:
-        response = client_method(*args, **request_kwargs)
+        # Scoped to the fetch only: a generator shares its consumer's context
+        with deadline_at(expires_at):
+            check_deadline(f"fetching page {page_count + 1}")
+            response = client_method(*args, **request_kwargs)
         items = response.get(items_key)
         if not isinstance(items, list):
             items = []
@@ -91,6 +106,114 @@ def paginate(
         request_kwargs[offset_param] = next_offset
 
 
+def paginate_concurrently(
+    client_method: Callable,
+    *args: Any,
+    page_size: int = 50,
+    max_items: Optional[int] = None,
+    items_key: str = "items",
+    total_key: str = "total",
+    offset_param: str = "offset",
+    limit_param: str = "limit",
+    max_workers: int = 8,
+    deadline: Optional[float] = None,
+    **kwargs: Any,
+) -> Generator[dict[str, Any], None, None]:
+    """
+    Fetch an offset-paginated listing's pages concurrently, yielding items in order.
+
+    The first page is fetched alone to learn the ``total``; the remaining
+    pages are then requested through fan_out(), ``max_workers`` pages at a
+    time, and each window's items are yielded before the next is fetched.
+    With ``BaseClient(limiter=...)`` the adaptive limiter decides how many of
+    them are in flight at once. A
+    response without a total, or a first page shorter than ``page_size``
+    (the server capped the limit), falls back to fetching pages one by one.
+
+    ::
+
+        for order in paginate_concurrently(client.orders.list_orders, page_size=200,
+                                           items_key="orders", max_workers=16):
+            ...
+
+    Args:
+        client_method: List method accepting the offset and limit parameters
+        *args: Positional arguments to pass to client_method
+        page_size: Items per page, passed as ``limit_param`` (default: 50)
+        max_items: Stop after this many items (None for all)
+        items_key: Response key that contains items (default "items")
+        total_key: Response key with the total item count (default "total")
+        offset_param: Query parameter used for the offset
+        limit_param: Query parameter used for the page size
+        max_workers: Threads fetching pages (default: 8)
+        deadline: Seconds within which every page must be fetched (default:
+            the enclosing use_deadline block, if any)
+        **kwargs: Keyword arguments to pass to client_method
+
+    Yields:
+        Individual items, in listing order
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before all pages are fetched
+    """
+
+    def fetch(offset: int) -> dict[str, Any]:
+        return client_method(*args, **{**kwargs, offset_param: offset, limit_param: page_size})
+
+    def page_items(response: dict[str, Any]) -> list[Any]:
+        items = response.get(items_key)
+        return items if isinstance(items, list) else []
+
+    expires_at = time.monotonic() + deadline if deadline is not None else None
+    with deadline_at(expires_at):
+        first_response = fetch(0)
+    first = page_items(first_response)
+    total = first_response.get(total_key)
+
+    if not isinstance(total, int) or len(first) < min(page_size, total):
+        # No total, or the server capped the page size: later offsets are
+        # unknown, so walk the pages in order from the one in hand. A short
+        # first page may be the server's cap; keep asking for that much.
+        step = len(first) if 0 < len(first) < page_size else page_size
+        emitted = offset = 0
+        page = first
+        while True:
+            for item in page:
+                if max_items is not None and emitted >= max_items:
+                    return
+                yield item
+                emitted += 1
+            offset += len(page)
+            if len(page) < step or (isinstance(total, int) and offset >= total):
+                return
+            with deadline_at(expires_at):
+                check_deadline(f"fetching items from offset {offset}")
+                response = client_method(
+                    *args, **{**kwargs, offset_param: offset, limit_param: step}
+                )
+                page = page_items(response)
+
+    wanted = total if max_items is None else min(total, max_items)
+    offsets = range(page_size, wanted, page_size)
+    emitted = start = 0
+    pages = [first]
+    while True:
+        for items in pages:
+            for item in items:
+                if emitted >= wanted:
+                    return
+                yield item
+                emitted += 1
+        window = offsets[start:start + max_workers]
+        if not window:
+            return
+        start += max_workers
+        # Each window is fetched in full before its items are yielded, so the
+        # scope never spans a yield; fan_out hands it to each worker
+        with deadline_at(expires_at):
+            pages = [page_items(response) for response in fan_out(fetch, window, max_workers)]
+
+
 def _extract_offset_from_href(href: str, offset_param: str) -> Optional[int]:
     """Extract offset value from next page href."""
     if not href:
@@ -0,0 +1,55 @@
+"""Call priorities, carried through a thread or task like the active credentials."""
+
+import contextvars
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Iterator
+
+
+class Priority(IntEnum):
+    """
+    How much a call matters when the API budget is scarce (lower is more urgent).
+
+    ``CRITICAL`` is for work that must not stall, such as marking orders
+    shipped; ``INTERACTIVE`` for a user waiting on the answer; ``NORMAL`` is
+    the default; ``BULK`` is background syncing that can wait.
+    """
+
+    CRITICAL = 0
+    INTERACTIVE = 1
+    NORMAL = 2
+    BULK = 3
+
+
+_active_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "ebay_rest_active_priority", default=Priority.NORMAL
+)
+
+
+def current_priority() -> Priority:
+    """Return the priority of calls made from the current thread or task."""
+    return _active_priority.get()
+
+
+@contextmanager
+def use_priority(priority: Priority) -> Iterator[Priority]:
+    """
+    Tag every call made inside the block with a priority.
+
+    ::
+
+        with use_priority(Priority.BULK):
+            for page in paginate(client.inventory.list_inventory_items):
+                ...
+
+    Args:
+        priority: Priority for calls in this thread/task
+
+    Yields:
+        The active priority
+    """
+    reset_token = _active_priority.set(Priority(priority))
+    try:
+        yield priority
+    finally:
+        _active_priority.reset(reset_token)
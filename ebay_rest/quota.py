@@ -0,0 +1,258 @@
+"""Daily call budgets per API family, persisted across restarts."""
+
+import datetime
+import math
+import threading
+import time
+from typing import Callable, Mapping, Optional
+
+from ebay_rest._sqlite import ConnectionPerThread, write_transaction
+from ebay_rest.errors import QuotaExhausted
+from ebay_rest.priority import Priority, current_priority
+
+# (calls used today, blocked until timestamp)
+_Usage = tuple[int, float]
+
+
+class QuotaLedger:
+    """
+    Counts calls per API family per day and decides which calls may still go out.
+
+    eBay's call limits are daily and per application. Once a family's limit is
+    reached every call comes back as 429 until the reset, so the ledger holds
+    calls back locally, by priority, before that happens:
+
+    - ``BULK`` calls stop at ``defer_bulk_at`` of the limit,
+    - ``INTERACTIVE`` and ``NORMAL`` calls stop at the limit minus ``reserve``,
+    - ``CRITICAL`` calls may use the reserve, up to the limit itself.
+
+    From ``stale_at`` of the limit onward, cached GETs are served even after
+    they expire (up to ``stale_ttl`` late) instead of spending calls.
+
+    With a ``path`` the counts live in a SQLite file, so they survive restarts
+    and every process on the host draws on the same budget. Families without a
+    limit are counted but never held back.
+
+    ::
+
+        ledger = QuotaLedger({"buy.browse": 5000, "sell.fulfillment": 2500}, path="quota.db")
+        client = EbayClient(client_id, client_secret, quota=ledger)
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, int],
+        path: Optional[str] = None,
+        reserve: float = 0.05,
+        defer_bulk_at: float = 0.85,
+        stale_at: float = 0.75,
+        stale_ttl: float = 86400.0,
+        timezone: datetime.tzinfo = datetime.timezone.utc,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize quota ledger.
+
+        Args:
+            limits: Daily call limit per API family (see metrics.api_family)
+            path: SQLite file for persistent, host-wide counts (default: in memory)
+            reserve: Fraction of each limit kept for CRITICAL calls (default: 0.05)
+            defer_bulk_at: Fraction of a limit after which BULK calls are refused
+                (default: 0.85)
+            stale_at: Fraction of a limit after which expired cache entries are
+                served (default: 0.75)
+            stale_ttl: Seconds cached responses are kept past expiry for that
+                purpose (default: one day)
+            timezone: Timezone whose midnight resets the quota (default: UTC)
+            clock: Wall clock, shared across processes
+        """
+        for name, value in (
+            ("reserve", reserve),
+            ("defer_bulk_at", defer_bulk_at),
+            ("stale_at", stale_at),
+        ):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        self.limits = dict(limits)
+        self.reserve = reserve
+        self.defer_bulk_at = defer_bulk_at
+        self.stale_at = stale_at
+        self.stale_ttl = stale_ttl
+        self.timezone = timezone
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._usage: dict[tuple[str, str], _Usage] = {}
+        self._connections: Optional[ConnectionPerThread] = None
+        if path is not None:
+            self._connections = ConnectionPerThread(path)
+            with self._connections.get() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS quota_usage ("
+                    "family TEXT NOT NULL, day TEXT NOT NULL, used INTEGER NOT NULL, "
+                    "blocked_until REAL NOT NULL, PRIMARY KEY (family, day))"
+                )
+                conn.execute("DELETE FROM quota_usage WHERE day < ?", (self._day(self._clock()),))
+
+    def _day(self, now: float) -> str:
+        return datetime.datetime.fromtimestamp(now, self.timezone).date().isoformat()
+
+    def seconds_until_reset(self) -> float:
+        """Return the seconds left until the quota resets at midnight."""
+        now = datetime.datetime.fromtimestamp(self._clock(), self.timezone)
+        midnight = datetime.datetime.combine(
+            now.date() + datetime.timedelta(days=1), datetime.time(), tzinfo=self.timezone
+        )
+        return (midnight - now).total_seconds()
+
+    def ceiling(self, family: str, priority: Priority = Priority.NORMAL) -> Optional[int]:
+        """
+        Return how many calls a family may use today before refusing a priority.
+
+        Args:
+            family: API family
+            priority: Call priority
+
+        Returns:
+            Call count, or None if the family has no limit
+        """
+        limit = self.limits.get(family)
+        if limit is None:
+            return None
+        if priority <= Priority.CRITICAL:
+            return limit
+        if priority >= Priority.BULK:
+            return math.floor(limit * min(self.defer_bulk_at, 1.0 - self.reserve))
+        return math.floor(limit * (1.0 - self.reserve))
+
+    def acquire(self, family: str, priority: Optional[Priority] = None) -> int:
+        """
+        Count one call against today's budget, or refuse it.
+
+        Args:
+            family: API family of the call
+            priority: Call priority (default: the active one, see use_priority)
+
+        Returns:
+            Calls used today, including this one
+
+        Raises:
+            QuotaExhausted: If the call must not be sent
+        """
+        if priority is None:
+            priority = current_priority()
+        ceiling = self.ceiling(family, priority)
+        now = self._clock()
+
+        def consume(used: int, blocked_until: float) -> _Usage:
+            if blocked_until > now:
+                raise QuotaExhausted(
+                    f"eBay throttled {family}; holding calls for {blocked_until - now:.0f}s",
+                    family=family,
+                    priority=priority,
+                    retry_after=math.ceil(blocked_until - now),
+                )
+            if ceiling is not None and used >= ceiling:
+                raise QuotaExhausted(
+                    f"{family} has used {used} of {self.limits[family]} calls today; "
+                    f"{priority.name} calls are held until the reset",
+                    family=family,
+                    priority=priority,
+                    retry_after=math.ceil(self.seconds_until_reset()),
+                )
+            return used + 1, blocked_until
+
+        return self._update(family, self._day(now), consume)[0]
+
+    def block(self, family: str, seconds: float) -> None:
+        """
+        Hold every call to a family for a while, e.g. after a 429 with Retry-After.
+
+        Args:
+            family: API family
+            seconds: How long to refuse calls
+        """
+        now = self._clock()
+        self._update(family, self._day(now), lambda used, until: (used, max(until, now + seconds)))
+
+    def set_used(self, family: str, used: int) -> None:
+        """
+        Overwrite today's count, e.g. with eBay's own figure from the Analytics API.
+
+        Args:
+            family: API family
+            used: Calls eBay has counted today
+        """
+        self._update(family, self._day(self._clock()), lambda _, until: (used, until))
+
+    def used(self, family: str) -> int:
+        """Return the calls a family has used today."""
+        return self._read(self._day(self._clock())).get(family, (0, 0.0))[0]
+
+    def usage(self, family: str) -> float:
+        """Return the fraction of a family's limit used today (0.0 if unlimited)."""
+        limit = self.limits.get(family)
+        if not limit:
+            return 0.0
+        return self.used(family) / limit
+
+    def prefer_stale(self, family: str) -> bool:
+        """Return True if expired cache entries should be served instead of calling eBay."""
+        return family in self.limits and self.usage(family) >= self.stale_at
+
+    def stats(self) -> dict[str, dict[str, Optional[int]]]:
+        """
+        Report today's usage.
+
+        Returns:
+            Per family: ``used``, ``limit`` and ``remaining`` (None if unlimited)
+        """
+        usage = self._read(self._day(self._clock()))
+        report = {}
+        for family in sorted(set(usage) | set(self.limits)):
+            used = usage.get(family, (0, 0.0))[0]
+            limit = self.limits.get(family)
+            report[family] = {
+                "used": used,
+                "limit": limit,
+                "remaining": None if limit is None else max(limit - used, 0),
+            }
+        return report
+
+    def close(self) -> None:
+        """Close the ledger file."""
+        if self._connections is not None:
+            self._connections.close()
+
+    def _update(self, family: str, day: str, change: Callable[[int, float], _Usage]) -> _Usage:
+        """Apply a read-modify-write to one family's counts atomically."""
+        if self._connections is None:
+            with self._lock:
+                usage = change(*self._usage.get((family, day), (0, 0.0)))
+                if (family, day) not in self._usage:
+                    # First call of a new day: forget earlier days
+                    self._usage = {
+                        key: value for key, value in self._usage.items() if key[1] >= day
+                    }
+                self._usage[(family, day)] = usage
+            return usage
+        with write_transaction(self._connections.get()) as conn:
+            row = conn.execute(
+                "SELECT used, blocked_until FROM quota_usage WHERE family = ? AND day = ?",
+                (family, day),
+            ).fetchone()
+            usage = change(*(row or (0, 0.0)))
+            conn.execute(
+                "INSERT OR REPLACE INTO quota_usage (family, day, used, blocked_until) "
+                "VALUES (?, ?, ?, ?)",
+                (family, day, *usage),
+            )
+        return usage
+
+    def _read(self, day: str) -> dict[str, _Usage]:
+        if self._connections is None:
+            with self._lock:
+                return {family: usage for (family, d), usage in self._usage.items() if d == day}
+        rows = self._connections.get().execute(
+            "SELECT family, used, blocked_until FROM quota_usage WHERE day = ?", (day,)
+        )
+        return {family: (used, blocked_until) for family, used, blocked_until in rows}
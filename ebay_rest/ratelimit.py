@@ -0,0 +1,245 @@
+"""Request rate limiting, in one process or shared by every process on a host."""
+
+import math
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol, runtime_checkable
+
+from ebay_rest._sqlite import ConnectionPerThread, write_transaction
+from ebay_rest.deadline import time_remaining
+from ebay_rest.errors import DeadlineExceeded, RateLimitExceeded
+
+
+@runtime_checkable
+class RateLimiter(Protocol):
+    """
+    Paces requests to a sustained rate.
+
+    ``acquire()`` blocks until the caller may send and returns the seconds it
+    waited. Anything with this method can be passed as
+    ``BaseClient(rate_limiter=...)``.
+    """
+
+    def acquire(self, cost: float = 1.0) -> float:
+        ...
+
+
+def _reserve(
+    tokens: float,
+    updated: float,
+    now: float,
+    rate: float,
+    burst: float,
+    cost: float,
+    max_wait: Optional[float],
+) -> tuple[float, float]:
+    """
+    Take ``cost`` tokens from a bucket, going into debt if it is short.
+
+    Returns:
+        Tokens left (negative while in debt) and seconds to wait before sending
+
+    Raises:
+        RateLimitExceeded: If the wait would exceed max_wait; nothing is taken
+        DeadlineExceeded: If the wait would outlast the active deadline; nothing is taken
+    """
+    tokens = min(burst, tokens + max(now - updated, 0.0) * rate) - cost
+    wait = -tokens / rate if tokens < 0 else 0.0
+    left = time_remaining()
+    if left is not None and wait > left:
+        raise DeadlineExceeded(f"Rate limit of {rate:g}/s would delay this call past its deadline")
+    if max_wait is not None and wait > max_wait:
+        raise RateLimitExceeded(
+            f"Rate limit of {rate:g}/s would delay this call {wait:.2f}s",
+            retry_after=math.ceil(wait),
+        )
+    return tokens, wait
+
+
+class TokenBucket:
+    """
+    Token bucket for the threads of one process.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Each call takes one;
+    when the bucket is short the call reserves its token ahead of time and
+    sleeps until it is due, so waiting callers go out in arrival order at
+    exactly ``rate``.
+
+    ::
+
+        client = EbayClient(client_id, client_secret, rate_limiter=TokenBucket(rate=20))
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        max_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Calls per second
+            burst: Calls allowed back to back after an idle spell (default: rate, at least 1)
+            max_wait: Longest a call may wait; longer waits raise RateLimitExceeded
+                without sending (default: wait as long as it takes)
+            clock: Monotonic clock
+            sleep: Sleep function
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Wait until a call may be sent.
+
+        Args:
+            cost: Tokens the call uses (default: 1)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait
+            DeadlineExceeded: If the wait would outlast the active deadline
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens, wait = _reserve(
+                self._tokens, self._updated, now, self.rate, self.burst, cost, self.max_wait
+            )
+            self._updated = now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def export_state(self) -> dict[str, Any]:
+        """
+        Return the bucket's level for a warm-start snapshot.
+
+        Returns:
+            Dictionary with the ``tokens`` left now (negative while in debt)
+        """
+        with self._lock:
+            now = self._clock()
+            tokens = min(self.burst, self._tokens + max(now - self._updated, 0.0) * self.rate)
+            return {"tokens": tokens}
+
+    def restore_state(self, state: dict[str, Any], elapsed: float = 0.0) -> bool:
+        """
+        Start from a level exported by ``export_state()``, so a restart cannot reset the burst.
+
+        Args:
+            state: Output of export_state()
+            elapsed: Seconds since the state was exported, refilled at ``rate``
+
+        Returns:
+            True if the level was adopted
+        """
+        tokens = state.get("tokens")
+        if not isinstance(tokens, (int, float)):
+            return False
+        with self._lock:
+            self._tokens = min(self.burst, tokens + max(elapsed, 0.0) * self.rate)
+            self._updated = self._clock()
+        return True
+
+
+class SharedTokenBucket:
+    """
+    Token bucket kept in a SQLite file, shared by every process that opens it.
+
+    Processes on one host calling under a single eBay application draw on one
+    bucket, so their combined rate stays at ``rate`` however many of them are
+    running, and an idle process leaves its share to the busy ones. Each call
+    reserves its token in a short write transaction and sleeps outside it.
+    Buckets are keyed by ``name``, so one file can hold several.
+
+    ::
+
+        limiter = SharedTokenBucket("/var/run/myapp/ebay-rate.db", rate=50)
+        client = EbayClient(client_id, client_secret, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        burst: Optional[float] = None,
+        name: str = "default",
+        max_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize shared token bucket.
+
+        Args:
+            path: SQLite file shared by the cooperating processes
+            rate: Calls per second across all of them
+            burst: Calls allowed back to back after an idle spell (default: rate, at least 1)
+            name: Bucket name within the file (default: "default")
+            max_wait: Longest a call may wait; longer waits raise RateLimitExceeded
+                without sending (default: wait as long as it takes)
+            clock: Wall clock, shared across processes
+            sleep: Sleep function
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.name = name
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._connections = ConnectionPerThread(path)
+        with self._connections.get() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Wait until a call may be sent.
+
+        Args:
+            cost: Tokens the call uses (default: 1)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait
+            DeadlineExceeded: If the wait would outlast the active deadline
+        """
+        with write_transaction(self._connections.get()) as conn:
+            now = self._clock()
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens, wait = _reserve(
+                *(row or (self.burst, now)), now, self.rate, self.burst, cost, self.max_wait
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (self.name, tokens, now),
+            )
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def close(self) -> None:
+        """Close this process's connections to the bucket file."""
+        self._connections.close()
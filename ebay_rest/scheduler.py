@@ -0,0 +1,199 @@
+"""Priority-aware admission of requests sharing one client."""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Mapping, Optional
+
+from ebay_rest.deadline import time_remaining
+from ebay_rest.errors import DeadlineExceeded
+from ebay_rest.priority import Priority, current_priority
+
+DEFAULT_WEIGHTS = {
+    Priority.CRITICAL: 16,
+    Priority.INTERACTIVE: 8,
+    Priority.NORMAL: 3,
+    Priority.BULK: 1,
+}
+
+
+class _Waiter:
+    __slots__ = ("priority", "tag", "event", "queued_at")
+
+    def __init__(self, priority: Priority, tag: float):
+        self.priority = priority
+        self.tag = tag
+        self.event = threading.Event()
+        self.queued_at = time.perf_counter()
+
+
+class RequestScheduler:
+    """
+    Decides which waiting request goes out next when calls exceed the concurrency cap.
+
+    Up to ``max_concurrency`` requests run at once. When more are waiting,
+    slots go out by weighted fair queuing: each class gets a share of
+    dispatches proportional to its weight, so bulk work keeps moving but
+    cannot crowd out interactive calls. ``class_limits`` caps how many calls
+    of one class may run at once.
+
+    Bulk calls are preemptible: CRITICAL and INTERACTIVE calls do not count
+    in-flight BULK calls against ``max_concurrency`` and start at once. No new
+    BULK or NORMAL call starts until the total is back under the cap, so
+    bulk jobs yield between requests rather than abandoning ones already
+    sent.
+
+    ::
+
+        scheduler = RequestScheduler(max_concurrency=16, class_limits={Priority.BULK: 8})
+        client = EbayClient(client_id, client_secret, scheduler=scheduler)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        weights: Optional[Mapping[Priority, float]] = None,
+        class_limits: Optional[Mapping[Priority, int]] = None,
+        preempt_bulk: bool = True,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Requests allowed in flight at once (default: 10;
+                match the transport's pool_maxsize)
+            weights: Relative dispatch share per priority (default: CRITICAL 16,
+                INTERACTIVE 8, NORMAL 3, BULK 1)
+            class_limits: Most requests of a priority in flight at once (default:
+                no per-class limit)
+            preempt_bulk: Let CRITICAL and INTERACTIVE calls start while bulk
+                calls hold the slots (default: True)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self.max_concurrency = max_concurrency
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        if any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError("weights must be > 0")
+        self.class_limits = dict(class_limits or {})
+        self.preempt_bulk = preempt_bulk
+        self._lock = threading.Lock()
+        self._queues: dict[Priority, deque[_Waiter]] = {priority: deque() for priority in Priority}
+        self._in_flight = {priority: 0 for priority in Priority}
+        self._total = 0
+        # Start-time fair queuing: virtual time and each class's last finish tag
+        self._virtual_time = 0.0
+        self._last_tag = {priority: 0.0 for priority in Priority}
+        self._dispatched = {priority: 0 for priority in Priority}
+        self._waited = {priority: 0.0 for priority in Priority}
+
+    @contextmanager
+    def slot(self, priority: Optional[Priority] = None) -> Iterator[Priority]:
+        """
+        Hold a request slot for the duration of the block.
+
+        Args:
+            priority: Request priority (default: the active one, see use_priority)
+
+        Yields:
+            The priority the slot was granted at
+        """
+        priority = self.acquire(priority)
+        try:
+            yield priority
+        finally:
+            self.release(priority)
+
+    def acquire(self, priority: Optional[Priority] = None) -> Priority:
+        """
+        Wait for a request slot.
+
+        Args:
+            priority: Request priority (default: the active one)
+
+        Returns:
+            The priority to pass to release()
+
+        Raises:
+            DeadlineExceeded: If the active deadline passes before a slot is free
+        """
+        priority = Priority(current_priority() if priority is None else priority)
+        with self._lock:
+            tag = max(self._virtual_time, self._last_tag[priority]) + 1.0 / self.weights[priority]
+            self._last_tag[priority] = tag
+            if self._can_start(priority) and not any(self._queues.values()):
+                self._start(priority, tag, 0.0)
+                return priority
+            waiter = _Waiter(priority, tag)
+            self._queues[priority].append(waiter)
+            self._dispatch()
+        if waiter.event.wait(time_remaining()):
+            return priority
+        with self._lock:
+            # Dispatched between the timeout and taking the lock: the slot is ours
+            if waiter.event.is_set():
+                return priority
+            self._queues[priority].remove(waiter)
+        raise DeadlineExceeded(
+            f"Deadline passed waiting for a {priority.name.lower()} request slot"
+        )
+
+    def release(self, priority: Priority) -> None:
+        """Free a slot taken by acquire()."""
+        with self._lock:
+            self._in_flight[priority] -= 1
+            self._total -= 1
+            self._dispatch()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Report per-priority scheduling state.
+
+        Returns:
+            Per priority name: ``in_flight``, ``queued``, ``dispatched`` and
+            ``mean_wait`` seconds
+        """
+        with self._lock:
+            return {
+                priority.name.lower(): {
+                    "in_flight": self._in_flight[priority],
+                    "queued": len(self._queues[priority]),
+                    "dispatched": self._dispatched[priority],
+                    "mean_wait": self._waited[priority] / max(self._dispatched[priority], 1),
+                }
+                for priority in Priority
+            }
+
+    def _can_start(self, priority: Priority) -> bool:
+        limit = self.class_limits.get(priority)
+        if limit is not None and self._in_flight[priority] >= limit:
+            return False
+        total = self._total
+        if self.preempt_bulk and priority <= Priority.INTERACTIVE:
+            total -= self._in_flight[Priority.BULK]
+        return total < self.max_concurrency
+
+    def _start(self, priority: Priority, tag: float, waited: float) -> None:
+        self._virtual_time = max(self._virtual_time, tag - 1.0 / self.weights[priority])
+        self._in_flight[priority] += 1
+        self._total += 1
+        self._dispatched[priority] += 1
+        self._waited[priority] += waited
+
+    def _dispatch(self) -> None:
+        """Start queued waiters, smallest finish tag first, while slots allow. Lock held."""
+        while True:
+            best: Optional[_Waiter] = None
+            for priority, queue in self._queues.items():
+                if (
+                    queue
+                    and self._can_start(priority)
+                    and (best is None or queue[0].tag < best.tag)
+                ):
+                    best = queue[0]
+            if best is None:
+                return
+            self._queues[best.priority].popleft()
+            self._start(best.priority, best.tag, time.perf_counter() - best.queued_at)
+            best.event.set()
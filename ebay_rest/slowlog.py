@@ -0,0 +1,172 @@
+"""Slow-call detection with sanitized logging and sampled payload capture."""
+
+import json
+import logging
+import random
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Any, Optional
+
+from ebay_rest.hooks import AFTER_RESPONSE, ON_ERROR, HookRegistry, RequestEvent
+from ebay_rest.metrics import endpoint_template
+from ebay_rest.utils import logger as sdk_logger
+from ebay_rest.utils import sanitize_credentials
+
+
+class SlowRequestLog:
+    """
+    Log eBay calls that take longer than a threshold.
+
+    Each slow call is logged at WARNING with its endpoint, status, duration,
+    response size, phase timings (when metrics are enabled) and its query
+    params masked with ``utils.sanitize_credentials``. Headers are never
+    logged. A sample of slow calls can also have their full request and
+    response payloads written as JSON lines to a rotating local file.
+
+    ::
+
+        slowlog = SlowRequestLog(
+            threshold=2.0,
+            thresholds={"GET /buy/browse/v1/item_summary/search": 5.0},
+            capture_path="slow_calls.jsonl",
+            sample_rate=0.1,
+        ).install(client.base_client.hooks)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        thresholds: Optional[dict[str, float]] = None,
+        logger: Optional[logging.Logger] = None,
+        capture_path: Optional[str] = None,
+        sample_rate: float = 0.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize slow-call log.
+
+        Args:
+            threshold: Default threshold in seconds (default: 1.0)
+            thresholds: Per-endpoint thresholds keyed by endpoint template with or
+                without the method, e.g. ``"GET /sell/fulfillment/v1/order/{id}"``
+                or ``"/buy/browse/v1/item_summary/search"``
+            logger: Logger for slow-call records (default: the SDK logger)
+            capture_path: File receiving sampled full payloads as JSON lines
+                (default: no capture)
+            sample_rate: Fraction of slow calls whose payloads are captured (0 to 1)
+            max_bytes: Rotate the capture file at this size (default: 10 MiB)
+            backup_count: Rotated capture files to keep (default: 5)
+            seed: Seed for the sampling RNG (for reproducible tests)
+        """
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.logger = logger or sdk_logger
+        self.sample_rate = sample_rate
+        self.slow_calls = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._capture: Optional[logging.Logger] = None
+        if capture_path is not None:
+            # Standalone logger so captured payloads never reach application handlers
+            self._capture = logging.Logger("ebay_rest.slowlog.capture")
+            self._capture.propagate = False
+            handler = RotatingFileHandler(
+                capture_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._capture.addHandler(handler)
+
+    def install(self, hooks: HookRegistry) -> "SlowRequestLog":
+        """Register the slow-call hooks; returns self for chaining."""
+        hooks.register(AFTER_RESPONSE, self._after_response)
+        hooks.register(ON_ERROR, self._on_error)
+        return self
+
+    def uninstall(self, hooks: HookRegistry) -> None:
+        """Remove the slow-call hooks."""
+        hooks.unregister(AFTER_RESPONSE, self._after_response)
+        hooks.unregister(ON_ERROR, self._on_error)
+
+    def close(self) -> None:
+        """Close the capture file."""
+        if self._capture is not None:
+            for handler in list(self._capture.handlers):
+                handler.close()
+                self._capture.removeHandler(handler)
+
+    def threshold_for(self, endpoint: str) -> float:
+        """Return the threshold for an endpoint template such as ``GET /x/{id}``."""
+        if endpoint in self.thresholds:
+            return self.thresholds[endpoint]
+        return self.thresholds.get(endpoint.partition(" ")[2], self.threshold)
+
+    def _after_response(self, event: RequestEvent) -> None:
+        self._check(event)
+
+    def _on_error(self, event: RequestEvent) -> None:
+        if event.response is None:
+            # Calls with a response were already checked in after_response
+            self._check(event)
+
+    def _check(self, event: RequestEvent) -> None:
+        endpoint = endpoint_template(event.method, event.path)
+        threshold = self.threshold_for(endpoint)
+        if event.elapsed is None or event.elapsed < threshold:
+            return
+
+        record = self._record(event, endpoint, threshold)
+        with self._lock:
+            self.slow_calls += 1
+            capture = self._capture is not None and self._random.random() < self.sample_rate
+        self.logger.warning(
+            "Slow eBay call %s took %.3fs (threshold %.3fs): "
+            "status=%s bytes_in=%s phases=%s params=%s",
+            endpoint,
+            event.elapsed,
+            threshold,
+            record["status"],
+            record["bytes_in"],
+            record["phases"],
+            record["params"],
+            extra={"ebay_rest_slow_call": record},
+        )
+        if capture:
+            self._capture.info(json.dumps(dict(record, **self._payloads(event)), default=str))
+
+    def _record(self, event: RequestEvent, endpoint: str, threshold: float) -> dict[str, Any]:
+        response = event.response
+        content = getattr(response, "content", None) or b""
+        phases = event.timing.phases if event.timing is not None else {}
+        return {
+            "time": time.time(),
+            "endpoint": endpoint,
+            "path": event.path,
+            "status": event.status_code,
+            "elapsed": round(event.elapsed, 6),
+            "threshold": threshold,
+            "attempts": event.attempt,
+            "bytes_in": len(content),
+            "phases": {phase: round(seconds, 6) for phase, seconds in phases.items()},
+            "params": sanitize_credentials(event.params) if event.params else {},
+            "error": repr(event.error) if event.error is not None else None,
+        }
+
+    def _payloads(self, event: RequestEvent) -> dict[str, Any]:
+        response_body: Any = None
+        text = getattr(event.response, "text", None)
+        if text:
+            try:
+                response_body = json.loads(text)
+            except ValueError:
+                response_body = text
+        return {
+            "request_json": _sanitize(event.json),
+            "response_body": _sanitize(response_body),
+        }
+
+
+def _sanitize(payload: Any) -> Any:
+    return sanitize_credentials(payload) if isinstance(payload, dict) else payload
@@ -0,0 +1,62 @@
+"""Compact on-disk snapshots of reusable client state for warm starts."""
+
+import gzip
+import json
+import os
+import tempfile
+from typing import Any, Optional
+
+from ebay_rest.utils import logger
+
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot(path: str, state: dict[str, Any]) -> None:
+    """
+    Write a snapshot as gzipped JSON with owner-only permissions.
+
+    The file holds bearer tokens, so it is created ``0600`` and replaced
+    atomically; a reader never sees a half-written snapshot.
+
+    Args:
+        path: Destination file
+        state: JSON-serializable snapshot (see EbayClient.snapshot)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    # mkstemp creates the file 0600
+    fd, tmp_path = tempfile.mkstemp(prefix=".ebay-snapshot-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+            f.write(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path: str) -> Optional[dict[str, Any]]:
+    """
+    Read a snapshot written by ``write_snapshot()``.
+
+    A missing, unreadable or incompatible file is not an error: the client
+    simply starts cold.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Snapshot dictionary, or None if there is nothing usable
+    """
+    try:
+        with gzip.open(path, "rb") as f:
+            state = json.loads(f.read().decode("utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable client snapshot %s: %s", path, e)
+        return None
+    if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+        logger.warning("Ignoring client snapshot %s with unsupported version", path)
+        return None
+    return state
@@ -0,0 +1,6 @@
+"""Local stand-in for the eBay REST APIs, for tests, benchmarks and load tests."""
+
+from ebay_rest.testing.api import FakeEbayApi
+from ebay_rest.testing.server import FakeEbayServer
+
+__all__ = ["FakeEbayApi", "FakeEbayServer"]
@@ -0,0 +1,3 @@
+from ebay_rest.testing.server import main
+
+main()
@@ -0,0 +1,509 @@
+"""In-process fake of the eBay REST endpoints the SDK covers."""
+
+import random
+import re
+import threading
+import time
+import uuid
+from bisect import bisect_right, insort
+from typing import Any, Callable, Mapping, Optional
+from urllib.parse import unquote, urlencode
+
+from ebay_rest.testing import data
+from ebay_rest.transport import FakeRequest, FakeTransport, TransportResponse
+
+TOKEN_PATH = "/identity/v1/oauth2/token"
+MAX_BULK_REQUESTS = 25
+
+
+class FakeEbayApi:
+    """
+    Stateful stand-in for the Browse, Fulfillment, Inventory, Account and OAuth APIs.
+
+    Browse items, orders and the initial inventory are generated from their
+    index on demand, so a dataset of millions of records costs no memory until
+    it is paged through. Inventory writes (PUT, DELETE, bulk) are kept in
+    memory on top of the generated items.
+
+    API endpoints can be slowed down and made to fail at random to exercise
+    retries and throttling; the OAuth token endpoint only gets the latency.
+    The object is thread-safe and can be served over HTTP with FakeEbayServer
+    or used in-process through ``transport()``.
+    """
+
+    def __init__(
+        self,
+        items: int = 1000,
+        orders: int = 1000,
+        inventory_items: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        token_ttl: int = 7200,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize fake eBay API.
+
+        Args:
+            items: Number of Browse items returned by search (default: 1000)
+            orders: Number of Fulfillment orders (default: 1000)
+            inventory_items: Number of pre-populated inventory items (default: 1000)
+            latency: Seconds added to every response (default: 0)
+            jitter: Extra random delay of up to this many seconds (default: 0)
+            error_rate: Fraction of API requests answered with a 500/503 (default: 0)
+            throttle_rate: Fraction of API requests answered with a 429 (default: 0)
+            token_ttl: ``expires_in`` of issued access tokens in seconds (default: 7200)
+            seed: Seed for latency jitter and fault injection (default: random)
+        """
+        for name, rate in (("error_rate", error_rate), ("throttle_rate", throttle_rate)):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+        self.items = items
+        self.orders = orders
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.token_ttl = token_ttl
+        # Prefix for next/prev links; FakeEbayServer sets it to its own URL
+        self.base_url = ""
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._generated_inventory = inventory_items
+        self._deleted_generated: list[int] = []
+        self._inventory_overrides: dict[str, dict[str, Any]] = {}
+        self._created_skus: list[str] = []
+        self._counters = {"requests": 0, "throttled": 0, "server_errors": 0, "tokens_issued": 0}
+
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., TransportResponse]]] = [
+            ("POST", re.compile(re.escape(TOKEN_PATH) + "$"), self._token),
+            ("GET", re.compile(r"/buy/browse/v1/item_summary/search$"), self._search_items),
+            ("GET", re.compile(r"/buy/browse/v1/item/(?P<item_id>[^/]+)$"), self._get_item),
+            ("GET", re.compile(r"/sell/fulfillment/v1/order$"), self._list_orders),
+            (
+                "GET",
+                re.compile(r"/sell/fulfillment/v1/order/(?P<order_id>[^/]+)$"),
+                self._get_order,
+            ),
+            ("GET", re.compile(r"/sell/inventory/v1/inventory_item$"), self._list_inventory),
+            (
+                "GET",
+                re.compile(r"/sell/inventory/v1/inventory_item/(?P<sku>[^/]+)$"),
+                self._get_inventory,
+            ),
+            (
+                "PUT",
+                re.compile(r"/sell/inventory/v1/inventory_item/(?P<sku>[^/]+)$"),
+                self._put_inventory,
+            ),
+            (
+                "DELETE",
+                re.compile(r"/sell/inventory/v1/inventory_item/(?P<sku>[^/]+)$"),
+                self._delete_inventory,
+            ),
+            (
+                "POST",
+                re.compile(r"/sell/inventory/v1/bulk_create_or_replace_inventory_item$"),
+                self._bulk_inventory,
+            ),
+            ("GET", re.compile(r"/sell/account/v1/privilege$"), self._privilege),
+            ("GET", re.compile(r"/sell/account/v1/return_policy$"), self._return_policies),
+            ("GET", re.compile(r"/sell/account/v1/payment_policy$"), self._payment_policies),
+            ("GET", re.compile(r"/sell/account/v1/fulfillment_policy$"), self._shipping_policies),
+            ("GET", re.compile(r"/sell/account/v1/shipping_policy$"), self._shipping_policies),
+        ]
+
+    @property
+    def inventory_count(self) -> int:
+        """Number of inventory items currently stored."""
+        with self._lock:
+            return (
+                self._generated_inventory - len(self._deleted_generated) + len(self._created_skus)
+            )
+
+    def stats(self) -> dict[str, int]:
+        """
+        Report request counters.
+
+        Returns:
+            Dictionary with ``requests``, ``throttled``, ``server_errors`` and
+            ``tokens_issued`` counts
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def transport(self) -> FakeTransport:
+        """
+        Return a transport that answers BaseClient requests in-process, without sockets.
+
+        App tokens are still fetched over HTTP by OAuth2Client, so pair this with
+        a user access token (or serve the API with FakeEbayServer instead).
+        """
+        return FakeTransport(handler=self._handle_fake_request, record=False)
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        form: Optional[Mapping[str, str]] = None,
+    ) -> TransportResponse:
+        """
+        Answer one request.
+
+        Args:
+            method: HTTP method
+            path: URL path without the query string
+            params: Query parameters
+            json: Parsed JSON body
+            headers: Request headers
+            form: Parsed form body (token endpoint)
+
+        Returns:
+            TransportResponse with an eBay-shaped JSON body
+        """
+        method = method.upper()
+        params = params or {}
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+
+        self._delay()
+        with self._lock:
+            self._counters["requests"] += 1
+
+        path_matched = False
+        for route_method, pattern, view in self._routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            if view == self._token:
+                return self._token(headers, form or {})
+
+            if not headers.get("authorization", "").startswith("Bearer "):
+                return _error(401, 1001, "Invalid access token", domain="OAuth")
+            fault = self._inject_fault()
+            if fault is not None:
+                return fault
+            path_args = {key: unquote(value) for key, value in match.groupdict().items()}
+            return view(params, json, **path_args)
+
+        if path_matched:
+            return _error(405, 2002, f"Method {method} not allowed")
+        return _error(404, 2004, f"Resource not found: {path}")
+
+    # -- fault injection ---------------------------------------------------------------------
+
+    def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _inject_fault(self) -> Optional[TransportResponse]:
+        if not self.throttle_rate and not self.error_rate:
+            return None
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                self._counters["throttled"] += 1
+                response = _error(
+                    429, 2001, "Too many requests. The request limit has been reached."
+                )
+                response.headers["Retry-After"] = "1"
+                return response
+            if roll < self.throttle_rate + self.error_rate:
+                self._counters["server_errors"] += 1
+                return _error(
+                    self._random.choice((500, 503)),
+                    10001,
+                    "System error. Please try again later.",
+                    category="APPLICATION",
+                )
+        return None
+
+    # -- OAuth -------------------------------------------------------------------------------
+
+    def _token(self, headers: Mapping[str, str], form: Mapping[str, str]) -> TransportResponse:
+        if not headers.get("authorization", "").startswith("Basic "):
+            return TransportResponse.from_json(
+                {"error": "invalid_client", "error_description": "client authentication failed"},
+                status_code=401,
+            )
+
+        grant_type = form.get("grant_type")
+        token = f"v^1.1#i^1#fake#{uuid.uuid4().hex}"
+        if grant_type == "client_credentials":
+            body = {"access_token": token, "token_type": "Application Access Token"}
+        elif grant_type == "refresh_token" and form.get("refresh_token"):
+            body = {"access_token": token, "token_type": "User Access Token"}
+        elif grant_type == "authorization_code" and form.get("code"):
+            body = {
+                "access_token": token,
+                "token_type": "User Access Token",
+                "refresh_token": f"v^1.1#r^1#fake#{uuid.uuid4().hex}",
+                "refresh_token_expires_in": 47_304_000,
+            }
+        else:
+            return TransportResponse.from_json(
+                {
+                    "error": "unsupported_grant_type",
+                    "error_description": "grant type not supported",
+                },
+                status_code=400,
+            )
+
+        body["expires_in"] = self.token_ttl
+        with self._lock:
+            self._counters["tokens_issued"] += 1
+        return TransportResponse.from_json(body)
+
+    # -- Browse ------------------------------------------------------------------------------
+
+    def _search_items(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        if not params.get("q") and not params.get("category_ids"):
+            return _error(400, 12001, "The 'q' or 'category_ids' parameter is required")
+        return self._page(
+            "/buy/browse/v1/item_summary/search",
+            params,
+            self.items,
+            lambda offset, stop: [data.item_summary(i) for i in range(offset, stop)],
+            items_key="itemSummaries",
+        )
+
+    def _get_item(self, params: Mapping[str, Any], json: Any, item_id: str) -> TransportResponse:
+        index = data.item_index(item_id)
+        if index is None or index >= self.items:
+            return _error(404, 11001, f"The specified item Id {item_id} was not found.")
+        return TransportResponse.from_json(data.item(index))
+
+    # -- Fulfillment -------------------------------------------------------------------------
+
+    def _list_orders(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        return self._page(
+            "/sell/fulfillment/v1/order",
+            params,
+            self.orders,
+            lambda offset, stop: [data.order(i) for i in range(offset, stop)],
+            items_key="orders",
+            max_limit=1000,
+        )
+
+    def _get_order(self, params: Mapping[str, Any], json: Any, order_id: str) -> TransportResponse:
+        index = data.order_index(order_id)
+        if index is None or index >= self.orders:
+            return _error(404, 32100, f"Order {order_id} not found.")
+        return TransportResponse.from_json(data.order(index))
+
+    # -- Inventory ---------------------------------------------------------------------------
+
+    def _list_inventory(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        with self._lock:
+            total = (
+                self._generated_inventory - len(self._deleted_generated) + len(self._created_skus)
+            )
+        return self._page(
+            "/sell/inventory/v1/inventory_item",
+            params,
+            total,
+            self._inventory_slice,
+            items_key="inventoryItems",
+        )
+
+    def _get_inventory(self, params: Mapping[str, Any], json: Any, sku: str) -> TransportResponse:
+        with self._lock:
+            record = self._inventory_record(sku)
+        if record is None:
+            return _error(404, 25710, f"Inventory item {sku} not found.")
+        return TransportResponse.from_json(record)
+
+    def _put_inventory(self, params: Mapping[str, Any], json: Any, sku: str) -> TransportResponse:
+        if not isinstance(json, dict):
+            return _error(400, 25709, "Invalid request body")
+        with self._lock:
+            self._store_inventory(sku, json)
+        return TransportResponse(204)
+
+    def _delete_inventory(
+        self, params: Mapping[str, Any], json: Any, sku: str
+    ) -> TransportResponse:
+        with self._lock:
+            if self._inventory_record(sku) is None:
+                return _error(404, 25710, f"Inventory item {sku} not found.")
+            self._inventory_overrides.pop(sku, None)
+            index = data.inventory_index(sku)
+            if index is not None and index < self._generated_inventory:
+                insort(self._deleted_generated, index)
+            else:
+                self._created_skus.remove(sku)
+        return TransportResponse(204)
+
+    def _bulk_inventory(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        requests = json.get("requests") if isinstance(json, dict) else None
+        if not isinstance(requests, list) or not requests:
+            return _error(400, 25709, "The 'requests' array is required")
+        if len(requests) > MAX_BULK_REQUESTS:
+            return _error(400, 25709, f"A maximum of {MAX_BULK_REQUESTS} requests is allowed")
+
+        responses = []
+        with self._lock:
+            for request in requests:
+                sku = request.get("sku") if isinstance(request, dict) else None
+                item = request.get("inventoryItem") if isinstance(request, dict) else None
+                if not sku or not isinstance(item, dict):
+                    responses.append(
+                        {"statusCode": 400, "sku": sku, "errors": [{"message": "Invalid request"}]}
+                    )
+                    continue
+                self._store_inventory(sku, item)
+                responses.append(
+                    {"statusCode": 200, "sku": sku, "locale": item.get("locale", "en_US")}
+                )
+        return TransportResponse.from_json({"responses": responses})
+
+    def _inventory_record(self, sku: str) -> Optional[dict[str, Any]]:
+        # Caller holds self._lock
+        if sku in self._inventory_overrides:
+            return self._inventory_overrides[sku]
+        index = data.inventory_index(sku)
+        if index is None or index >= self._generated_inventory:
+            return None
+        position = bisect_right(self._deleted_generated, index)
+        if position and self._deleted_generated[position - 1] == index:
+            return None
+        return data.inventory_item(index)
+
+    def _store_inventory(self, sku: str, item: dict[str, Any]) -> None:
+        # Caller holds self._lock
+        index = data.inventory_index(sku)
+        if index is not None and index < self._generated_inventory:
+            position = bisect_right(self._deleted_generated, index)
+            if position and self._deleted_generated[position - 1] == index:
+                del self._deleted_generated[position - 1]
+        elif sku not in self._inventory_overrides:
+            self._created_skus.append(sku)
+        self._inventory_overrides[sku] = {**item, "sku": sku}
+
+    def _inventory_slice(self, offset: int, stop: int) -> list[dict[str, Any]]:
+        with self._lock:
+            live_generated = self._generated_inventory - len(self._deleted_generated)
+            records = []
+            for position in range(offset, stop):
+                if position < live_generated:
+                    index = self._generated_index(position)
+                    sku = data.inventory_sku(index)
+                    records.append(self._inventory_overrides.get(sku) or data.inventory_item(index))
+                elif position - live_generated < len(self._created_skus):
+                    records.append(
+                        self._inventory_overrides[self._created_skus[position - live_generated]]
+                    )
+            return records
+
+    def _generated_index(self, position: int) -> int:
+        # Map a position among the surviving generated items to its dataset index
+        index = position
+        while True:
+            shifted = position + bisect_right(self._deleted_generated, index)
+            if shifted == index:
+                return index
+            index = shifted
+
+    # -- Account -----------------------------------------------------------------------------
+
+    def _privilege(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        return TransportResponse.from_json(data.account_profile())
+
+    def _return_policies(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        return self._policies(params, "returnPolicies", data.return_policies)
+
+    def _payment_policies(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        return self._policies(params, "paymentPolicies", data.payment_policies)
+
+    def _shipping_policies(self, params: Mapping[str, Any], json: Any) -> TransportResponse:
+        response = self._policies(params, "fulfillmentPolicies", data.shipping_policies)
+        if response.status_code == 200:
+            # The SDK reads shippingPolicies; eBay names the collection fulfillmentPolicies
+            body = response.json()
+            body["shippingPolicies"] = body["fulfillmentPolicies"]
+            response = TransportResponse.from_json(body)
+        return response
+
+    def _policies(
+        self,
+        params: Mapping[str, Any],
+        key: str,
+        build: Callable[[str], list[dict[str, Any]]],
+    ) -> TransportResponse:
+        marketplace_id = params.get("marketplace_id")
+        if not marketplace_id:
+            return _error(400, 20401, "The 'marketplace_id' parameter is required")
+        policies = build(str(marketplace_id))
+        return TransportResponse.from_json({key: policies, "total": len(policies)})
+
+    # -- helpers -----------------------------------------------------------------------------
+
+    def _page(
+        self,
+        path: str,
+        params: Mapping[str, Any],
+        total: int,
+        load: Callable[[int, int], list[dict[str, Any]]],
+        items_key: str,
+        max_limit: int = 200,
+    ) -> TransportResponse:
+        try:
+            limit = int(params.get("limit", 50))
+            offset = int(params.get("offset", 0))
+        except (TypeError, ValueError):
+            return _error(400, 12002, "limit and offset must be integers")
+        if not 1 <= limit <= max_limit or offset < 0:
+            return _error(400, 12002, f"limit must be 1-{max_limit} and offset >= 0")
+
+        stop = min(offset + limit, total)
+        body: dict[str, Any] = {
+            "href": self._href(path, params, offset, limit),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            items_key: load(offset, stop) if offset < total else [],
+        }
+        if stop < total:
+            body["next"] = self._href(path, params, stop, limit)
+        if offset > 0:
+            body["prev"] = self._href(path, params, max(offset - limit, 0), limit)
+        return TransportResponse.from_json(body)
+
+    def _href(self, path: str, params: Mapping[str, Any], offset: int, limit: int) -> str:
+        query = {key: value for key, value in params.items() if key not in ("limit", "offset")}
+        query.update(limit=limit, offset=offset)
+        return f"{self.base_url}{path}?{urlencode(query)}"
+
+    def _handle_fake_request(self, request: FakeRequest) -> TransportResponse:
+        params = {key: value for key, value in (request.params or {}).items() if value is not None}
+        return self.handle(request.method, request.path, params, request.json, request.headers)
+
+
+def _error(
+    status_code: int,
+    error_id: int,
+    message: str,
+    domain: str = "API",
+    category: str = "REQUEST",
+) -> TransportResponse:
+    return TransportResponse.from_json(
+        {
+            "errors": [
+                {"errorId": error_id, "domain": domain, "category": category, "message": message}
+            ]
+        },
+        status_code=status_code,
+    )
@@ -0,0 +1,212 @@
+"""Deterministic record generators for the fake eBay API.
+
+Every record is derived from its index, so datasets of any size cost nothing
+until a page of them is requested.
+"""
+
+from typing import Any, Optional
+
+_ITEM_ID_BASE = 110_000_000_000
+_ADJECTIVES = ("Vintage", "Compact", "Wireless", "Heavy Duty", "Refurbished", "Classic", "Portable")
+_NOUNS = ("Camera", "Headphones", "Backpack", "Watch", "Keyboard", "Lamp", "Drill", "Sneakers")
+_CONDITIONS = (("NEW", "1000"), ("USED_EXCELLENT", "3000"), ("FOR_PARTS_OR_NOT_WORKING", "7000"))
+_COLORS = ("Black", "Silver", "Red", "Blue", "Green")
+_FULFILLMENT_STATUSES = ("NOT_STARTED", "IN_PROGRESS", "FULFILLED")
+
+
+def _title(index: int) -> str:
+    adjective = _ADJECTIVES[index % len(_ADJECTIVES)]
+    noun = _NOUNS[(index // len(_ADJECTIVES)) % len(_NOUNS)]
+    return f"{adjective} {noun} #{index}"
+
+
+def _price(index: int) -> dict[str, str]:
+    return {"value": f"{5 + (index * 37) % 995}.{index % 100:02d}", "currency": "USD"}
+
+
+def item_id(index: int) -> str:
+    """Browse item ID for a dataset index."""
+    return f"v1|{_ITEM_ID_BASE + index}|0"
+
+
+def item_index(value: str) -> Optional[int]:
+    """Dataset index for a Browse item ID, or None if it is not a generated ID."""
+    parts = value.split("|")
+    if len(parts) != 3 or parts[0] != "v1" or not parts[1].isdigit():
+        return None
+    index = int(parts[1]) - _ITEM_ID_BASE
+    return index if index >= 0 else None
+
+
+def item_summary(index: int) -> dict[str, Any]:
+    """Browse search result entry."""
+    legacy_id = _ITEM_ID_BASE + index
+    condition, condition_id = _CONDITIONS[index % len(_CONDITIONS)]
+    return {
+        "itemId": item_id(index),
+        "title": _title(index),
+        "price": _price(index),
+        "imageUrl": f"https://i.ebayimg.com/images/g/{legacy_id}/s-l500.jpg",
+        "itemWebUrl": f"https://www.ebay.com/itm/{legacy_id}",
+        "condition": condition,
+        "conditionId": condition_id,
+        "seller": {"username": f"seller_{index % 500}", "feedbackScore": index % 10_000},
+        "buyingOptions": ["FIXED_PRICE"] if index % 4 else ["AUCTION"],
+        "categories": [{"categoryId": str(9355 + index % 50)}],
+        "itemLocation": {"country": "US", "postalCode": f"{10000 + index % 89_999}"},
+    }
+
+
+def item(index: int) -> dict[str, Any]:
+    """Browse item detail."""
+    summary = item_summary(index)
+    return {
+        "itemId": summary["itemId"],
+        "legacyItemId": str(_ITEM_ID_BASE + index),
+        "title": summary["title"],
+        "price": summary["price"],
+        "description": f"Generated listing {index} for load testing.",
+        "itemWebUrl": summary["itemWebUrl"],
+        "condition": summary["condition"],
+        "conditionId": summary["conditionId"],
+        "categoryPath": "Electronics|Cameras & Photo",
+        "brand": "Acme",
+        "seller": summary["seller"],
+        "buyingOptions": summary["buyingOptions"],
+        "itemLocation": summary["itemLocation"],
+        "imageUrls": [{"imageUrl": summary["imageUrl"]}],
+        "itemAspects": [{"name": "Color", "value": _COLORS[index % len(_COLORS)]}],
+    }
+
+
+def order_id(index: int) -> str:
+    """Fulfillment order ID for a dataset index."""
+    return f"{10 + index % 90:02d}-{index:05d}-{(index * 7919) % 100_000:05d}"
+
+
+def order_index(value: str) -> Optional[int]:
+    """Dataset index for an order ID, or None if it is not a generated ID."""
+    parts = value.split("-")
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    index = int(parts[1])
+    return index if order_id(index) == value else None
+
+
+def order(index: int) -> dict[str, Any]:
+    """Fulfillment order."""
+    price = _price(index)
+    quantity = 1 + index % 3
+    total = f"{float(price['value']) * quantity:.2f}"
+    day = 1 + index % 28
+    return {
+        "orderId": order_id(index),
+        "creationDate": f"2024-{1 + index % 12:02d}-{day:02d}T12:00:00.000Z",
+        "lastModifiedDate": f"2024-{1 + index % 12:02d}-{day:02d}T13:00:00.000Z",
+        "orderFulfillmentStatus": _FULFILLMENT_STATUSES[index % len(_FULFILLMENT_STATUSES)],
+        "orderPaymentStatus": "PAID",
+        "cancelStatus": "NONE_REQUESTED",
+        "buyer": {"username": f"buyer_{index % 2000}"},
+        "pricingSummary": {"total": {"value": total, "currency": "USD"}},
+        "lineItems": [
+            {
+                "lineItemId": f"{_ITEM_ID_BASE + index}",
+                "sku": inventory_sku(index),
+                "title": _title(index),
+                "quantity": quantity,
+                "lineItemCost": price,
+                "total": {"value": total, "currency": "USD"},
+                "legacyItemId": str(_ITEM_ID_BASE + index),
+            }
+        ],
+    }
+
+
+def inventory_sku(index: int) -> str:
+    """Inventory SKU for a dataset index."""
+    return f"SKU-{index:08d}"
+
+
+def inventory_index(sku: str) -> Optional[int]:
+    """Dataset index for an inventory SKU, or None if it is not a generated SKU."""
+    if not sku.startswith("SKU-") or not sku[4:].isdigit():
+        return None
+    index = int(sku[4:])
+    return index if inventory_sku(index) == sku else None
+
+
+def inventory_item(index: int) -> dict[str, Any]:
+    """Inventory item."""
+    condition, _ = _CONDITIONS[index % len(_CONDITIONS)]
+    return {
+        "sku": inventory_sku(index),
+        "locale": "en_US",
+        "condition": condition,
+        "product": {
+            "title": _title(index),
+            "description": f"Generated inventory item {index}.",
+            "brand": "Acme",
+            "aspects": {"Color": [_COLORS[index % len(_COLORS)]]},
+            "imageUrls": [f"https://i.ebayimg.com/images/g/{_ITEM_ID_BASE + index}/s-l500.jpg"],
+        },
+        "availability": {"shipToLocationAvailability": {"quantity": index % 50}},
+    }
+
+
+def account_profile() -> dict[str, Any]:
+    """Account privilege response."""
+    return {
+        "accountType": "BUSINESS",
+        "sellerDisplayName": "Fake Seller",
+        "registrationCountry": "US",
+        "sellerRegistrationCompleted": True,
+        "sellingLimit": {"amount": 50_000.0, "currency": "USD", "quantity": 5_000},
+    }
+
+
+def return_policies(marketplace_id: str) -> list[dict[str, Any]]:
+    """Return policies for a marketplace."""
+    return [
+        {
+            "returnPolicyId": "6000000001",
+            "name": "30 day returns",
+            "marketplaceId": marketplace_id,
+            "returnsAccepted": True,
+            "returnPeriod": {"value": 30, "unit": "DAY"},
+            "returnShippingCostPayer": "BUYER",
+        }
+    ]
+
+
+def payment_policies(marketplace_id: str) -> list[dict[str, Any]]:
+    """Payment policies for a marketplace."""
+    return [
+        {
+            "paymentPolicyId": "6100000001",
+            "name": "Immediate payment",
+            "marketplaceId": marketplace_id,
+            "immediatePay": True,
+        }
+    ]
+
+
+def shipping_policies(marketplace_id: str) -> list[dict[str, Any]]:
+    """Shipping policies for a marketplace."""
+    return [
+        {
+            "fulfillmentPolicyId": "6200000001",
+            "shippingPolicyId": "6200000001",
+            "name": "Free standard shipping",
+            "marketplaceId": marketplace_id,
+            "handlingTime": {"value": 1, "unit": "DAY"},
+            "shippingOptions": [
+                {
+                    "costType": "FLAT_RATE",
+                    "optionType": "DOMESTIC",
+                    "shippingServices": [
+                        {"shippingServiceCode": "USPSPriority", "freeShipping": True}
+                    ],
+                }
+            ],
+        }
+    ]
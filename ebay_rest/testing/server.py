@@ -0,0 +1,162 @@
+"""HTTP server exposing FakeEbayApi for load and soak tests."""
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from ebay_rest.testing.api import FakeEbayApi
+from ebay_rest.transport import TransportResponse
+
+
+class _FakeEbayHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler delegating to the server's FakeEbayApi."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_FakeEbayHTTPServer"
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        json_body: Any = None
+        form: Optional[dict[str, str]] = None
+        if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+            form = dict(parse_qsl(body.decode("utf-8")))
+        elif body:
+            try:
+                json_body = json.loads(body)
+            except ValueError:
+                self._write(
+                    TransportResponse.from_json({"errors": [{"message": "Malformed JSON"}]}, 400)
+                )
+                return
+
+        response = self.server.api.handle(
+            self.command, url.path, params, json_body, dict(self.headers.items()), form
+        )
+        self._write(response)
+
+    def _write(self, response: TransportResponse) -> None:
+        self.send_response(response.status_code)
+        for key, value in response.headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(response.content)))
+        self.end_headers()
+        if response.content:
+            self.wfile.write(response.content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _FakeEbayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], api: FakeEbayApi):
+        super().__init__(address, _FakeEbayHandler)
+        self.api = api
+
+
+class FakeEbayServer:
+    """
+    Serve a FakeEbayApi on a local port.
+
+    Point the SDK at it with ``EbayClient(..., base_url=server.url)``; app and
+    user tokens are issued by the fake OAuth endpoint. Usable as a context
+    manager, or from the command line with ``python -m ebay_rest.testing``.
+    """
+
+    def __init__(self, api: Optional[FakeEbayApi] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize fake eBay server.
+
+        Args:
+            api: FakeEbayApi to serve (default: FakeEbayApi())
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one (default: 0)
+        """
+        self.api = api if api is not None else FakeEbayApi()
+        self._httpd = _FakeEbayHTTPServer((host, port), self.api)
+        self._thread: Optional[threading.Thread] = None
+        self.api.base_url = self.url
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. ``http://127.0.0.1:54321``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeEbayServer":
+        """Start serving on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="fake-ebay-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self) -> "FakeEbayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run a fake eBay server from the command line."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the eBay REST APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--items", type=int, default=100_000, help="Browse items in the dataset")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the dataset")
+    parser.add_argument("--inventory", type=int, default=100_000, help="Initial inventory items")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered with 5xx")
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="Fraction answered with 429"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    api = FakeEbayApi(
+        items=args.items,
+        orders=args.orders,
+        inventory_items=args.inventory,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        seed=args.seed,
+    )
+    server = FakeEbayServer(api, host=args.host, port=args.port)
+    print(f"Fake eBay API listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,253 @@
+"""Token vault for serving many sellers from one client."""
+
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.errors import AuthError
+
+
+class TokenStore(Protocol):
+    """Persistent backend for seller token records."""
+
+    def load(self, seller_id: str) -> Optional[dict[str, Any]]:
+        """Return the stored record for a seller, or None if unknown."""
+        ...
+
+    def save(self, seller_id: str, record: dict[str, Any]) -> None:
+        """Insert or replace the record for a seller."""
+        ...
+
+    def delete(self, seller_id: str) -> None:
+        """Remove the record for a seller if present."""
+        ...
+
+
+class InMemoryTokenStore:
+    """Non-persistent TokenStore, mainly for tests and short-lived jobs."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, seller_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(seller_id)
+            return dict(record) if record is not None else None
+
+    def save(self, seller_id: str, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._records[seller_id] = dict(record)
+
+    def delete(self, seller_id: str) -> None:
+        with self._lock:
+            self._records.pop(seller_id, None)
+
+
+class SQLiteTokenStore:
+    """
+    TokenStore backed by a local SQLite file.
+
+    The file holds refresh tokens in plain text and is created with owner-only
+    permissions; keep it on a protected volume.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize SQLite token store.
+
+        Args:
+            path: Database file path (created if missing)
+        """
+        self.path = path
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS seller_tokens ("
+                "seller_id TEXT PRIMARY KEY, record TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def load(self, seller_id: str) -> Optional[dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT record FROM seller_tokens WHERE seller_id = ?", (seller_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, seller_id: str, record: dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO seller_tokens (seller_id, record) VALUES (?, ?)",
+                (seller_id, json.dumps(record)),
+            )
+
+    def delete(self, seller_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM seller_tokens WHERE seller_id = ?", (seller_id,))
+
+
+class TokenVault:
+    """
+    Seller-keyed credential cache in front of a persistent TokenStore.
+
+    Only recently used sellers are kept in memory (bounded LRU); the rest are
+    loaded from the store on demand. Credentials evicted while still in use
+    (e.g. by an ``as_seller()`` view) are found again rather than reloaded, so
+    each seller has one UserCredentials at a time. Access tokens are refreshed
+    lazily by BaseClient on first use after expiry, one refresh per seller at
+    a time, and every refresh is written back to the store.
+    """
+
+    def __init__(
+        self,
+        store: Optional[TokenStore] = None,
+        max_size: int = 1000,
+        scopes: Optional[list[str]] = None,
+    ):
+        """
+        Initialize token vault.
+
+        Args:
+            store: Persistent backend (default: InMemoryTokenStore)
+            max_size: Maximum number of sellers kept in memory (default: 1000)
+            scopes: Default OAuth scopes for sellers stored without explicit scopes
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+
+        self.store = store if store is not None else InMemoryTokenStore()
+        self.max_size = max_size
+        self.scopes = scopes or []
+        self._cache: OrderedDict[str, UserCredentials] = OrderedDict()
+        # Every credentials object still referenced anywhere, evicted or not
+        self._live: weakref.WeakValueDictionary[str, UserCredentials] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of sellers currently held in memory."""
+        return len(self._cache)
+
+    def __contains__(self, seller_id: object) -> bool:
+        return isinstance(seller_id, str) and (
+            seller_id in self._live or self.store.load(seller_id) is not None
+        )
+
+    def add(
+        self,
+        seller_id: str,
+        refresh_token: str,
+        access_token: Optional[str] = None,
+        expires_at: Optional[float] = None,
+        scopes: Optional[list[str]] = None,
+    ) -> UserCredentials:
+        """
+        Store (or replace) a seller's tokens.
+
+        Credentials already in use for the seller are updated in place.
+
+        Args:
+            seller_id: Identifier for the seller
+            refresh_token: Long-lived refresh token from the consent flow
+            access_token: Optional current access token
+            expires_at: Unix timestamp when access_token expires
+            scopes: OAuth scopes for refresh (default: vault scopes)
+
+        Returns:
+            UserCredentials for the seller
+        """
+        with self._lock:
+            credentials = self._live.get(seller_id)
+            if credentials is None:
+                credentials = self._bind(UserCredentials(seller_id=seller_id))
+            self._remember(seller_id, credentials)
+        with credentials.lock:
+            credentials.access_token = access_token
+            credentials.refresh_token = refresh_token
+            credentials.scopes = scopes or list(self.scopes)
+            credentials.expires_at = expires_at
+            self._persist(credentials)
+        return credentials
+
+    def get(self, seller_id: str) -> UserCredentials:
+        """
+        Get credentials for a seller, loading them from the store if needed.
+
+        Args:
+            seller_id: Identifier for the seller
+
+        Returns:
+            UserCredentials shared by all callers acting for this seller
+
+        Raises:
+            AuthError: If no tokens are stored for the seller
+        """
+        with self._lock:
+            credentials = self._live.get(seller_id)
+            if credentials is not None:
+                self._remember(seller_id, credentials)
+                return credentials
+
+        # Store I/O happens outside the lock so a slow load only holds up its own seller
+        record = self.store.load(seller_id)
+        if record is None:
+            raise AuthError(f"No tokens stored for seller {seller_id!r}")
+
+        loaded = self._bind(
+            UserCredentials(
+                access_token=record.get("access_token"),
+                refresh_token=record.get("refresh_token"),
+                scopes=record.get("scopes") or list(self.scopes),
+                expires_at=record.get("expires_at"),
+                seller_id=seller_id,
+            )
+        )
+        with self._lock:
+            # Another thread may have loaded the seller meanwhile; keep a single copy
+            credentials = self._live.get(seller_id) or loaded
+            self._remember(seller_id, credentials)
+            return credentials
+
+    def remove(self, seller_id: str) -> None:
+        """Forget a seller in memory and in the store."""
+        with self._lock:
+            self._cache.pop(seller_id, None)
+            self._live.pop(seller_id, None)
+        self.store.delete(seller_id)
+
+    def _remember(self, seller_id: str, credentials: UserCredentials) -> None:
+        self._live[seller_id] = credentials
+        self._cache[seller_id] = credentials
+        self._cache.move_to_end(seller_id)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def _bind(self, credentials: UserCredentials) -> UserCredentials:
+        credentials.on_update = self._persist
+        return credentials
+
+    def _persist(self, credentials: UserCredentials) -> None:
+        self.store.save(
+            credentials.seller_id,
+            {
+                "access_token": credentials.access_token,
+                "refresh_token": credentials.refresh_token,
+                "scopes": credentials.scopes,
+                "expires_at": credentials.expires_at,
+            },
+        )
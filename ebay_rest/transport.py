@@ -0,0 +1,428 @@
+"""Pluggable HTTP transports used by BaseClient."""
+
+import json as jsonlib
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional, Protocol, Union
+from urllib.parse import urlencode, urlsplit
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+Timeout = Union[float, tuple[float, float], None]
+
+
+class ResponseLike(Protocol):
+    """What BaseClient reads from a transport response (requests.Response fits)."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    text: str
+
+    def json(self) -> Any:
+        ...
+
+
+class Transport(Protocol):
+    """
+    Sends one HTTP request and returns its response.
+
+    Implementations must be safe to call from many threads at once and raise
+    ``requests.RequestException`` subclasses for network failures so BaseClient
+    maps them to EbayAPIError.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> ResponseLike:
+        ...
+
+    def pool_stats(self) -> dict[str, Any]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class TransportResponse:
+    """Minimal response object for transports that do not return requests.Response."""
+
+    __slots__ = ("status_code", "headers", "content", "elapsed")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+        content: bytes = b"",
+        elapsed: Optional[float] = None,
+    ):
+        """
+        Initialize transport response.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+            content: Raw response body
+            elapsed: Seconds until the response headers arrived, if measured
+        """
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self.elapsed = elapsed
+
+    @classmethod
+    def from_json(
+        cls, data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+    ) -> "TransportResponse":
+        """Build a JSON response (``data`` of None gives an empty body)."""
+        content = jsonlib.dumps(data).encode("utf-8") if data is not None else b""
+        return cls(status_code, headers or {"Content-Type": "application/json"}, content)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+
+class RequestsTransport:
+    """
+    Default transport built on ``requests``.
+
+    ``requests.Session`` is not documented as thread-safe, so each thread gets
+    its own lightweight Session; all of them mount one shared HTTPAdapter, and
+    so share one thread-safe urllib3 connection pool.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_idle_time: Optional[float] = None,
+    ):
+        """
+        Initialize requests transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum keep-alive connections per host; size this to the
+                number of threads sharing the client (default: 10)
+            pool_block: Wait for a free connection instead of opening (and later
+                discarding) extra ones when the pool is exhausted (default: False)
+            max_idle_time: Close pooled connections after the transport has been idle
+                this many seconds, before the server drops them (default: never)
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be >= 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_idle_time = max_idle_time
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._sessions = threading.local()
+        self._last_used = time.monotonic()
+        self._idle_evictions = 0
+        self._pool_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session; all sessions share one connection pool."""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._sessions.session = session
+        return session
+
+    @session.setter
+    def session(self, value: requests.Session) -> None:
+        self._sessions.session = value
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> requests.Response:
+        """Send one request on the calling thread's session."""
+        self._evict_idle_connections()
+        send = getattr(self.session, method.lower())
+        if method in ("GET", "DELETE"):
+            return send(url, params=params, headers=headers, timeout=timeout)
+        return send(url, json=json, headers=headers, timeout=timeout)
+
+    def close_idle_connections(self) -> None:
+        """Close every pooled keep-alive connection; new ones open on demand."""
+        with self._pool_lock:
+            self._adapter.poolmanager.clear()
+            self._idle_evictions += 1
+
+    def pool_stats(self) -> dict[str, Any]:
+        """
+        Report connection pool configuration and per-host usage.
+
+        ``connections_created`` close to ``requests`` means connections are not
+        being reused (pool too small or idle eviction too aggressive).
+
+        Returns:
+            Dictionary with pool settings and a ``hosts`` mapping of
+            ``scheme://host:port`` to idle, created and request counts
+        """
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "idle_evictions": self._idle_evictions,
+            "hosts": _urllib3_host_stats(self._adapter.poolmanager),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._adapter.close()
+
+    def _evict_idle_connections(self) -> None:
+        now = time.monotonic()
+        if self.max_idle_time is not None and now - self._last_used > self.max_idle_time:
+            # Keep-alive connections this old are likely closed server-side already
+            self.close_idle_connections()
+        self._last_used = now
+
+
+class Urllib3Transport:
+    """
+    Lean transport that talks to urllib3 directly.
+
+    Skips requests' per-call Session machinery (settings merging, cookies,
+    hooks), which is measurable overhead at high request rates. urllib3's
+    PoolManager is thread-safe, so one instance serves every thread.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ):
+        """
+        Initialize urllib3 transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum keep-alive connections per host (default: 10)
+            pool_block: Wait for a free connection when the pool is exhausted (default: False)
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be >= 1")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._pool = urllib3.PoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block,
+            retries=False,
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> TransportResponse:
+        """
+        Send one request through the shared pool.
+
+        Raises:
+            requests.Timeout: If the request times out
+            requests.ConnectionError: For other transport failures
+        """
+        if params:
+            query = urlencode(
+                [(key, value) for key, value in params.items() if value is not None], doseq=True
+            )
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+        body = jsonlib.dumps(json).encode("utf-8") if json is not None else None
+
+        if isinstance(timeout, tuple):
+            pool_timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        else:
+            pool_timeout = urllib3.Timeout(total=timeout)
+
+        start = time.perf_counter()
+        try:
+            response = self._pool.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=pool_timeout,
+                retries=False,
+                preload_content=False,
+            )
+            elapsed = time.perf_counter() - start
+            content = response.read()
+            response.release_conn()
+        except urllib3.exceptions.NewConnectionError as e:
+            # Subclasses urllib3's TimeoutError for legacy reasons, but is a refusal
+            raise requests.ConnectionError(str(e)) from e
+        except urllib3.exceptions.TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+
+        return TransportResponse(response.status, response.headers, content, elapsed)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Report pool settings and per-host usage (same shape as RequestsTransport)."""
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "hosts": _urllib3_host_stats(self._pool),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.clear()
+
+
+class FakeRequest:
+    """A request captured by FakeTransport."""
+
+    __slots__ = ("method", "url", "path", "params", "json", "headers", "timeout")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        json: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        timeout: Timeout,
+    ):
+        self.method = method
+        self.url = url
+        self.path = urlsplit(url).path
+        self.params = params
+        self.json = json
+        self.headers = headers or {}
+        self.timeout = timeout
+
+
+class FakeTransport:
+    """
+    In-memory transport for tests and benchmarks; no sockets involved.
+
+    Responses come from routes registered with ``add_response()`` (matched on
+    method and exact path) or, failing that, from ``handler``. Unmatched
+    requests get a 404.
+    """
+
+    def __init__(
+        self,
+        handler: Optional[Callable[[FakeRequest], ResponseLike]] = None,
+        record: bool = True,
+    ):
+        """
+        Initialize fake transport.
+
+        Args:
+            handler: Optional callable producing a response for unrouted requests
+            record: Keep every request in ``requests`` (disable for long benchmarks)
+        """
+        self.handler = handler
+        self.record = record
+        self.requests: list[FakeRequest] = []
+        self._routes: dict[tuple[str, str], ResponseLike] = {}
+
+    def add_response(
+        self,
+        method: str,
+        path: str,
+        json: Any = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Register a canned JSON response.
+
+        Args:
+            method: HTTP method to match
+            path: URL path to match exactly (e.g. "/buy/browse/v1/item/123")
+            json: JSON-serializable body, or None for an empty body
+            status_code: HTTP status code (default: 200)
+            headers: Optional response headers
+        """
+        self._routes[(method.upper(), path)] = TransportResponse.from_json(
+            json, status_code=status_code, headers=headers
+        )
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Timeout = None,
+    ) -> ResponseLike:
+        """Return the routed (or handler-produced) response for a request."""
+        request = FakeRequest(method, url, params, json, headers, timeout)
+        if self.record:
+            self.requests.append(request)
+
+        response = self._routes.get((method, request.path))
+        if response is not None:
+            return response
+        if self.handler is not None:
+            return self.handler(request)
+        return TransportResponse.from_json(
+            {"errors": [{"message": f"No fake route for {method} {request.path}"}]},
+            status_code=404,
+        )
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Fake transports have no pool; report the request count instead."""
+        return {"requests": len(self.requests)}
+
+    def close(self) -> None:
+        pass
+
+
+def _urllib3_host_stats(pool_manager: urllib3.PoolManager) -> dict[str, dict[str, int]]:
+    pools = pool_manager.pools
+    with pools.lock:
+        host_pools = [pools[key] for key in pools.keys()]
+
+    hosts: dict[str, dict[str, int]] = {}
+    for pool in host_pools:
+        idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+        hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+            "idle": idle,
+            "connections_created": pool.num_connections,
+            "requests": pool.num_requests,
+        }
+    return hosts
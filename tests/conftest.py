@@ -1,5 +1,10 @@
 """Pytest configuration and shared fixtures."""
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator, Optional
+
 import pytest
 
 from ebay_rest.auth import OAuth2Client
@@ -8,6 +13,22 @@ from ebay_rest.browse.client import BrowseClient
 from ebay_rest.client import EbayClient
 from ebay_rest.inventory.client import InventoryClient
 from ebay_rest.orders.client import OrdersClient
+from ebay_rest.transport import Transport
+
+
+class FakeClock:
+    """Manually advanced clock; ``sleep`` moves it forward instead of blocking."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
 
 
 @pytest.fixture
@@ -63,6 +84,27 @@ def mock_base_client(mock_oauth_client: OAuth2Client, sandbox_flag: bool) -> Bas
     )
 
 
+@pytest.fixture
+def make_base_client(mock_oauth_client: OAuth2Client) -> Callable[..., BaseClient]:
+    """
+    Return a factory for production BaseClients holding a user token.
+
+    Keyword options are passed to BaseClient; ``user_access_token=None``
+    makes a client that calls with the app token.
+    """
+
+    def make(transport: Optional[Transport] = None, **options: Any) -> BaseClient:
+        options.setdefault("user_access_token", "t")
+        return BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            transport=transport,
+            **options,
+        )
+
+    return make
+
+
 @pytest.fixture
 def mock_ebay_client(test_client_id: str, test_client_secret: str, sandbox_flag: bool) -> EbayClient:
     """
@@ -97,3 +139,47 @@ def mock_orders_client(mock_base_client: BaseClient, sandbox_flag: bool) -> Orde
     """Create a mock OrdersClient for testing."""
     return OrdersClient(base_client=mock_base_client, sandbox=sandbox_flag)
 
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive handler answering every request with {"ok": true}.
+
+    Requests under /echo also get their Authorization header and path back.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _reply(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        payload: dict = {"ok": True}
+        if self.path.startswith("/echo"):
+            payload.update(authorization=self.headers.get("Authorization"), path=self.path)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_http_server() -> Iterator[str]:
+    """Run a local keep-alive HTTP server and return its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,10 +1,14 @@
 """Tests for Account API client."""
 
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
+from conftest import FakeClock
 
+from ebay_rest.account.cache import AccountProfileCache
 from ebay_rest.account.client import AccountClient
+from ebay_rest.account.models import AccountProfile
 
 
 class TestAccountClient:
@@ -63,3 +67,116 @@ class TestAccountClient:
         assert result["shipping_policies"][0]["policy_id"] == "s1"
 
 
+class TestAccountProfileCache:
+    """AccountProfileCache test suite."""
+
+    PROFILE = {
+        "accountType": "INDIVIDUAL",
+        "sellingLimit": {"amount": 5000.0, "currency": "USD", "quantity": 100},
+    }
+
+    def test_profile_cache_is_shared(self, mock_base_client, sandbox_flag: bool):
+        client = AccountClient(base_client=mock_base_client, sandbox=sandbox_flag)
+        assert client.get_profile_cache() is client.get_profile_cache()
+
+    def test_profile_fetched_once_within_ttl(self, mock_base_client):
+        mock_base_client.get = MagicMock(return_value=self.PROFILE)
+        client = AccountClient(base_client=mock_base_client)
+        cache = client.get_profile_cache(ttl=60)
+
+        assert cache.get_profile().account_type == "INDIVIDUAL"
+        assert cache.selling_limit().quantity == 100
+        assert cache.remaining_capacity().quantity == 100
+
+        mock_base_client.get.assert_called_once_with("/sell/account/v1/privilege")
+
+    def test_profile_refetched_after_ttl(self):
+        clock = FakeClock()
+        fetch = MagicMock(return_value=AccountProfile(**self.PROFILE))
+        cache = AccountProfileCache(fetch, ttl=60, clock=clock)
+
+        cache.get_profile()
+        clock.now = 59
+        cache.get_profile()
+        assert fetch.call_count == 1
+
+        clock.now = 60
+        cache.get_profile()
+        assert fetch.call_count == 2
+
+    def test_reserve_reduces_remaining_capacity(self):
+        cache = AccountProfileCache(lambda: AccountProfile(**self.PROFILE), ttl=60)
+
+        assert cache.can_list(quantity=100, amount=5000.0)
+        cache.reserve(quantity=90, amount=1000.0)
+
+        remaining = cache.remaining_capacity()
+        assert remaining.quantity == 10
+        assert remaining.amount == 4000.0
+        assert remaining.currency == "USD"
+        assert cache.can_list(quantity=10)
+        assert not cache.can_list(quantity=11)
+        assert not cache.can_list(quantity=1, amount=4000.01)
+
+    def test_reservations_last_for_the_selling_period(self):
+        period = ["2026-10"]
+        cache = AccountProfileCache(
+            lambda: AccountProfile(**self.PROFILE), ttl=60, selling_period=lambda: period[0]
+        )
+        cache.reserve(quantity=50)
+        cache.refresh()
+        assert cache.remaining_capacity().quantity == 50
+
+        period[0] = "2026-11"
+        assert cache.remaining_capacity().quantity == 100
+
+    def test_failing_background_refresh_stops_serving_after_max_stale(self):
+        clock = FakeClock()
+        fetch = MagicMock(return_value=AccountProfile(**self.PROFILE))
+        cache = AccountProfileCache(fetch, ttl=60, clock=clock, max_stale=120)
+        cache.refresh()
+        fetch.side_effect = RuntimeError("account API down")
+
+        with patch.object(cache, "is_background_refresh_running", return_value=True):
+            clock.now = 119
+            assert cache.get_profile().account_type == "INDIVIDUAL"
+            clock.now = 120
+            with pytest.raises(RuntimeError):
+                cache.get_profile()
+
+    def test_profile_cache_created_once_across_threads(self, mock_base_client):
+        client = AccountClient(base_client=mock_base_client)
+        barrier = threading.Barrier(8)
+        caches = []
+
+        def get():
+            barrier.wait()
+            caches.append(client.get_profile_cache())
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(cache) for cache in caches}) == 1
+
+    def test_no_selling_limit_means_unlimited(self):
+        cache = AccountProfileCache(lambda: AccountProfile(accountType="BUSINESS"), ttl=60)
+        assert cache.remaining_capacity() is None
+        assert cache.can_list(quantity=10_000)
+
+    def test_background_refresh(self):
+        fetched = threading.Event()
+
+        def fetch():
+            fetched.set()
+            return AccountProfile(**self.PROFILE)
+
+        cache = AccountProfileCache(fetch, ttl=60)
+        cache.start_background_refresh(interval=0.01)
+        try:
+            assert fetched.wait(timeout=2)
+            assert cache.is_background_refresh_running()
+        finally:
+            cache.stop_background_refresh()
+        assert not cache.is_background_refresh_running()
@@ -0,0 +1,248 @@
+"""Tests for adaptive concurrency limiting and concurrent fan-out."""
+
+import threading
+
+import pytest
+from conftest import FakeClock
+
+from ebay_rest.concurrency import AdaptiveLimiter, fan_out
+from ebay_rest.contrib.prometheus import PrometheusExporter
+from ebay_rest.errors import NotFoundError, RateLimitExceeded
+from ebay_rest.pagination import paginate_concurrently
+from ebay_rest.priority import Priority, current_priority, use_priority
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+
+def _complete(
+    limiter: AdaptiveLimiter, clock: FakeClock, calls: int, latency: float = 0.1, **outcome
+):
+    """Run ``calls`` requests that all start together and finish after ``latency``."""
+    tickets = [limiter.acquire() for _ in range(calls)]
+    clock.now += latency
+    for ticket in tickets:
+        limiter.release(ticket, **outcome)
+
+
+class TestAdaptiveLimiter:
+    """AdaptiveLimiter test suite."""
+
+    def test_additive_increase_when_saturated(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=6, clock=clock)
+
+        _complete(limiter, clock, 4)
+        assert limiter.stats()["increases"] > 0
+        for _ in range(20):
+            _complete(limiter, clock, limiter.limit)
+        assert limiter.limit == 6
+
+    def test_no_increase_when_limit_unused(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=8, clock=clock)
+        for _ in range(20):
+            _complete(limiter, clock, 1)
+        assert limiter.limit == 8
+
+    def test_one_decrease_per_burst(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=16, clock=clock)
+
+        _complete(limiter, clock, 16, congested=True)
+        assert limiter.limit == 8
+        assert limiter.stats()["decreases"] == 1
+
+        _complete(limiter, clock, 8, congested=True)
+        assert limiter.limit == 4
+
+    def test_floor(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, clock=clock)
+        _complete(limiter, clock, 2, congested=True)
+        assert limiter.limit == 2
+
+    def test_sustained_latency_spike_counts_as_congestion(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=10, max_limit=10, clock=clock)
+        _complete(limiter, clock, 5, latency=0.1)
+
+        _complete(limiter, clock, 1, latency=0.5)
+        _complete(limiter, clock, 1, latency=0.5)
+        assert limiter.limit == 10
+        _complete(limiter, clock, 1, latency=0.5)
+        assert limiter.limit == 5
+        assert limiter.stats()["baseline_latency"][""] == pytest.approx(0.157, abs=1e-3)
+
+    def test_baselines_are_per_endpoint(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=10, max_limit=10, clock=clock)
+        for _ in range(20):
+            _complete(limiter, clock, 1, latency=0.05, endpoint="GET /buy/browse/v1/item/{id}")
+            _complete(limiter, clock, 1, latency=0.8, endpoint="POST /sell/inventory/v1/bulk")
+
+        assert limiter.limit == 10
+        assert limiter.stats()["decreases"] == 0
+        assert set(limiter.stats()["baseline_latency"]) == {
+            "GET /buy/browse/v1/item/{id}",
+            "POST /sell/inventory/v1/bulk",
+        }
+
+    def test_errors_without_load_signal_are_ignored(self):
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial_limit=4, clock=clock)
+        _complete(limiter, clock, 4, succeeded=False)
+        assert limiter.stats() == {
+            "limit": 4,
+            "in_flight": 0,
+            "baseline_latency": {},
+            "increases": 0,
+            "decreases": 0,
+        }
+
+    def test_waits_for_a_slot(self):
+        limiter = AdaptiveLimiter(initial_limit=1)
+        ticket = limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+
+        assert not acquired.wait(0.02)
+        limiter.release(ticket)
+        assert acquired.wait(1.0)
+        thread.join()
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(backoff=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(slow_samples=0)
+
+
+class TestBaseClientLimiter:
+    """Adaptive limiting of BaseClient requests."""
+
+    ITEM = "/buy/browse/v1/item/v1|1|0"
+
+    def test_backs_off_on_throttle(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", self.ITEM, json={}, status_code=429)
+        limiter = AdaptiveLimiter(initial_limit=8)
+        client = make_base_client(transport, limiter=limiter)
+
+        with pytest.raises(RateLimitExceeded):
+            client.get(self.ITEM)
+
+        assert limiter.limit == 4
+        assert limiter.stats()["in_flight"] == 0
+        assert client.metrics.snapshot()["gauges"] == {"concurrency_limit": 4}
+
+    def test_not_found_leaves_limit_alone(self, make_base_client):
+        limiter = AdaptiveLimiter(initial_limit=1)
+        client = make_base_client(FakeTransport(), limiter=limiter)
+
+        with pytest.raises(NotFoundError):
+            client.get(self.ITEM)
+        assert limiter.stats()["decreases"] == 0
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_prometheus_gauge(self):
+        limiter = AdaptiveLimiter(initial_limit=3)
+        exporter = PrometheusExporter().gauge(
+            "concurrency_limit", "Requests allowed in flight", lambda: limiter.limit
+        )
+        text = exporter.render()
+        assert "# TYPE ebay_rest_concurrency_limit gauge\nebay_rest_concurrency_limit 3\n" in text
+
+
+class TestFanOut:
+    """fan_out test suite."""
+
+    def test_results_in_order_with_context(self):
+        def work(n):
+            return n * 2, current_priority()
+
+        with use_priority(Priority.BULK):
+            results = fan_out(work, range(20), max_workers=4)
+        assert results == [(n * 2, Priority.BULK) for n in range(20)]
+
+    def test_exceptions(self):
+        def work(n):
+            if n == 1:
+                raise ValueError(n)
+            return n
+
+        with pytest.raises(ValueError):
+            fan_out(work, [0, 1, 2])
+        results = fan_out(work, [0, 1, 2], return_exceptions=True)
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+    def test_empty(self):
+        assert fan_out(str, []) == []
+
+
+class TestPaginateConcurrently:
+    """paginate_concurrently test suite."""
+
+    def test_fetches_remaining_pages_in_parallel(self, make_base_client):
+        def handler(request):
+            offset, limit = int(request.params["offset"]), int(request.params["limit"])
+            orders = [{"orderId": str(n)} for n in range(offset, min(offset + limit, 23))]
+            return TransportResponse.from_json({"orders": orders, "total": 23})
+
+        transport = FakeTransport(handler=handler)
+        client = make_base_client(transport)
+
+        def list_orders(offset, limit):
+            return client.get(
+                "/sell/fulfillment/v1/order", params={"offset": offset, "limit": limit}
+            )
+
+        orders = list(
+            paginate_concurrently(list_orders, page_size=5, items_key="orders", max_workers=4)
+        )
+        assert [order["orderId"] for order in orders] == [str(n) for n in range(23)]
+        assert len(transport.requests) == 5
+
+        first = list(
+            paginate_concurrently(list_orders, page_size=5, max_items=7, items_key="orders")
+        )
+        assert len(first) == 7
+        assert len(transport.requests) == 7
+
+    def test_falls_back_to_sequential_without_total(self):
+        calls = []
+
+        def list_items(offset, limit):
+            calls.append((offset, limit))
+            return {"items": list(range(offset, min(offset + limit, 12)))}
+
+        assert list(paginate_concurrently(list_items, page_size=5)) == list(range(12))
+        assert calls == [(0, 5), (5, 5), (10, 5)]
+
+    def test_falls_back_to_sequential_when_server_caps_page_size(self):
+        calls = []
+
+        def list_items(offset, limit):
+            calls.append((offset, limit))
+            return {"items": list(range(offset, min(offset + min(limit, 4), 10))), "total": 10}
+
+        assert list(paginate_concurrently(list_items, page_size=50)) == list(range(10))
+        assert calls == [(0, 50), (4, 4), (8, 4)]
+
+    def test_yields_each_window_before_fetching_the_next(self):
+        calls = []
+
+        def list_items(offset, limit):
+            calls.append(offset)
+            return {"items": list(range(offset, min(offset + limit, 100))), "total": 100}
+
+        items = paginate_concurrently(list_items, page_size=10, max_workers=3)
+        assert [next(items) for _ in range(10)] == list(range(10))
+        assert calls == [0]
+        assert next(items) == 10
+        assert sorted(calls) == [0, 10, 20, 30]
+
+        assert list(items) == list(range(11, 100))
+        assert sorted(calls) == list(range(0, 100, 10))
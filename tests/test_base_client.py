@@ -6,6 +6,7 @@ import requests
 
 from ebay_rest.base_client import BaseClient
 from ebay_rest.auth import OAuth2Client
+from ebay_rest.credentials import UserCredentials
 from ebay_rest.errors import (
     AuthError,
     EbayAPIError,
@@ -186,6 +187,27 @@ class TestBaseClientUserToken:
         client.set_user_access_token(None)
         assert client.user_access_token is None
 
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_set_user_access_token_to_none_reverts_to_app_token(
+        self, mock_refresh_token, mock_oauth_client
+    ):
+        """Clearing the token goes back to app tokens even when a refresh token was stored."""
+        mock_oauth_client.build_auth_header = MagicMock(
+            return_value={"Authorization": "Bearer APP"}
+        )
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="user",
+            user_refresh_token="refresh",
+        )
+
+        client.set_user_access_token(None)
+
+        assert client._get_headers()["Authorization"] == "Bearer APP"
+        assert client.user_refresh_token is None
+        mock_refresh_token.assert_not_called()
+
     def test_set_user_access_token_updates_headers(self, mock_oauth_client):
         """Test that setting token affects subsequent header generation."""
         client = BaseClient(
@@ -1378,3 +1400,238 @@ class TestBaseClientAutoRefresh:
             assert "sell.fulfillment.readonly" in scopes[1]
             assert "sell.account.readonly" in scopes[2]
 
+
+
+class TestBaseClientUserScope:
+    """Test per-seller credential scoping over one shared client."""
+
+    @staticmethod
+    def _ok_response():
+        response = MagicMock()
+        response.status_code = 200
+        response.text = "{}"
+        response.json.return_value = {}
+        return response
+
+    @patch("ebay_rest.base_client.requests.Session")
+    def test_as_user_uses_seller_token_and_shared_session(
+        self, mock_session_class, mock_oauth_client
+    ):
+        """Views send their own bearer token over the parent's session."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_session.get.return_value = self._ok_response()
+
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="default_token",
+        )
+        seller_a = client.as_user(UserCredentials(access_token="token_a"))
+        seller_b = client.as_user("token_b")
+
+        seller_a.get("/test")
+        seller_b.get("/test")
+        client.get("/test")
+
+        tokens = [c[1]["headers"]["Authorization"] for c in mock_session.get.call_args_list]
+        assert tokens == ["Bearer token_a", "Bearer token_b", "Bearer default_token"]
+        assert mock_session_class.call_count == 1
+
+    def test_use_credentials_restores_previous_scope(self, mock_oauth_client):
+        """use_credentials() only affects calls inside the block."""
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="default_token",
+        )
+        with client.use_credentials(UserCredentials(access_token="scoped")):
+            assert client._get_headers()["Authorization"] == "Bearer scoped"
+        assert client._get_headers()["Authorization"] == "Bearer default_token"
+
+    def test_view_set_user_access_token_is_per_seller(self, mock_oauth_client):
+        """Setting a token on a view does not change the shared default."""
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="default_token",
+        )
+        view = client.as_user("token_a")
+        view.set_user_access_token("token_a2")
+
+        assert view.credentials.access_token == "token_a2"
+        assert client.user_access_token == "default_token"
+
+    def test_view_passes_seller_scope_to_inherited_methods(self, mock_oauth_client):
+        """Methods read through the view run with the seller's credentials."""
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="default_token",
+        )
+        view = client.as_user(UserCredentials(access_token="seller", seller_id="s1"))
+
+        assert view._get_headers()["Authorization"] == "Bearer seller"
+        assert view._cache_key("/sell/account/v1/privilege", None) != client._cache_key(
+            "/sell/account/v1/privilege", None
+        )
+        assert client._get_headers()["Authorization"] == "Bearer default_token"
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    @patch("ebay_rest.base_client.requests.Session")
+    def test_refresh_is_tracked_per_seller(
+        self, mock_session_class, mock_refresh_token, mock_oauth_client
+    ):
+        """A 401 for one seller refreshes only that seller's credentials."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        response_401 = MagicMock()
+        response_401.status_code = 401
+        response_401.text = '{"error": "invalid_token"}'
+        response_401.json.return_value = {"error": "invalid_token"}
+        mock_session.get.side_effect = [response_401, self._ok_response()]
+        mock_refresh_token.return_value = {"access_token": "fresh_a", "expires_in": 7200}
+
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="default_token",
+            user_refresh_token="default_refresh",
+        )
+        creds_a = UserCredentials(access_token="stale_a", refresh_token="refresh_a")
+        client.as_user(creds_a).get("/test")
+
+        assert mock_refresh_token.call_args[1]["refresh_token"] == "refresh_a"
+        assert creds_a.access_token == "fresh_a"
+        assert creds_a.expires_at is not None
+        assert client.user_access_token == "default_token"
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_expired_token_refreshed_before_request(self, mock_refresh_token, mock_oauth_client):
+        """Tokens with a known past expiry are refreshed before sending."""
+        mock_refresh_token.return_value = {"access_token": "fresh", "expires_in": 7200}
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        creds = UserCredentials(access_token="old", refresh_token="refresh", expires_at=0)
+
+        with client.use_credentials(creds):
+            headers = client._get_headers()
+
+        assert headers["Authorization"] == "Bearer fresh"
+        mock_refresh_token.assert_called_once()
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_refresh_skipped_when_token_already_rotated(
+        self, mock_refresh_token, mock_oauth_client
+    ):
+        """A caller holding a stale token reuses a refresh another caller already did."""
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        creds = UserCredentials(access_token="already_new", refresh_token="refresh")
+
+        token = client._refresh_user_token_if_needed(creds, stale_token="old")
+
+        assert token == "already_new"
+        mock_refresh_token.assert_not_called()
+
+
+class TestBaseClientPooling:
+    """Test connection pool and timeout configuration."""
+
+    def test_default_pool_settings(self, mock_oauth_client):
+        """Defaults match requests' adapter defaults."""
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        stats = client.pool_stats()
+        assert stats["pool_connections"] == 10
+        assert stats["pool_maxsize"] == 10
+        assert stats["pool_block"] is False
+        assert stats["hosts"] == {}
+
+    def test_custom_pool_settings_mounted_on_session(self, mock_oauth_client):
+        """Pool settings are applied to the adapter used for https and http."""
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            pool_connections=4,
+            pool_maxsize=64,
+            pool_block=True,
+        )
+        adapter = client.session.get_adapter("https://api.ebay.com")
+        assert adapter is client.session.get_adapter("http://localhost")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+
+    def test_invalid_pool_size(self, mock_oauth_client):
+        """Pool sizes must be positive."""
+        with pytest.raises(ValueError):
+            BaseClient(
+                auth_client=mock_oauth_client, base_url="https://api.ebay.com", pool_maxsize=0
+            )
+
+    @patch("ebay_rest.base_client.requests.Session")
+    def test_separate_connect_and_read_timeouts(self, mock_session_class, mock_oauth_client):
+        """Connect/read timeouts are sent as a tuple."""
+        mock_session = MagicMock()
+        mock_session_class.return_value = mock_session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "{}"
+        mock_response.json.return_value = {}
+        mock_session.get.return_value = mock_response
+
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="token",
+            connect_timeout=3.05,
+            read_timeout=20,
+        )
+        client.get("/test")
+
+        assert mock_session.get.call_args[1]["timeout"] == (3.05, 20)
+
+    def test_only_connect_timeout_falls_back_to_timeout(self, mock_oauth_client):
+        """An unset half of the tuple uses the general timeout."""
+        client = BaseClient(
+            auth_client=mock_oauth_client, base_url="https://api.ebay.com", connect_timeout=2
+        )
+        assert client._request_timeout() == (2, 30)
+
+    def test_idle_connections_evicted(self, mock_oauth_client):
+        """Pools are cleared after the client sat idle longer than max_idle_time."""
+        client = BaseClient(
+            auth_client=mock_oauth_client, base_url="https://api.ebay.com", max_idle_time=60
+        )
+        client.transport._adapter.poolmanager.connection_from_url("https://api.ebay.com")
+        assert len(client.pool_stats()["hosts"]) == 1
+
+        client.transport._last_used -= 61
+        client.transport._evict_idle_connections()
+
+        stats = client.pool_stats()
+        assert stats["hosts"] == {}
+        assert stats["idle_evictions"] == 1
+
+    def test_recently_used_connections_kept(self, mock_oauth_client):
+        """No eviction while the client is active."""
+        client = BaseClient(
+            auth_client=mock_oauth_client, base_url="https://api.ebay.com", max_idle_time=60
+        )
+        client.transport._adapter.poolmanager.connection_from_url("https://api.ebay.com")
+        client.transport._evict_idle_connections()
+        assert client.pool_stats()["idle_evictions"] == 0
+        assert len(client.pool_stats()["hosts"]) == 1
+
+    def test_pool_stats_report_reuse(self, mock_oauth_client, local_http_server):
+        """Keep-alive connections are reused and counted per host."""
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url=local_http_server,
+            user_access_token="token",
+        )
+        for _ in range(3):
+            assert client.get("/ping") == {"ok": True}
+
+        host_stats = list(client.pool_stats()["hosts"].values())[0]
+        assert host_stats["requests"] == 3
+        assert host_stats["connections_created"] == 1
+        assert host_stats["idle"] == 1
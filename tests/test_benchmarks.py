@@ -0,0 +1,47 @@
+"""Tests for the benchmark suite's result format and baseline comparison."""
+
+import json
+
+from benchmarks import suite
+
+
+def _report(**values):
+    return {
+        "results": {
+            name: {"value": value, "unit": unit, "better": better}
+            for name, (value, unit, better) in values.items()
+        }
+    }
+
+
+class TestBenchmarkSuite:
+    """benchmarks.suite test suite."""
+
+    def test_compare_flags_slower_timings(self):
+        baseline = _report(parse=(100.0, "us/page", "lower"))
+        comparison = suite.compare(_report(parse=(125.0, "us/page", "lower")), baseline)
+
+        assert comparison["benchmarks"]["parse"]["change"] == 0.25
+        assert comparison["regressions"] == ["parse"]
+
+    def test_compare_flags_lower_throughput(self):
+        baseline = _report(e2e=(1000.0, "req/s", "higher"))
+        comparison = suite.compare(_report(e2e=(800.0, "req/s", "higher")), baseline)
+        assert comparison["regressions"] == ["e2e"]
+
+        faster = suite.compare(_report(e2e=(1050.0, "req/s", "higher")), baseline)
+        assert faster["regressions"] == []
+
+    def test_compare_skips_new_and_changed_units(self):
+        baseline = _report(a=(1.0, "us/op", "lower"))
+        current = _report(a=(2.0, "ms/op", "lower"), b=(1.0, "us/op", "lower"))
+        assert suite.compare(current, baseline)["benchmarks"] == {}
+
+    def test_run_selected_group_and_save_baseline(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        argv = ["--quick", "--only", "headers", "--json", "--save-baseline", str(path)]
+        assert suite.main(argv) == 0
+
+        report = json.loads(capsys.readouterr().out)
+        assert set(report["results"]) == {"headers.user_token", "headers.app_token"}
+        assert json.loads(path.read_text())["results"].keys() == report["results"].keys()
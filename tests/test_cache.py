@@ -0,0 +1,318 @@
+"""Tests for the response cache."""
+
+import json
+import multiprocessing
+import os
+import stat
+import time
+import zlib
+
+import pytest
+from conftest import FakeClock
+
+from ebay_rest.cache import CacheBackend, MemoryCache, SQLiteCache, TieredCache, cache_key
+from ebay_rest.errors import NotFoundError
+from ebay_rest.inventory.client import InventoryClient
+from ebay_rest.transport import FakeTransport
+
+
+def _hammer(path: str, worker: int) -> None:
+    cache = SQLiteCache(path)
+    for i in range(200):
+        cache.set(f"k{i % 20}", {"worker": worker, "i": i}, ttl=60)
+        cache.get(f"k{(i + 7) % 20}")
+    cache.close()
+
+
+class TestCacheKey:
+    """cache_key test suite."""
+
+    def test_normalized(self):
+        a = cache_key("https://api.ebay.com/", "/x", {"b": 2, "a": "1", "c": None}, "app:id")
+        b = cache_key("https://api.ebay.com", "x", {"a": 1, "b": "2"}, "app:id")
+        assert a == b
+        assert a != cache_key("https://api.ebay.com", "/x", {"a": 1, "b": 2}, "seller-1")
+        assert a != cache_key("https://api.sandbox.ebay.com", "/x", {"a": 1, "b": 2}, "app:id")
+
+
+class TestSQLiteCache:
+    """SQLiteCache test suite."""
+
+    def test_set_get_and_expiry(self, tmp_path):
+        clock = FakeClock()
+        cache = SQLiteCache(str(tmp_path / "cache.db"), clock=clock)
+        cache.set("k", {"itemId": "v1|1|0"}, ttl=10)
+
+        assert cache.get("k") == {"itemId": "v1|1|0"}
+        clock.now += 10
+        assert cache.get("k") is None
+        assert cache.get("missing") is None
+
+    def test_compressed_private_wal_file(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteCache(path)
+        value = {"itemSummaries": [{"title": "Vintage camera lens"}] * 200}
+        cache.set("k", value, ttl=60)
+
+        assert cache.stats()["bytes"] < len(json.dumps(value)) / 10
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert cache._connect().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_delete_and_clear(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.delete("a")
+        assert cache.get("a") is None and cache.get("b") == 2
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+
+    def test_corrupt_entry_is_a_miss_and_dropped(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("zlib", 1, ttl=60)
+        cache.set("json", 2, ttl=60)
+        cache.set("ok", 3, ttl=60)
+        conn = cache._connect()
+        conn.execute("UPDATE responses SET value = ? WHERE key = 'zlib'", (b"not zlib",))
+        conn.execute(
+            "UPDATE responses SET value = ? WHERE key = 'json'", (zlib.compress(b"{not json"),)
+        )
+
+        assert cache.get("zlib") is None
+        assert cache.get_many(["json", "ok"]) == {"ok": (3, pytest.approx(60, abs=1))}
+        assert cache.stats()["entries"] == 1
+
+    def test_database_errors_do_not_raise(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache._connect().execute("DROP TABLE responses")
+
+        cache.clear()
+        assert cache.stats() == {"entries": 0, "bytes": 0}
+
+    def test_size_eviction_drops_expired_then_soonest_expiring(self, tmp_path):
+        clock = FakeClock()
+        cache = SQLiteCache(
+            str(tmp_path / "cache.db"), max_bytes=1000, compress_level=0, clock=clock
+        )
+        cache.set("expired", "x" * 100, ttl=1)
+        for i in range(10):
+            cache.set(f"k{i}", "x" * 200, ttl=100 + i)
+        clock.now += 5
+
+        removed = cache.evict()
+
+        assert cache.stats()["bytes"] <= 900
+        assert removed == 7
+        assert cache.get("k0") is None and cache.get("k9") is not None
+
+    def test_concurrent_processes(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SQLiteCache(path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_hammer, args=(path, w)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+        assert SQLiteCache(path).stats()["entries"] == 20
+
+
+class TestMemoryCache:
+    """MemoryCache test suite."""
+
+    def test_lru_and_expiry(self):
+        clock = FakeClock()
+        cache = MemoryCache(max_entries=2, clock=clock)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=20)
+        cache.get("a")
+        cache.set("c", 3, ttl=30)
+
+        assert cache.get("b") is None
+        assert cache.get_many(["a", "b", "c"]) == {"a": (1, 10), "c": (3, 30)}
+        clock.now += 10
+        assert cache.get("a") is None and len(cache) == 1
+
+    def test_backends_implement_protocol(self, tmp_path):
+        memory = MemoryCache()
+        backends = [memory, SQLiteCache(str(tmp_path / "c.db")), TieredCache(memory, MemoryCache())]
+        assert all(isinstance(backend, CacheBackend) for backend in backends)
+
+
+class TestTieredCache:
+    """TieredCache test suite."""
+
+    def test_promotes_l2_hits_with_capped_ttl(self, tmp_path):
+        clock = FakeClock()
+        l1 = MemoryCache(clock=clock)
+        l2 = SQLiteCache(str(tmp_path / "c.db"), clock=clock)
+        l2.set("shared", {"sku": "A"}, ttl=300)
+        l2.set("short", {"sku": "B"}, ttl=5)
+        cache = TieredCache(l1, l2, l1_ttl=30)
+
+        assert cache.get("shared") == {"sku": "A"}
+        assert l1.get_many(["shared"])["shared"].ttl == 30
+        assert set(cache.get_many(["short", "missing"])) == {"short"}
+        assert l1.get_many(["short"])["short"].ttl == pytest.approx(5)
+
+    def test_writes_and_deletes_reach_both_levels(self):
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l1, l2, l1_ttl=None)
+        cache.set("k", 1, ttl=60)
+        assert l1.get("k") == 1 and l2.get("k") == 1
+
+        cache.delete("k")
+        assert cache.get("k") is None and l2.get("k") is None
+
+
+class TestSQLiteCacheBulk:
+    """SQLiteCache.get_many test suite."""
+
+    def test_get_many_batches(self, tmp_path):
+        clock = FakeClock()
+        cache = SQLiteCache(str(tmp_path / "c.db"), clock=clock)
+        for i in range(1200):
+            cache.set(f"k{i}", i, ttl=10 + i % 2)
+        clock.now += 10
+
+        found = cache.get_many(f"k{i}" for i in range(1300))
+
+        assert len(found) == 600
+        assert found["k1"] == (1, 1)
+
+
+class TestBaseClientCache:
+    """Response caching in BaseClient.get()."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = FakeTransport()
+        transport.add_response("GET", "/buy/browse/v1/item/v1|1|0", json={"itemId": "v1|1|0"})
+        transport.add_response(
+            "PUT", "/sell/inventory/v1/inventory_item/A", json=None, status_code=204
+        )
+        transport.add_response("GET", "/sell/inventory/v1/inventory_item/A", json={"sku": "A"})
+        return transport
+
+    @pytest.fixture(autouse=True)
+    def app_token(self, mock_oauth_client):
+        mock_oauth_client.access_token = "app-token"
+        mock_oauth_client.token_expires_at = time.time() + 7200
+
+    def test_shared_between_processes_via_file(self, make_base_client, transport, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = make_base_client(transport, cache=SQLiteCache(path), user_access_token=None)
+        second = make_base_client(transport, cache=SQLiteCache(path), user_access_token=None)
+
+        assert first.get("/buy/browse/v1/item/v1|1|0") == {"itemId": "v1|1|0"}
+        assert second.get("/buy/browse/v1/item/v1|1|0") == {"itemId": "v1|1|0"}
+
+        assert len(transport.requests) == 1
+        assert second.metrics.snapshot()["cache"] == {"hit": 1}
+
+    def test_scoped_by_credentials(self, make_base_client, transport, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "c.db"))
+        client = make_base_client(transport, cache=cache, user_access_token=None)
+        client.get("/buy/browse/v1/item/v1|1|0")
+        client.as_user("seller-a").get("/buy/browse/v1/item/v1|1|0")
+        client.as_user("seller-a").get("/buy/browse/v1/item/v1|1|0")
+        assert len(transport.requests) == 2
+
+    def test_ttl_override_and_bypass(self, make_base_client, transport, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "c.db"))
+        client = make_base_client(transport, cache=cache, cache_ttl=0, user_access_token=None)
+        client.get("/buy/browse/v1/item/v1|1|0")
+        client.get("/buy/browse/v1/item/v1|1|0")
+        assert len(transport.requests) == 2
+
+        client.get("/buy/browse/v1/item/v1|1|0", cache_ttl=60)
+        client.get("/buy/browse/v1/item/v1|1|0", cache_ttl=60)
+        assert len(transport.requests) == 3
+
+    def test_write_invalidates(self, make_base_client, transport, tmp_path):
+        client = make_base_client(transport, cache=SQLiteCache(str(tmp_path / "c.db")))
+        client.get("/sell/inventory/v1/inventory_item/A")
+        client.put("/sell/inventory/v1/inventory_item/A", json={"sku": "A"})
+        client.get("/sell/inventory/v1/inventory_item/A")
+        assert [r.method for r in transport.requests] == ["GET", "PUT", "GET"]
+
+    def test_orders_cached_only_on_request(self, make_base_client, tmp_path):
+        transport = FakeTransport()
+        transport.add_response("GET", "/sell/fulfillment/v1/order/1", json={"orderId": "1"})
+        client = make_base_client(transport, cache=MemoryCache())
+
+        client.get("/sell/fulfillment/v1/order/1")
+        client.get("/sell/fulfillment/v1/order/1")
+        assert len(transport.requests) == 2
+
+        client.get("/sell/fulfillment/v1/order/1", cache_ttl=30)
+        client.get("/sell/fulfillment/v1/order/1", cache_ttl=30)
+        assert len(transport.requests) == 3
+
+    def test_bulk_inventory_write_invalidates_items(self, make_base_client, transport):
+        transport.add_response(
+            "POST",
+            "/sell/inventory/v1/bulk_create_or_replace_inventory_item",
+            json={"responses": []},
+        )
+        client = make_base_client(transport, cache=MemoryCache())
+        seller = client.as_user("seller-token")
+        inventory = InventoryClient(seller)
+
+        inventory.get_inventory_item("A")
+        inventory.bulk_create_or_replace_inventory_item({"requests": [{"sku": "A"}]})
+        inventory.get_inventory_item("A")
+
+        assert [r.method for r in transport.requests] == ["GET", "POST", "GET"]
+
+
+class TestNegativeCache:
+    """Caching of 404 results."""
+
+    def test_repeat_miss_raises_from_cache(self, make_base_client, tmp_path):
+        transport = FakeTransport()
+        client = make_base_client(transport, cache=SQLiteCache(str(tmp_path / "c.db")))
+
+        for _ in range(3):
+            with pytest.raises(NotFoundError) as excinfo:
+                client.get("/buy/browse/v1/item/v1|9|0")
+
+        assert len(transport.requests) == 1
+        assert excinfo.value.status_code == 404
+        assert client.metrics.snapshot()["cache"] == {"miss": 1, "negative_hit": 2}
+
+    def test_shorter_ttl_than_hits(self, make_base_client):
+        clock = FakeClock()
+        transport = FakeTransport()
+        client = make_base_client(transport, cache=MemoryCache(clock=clock), negative_cache_ttl=10)
+        with pytest.raises(NotFoundError):
+            client.get("/sell/inventory/v1/inventory_item/GONE")
+        clock.now += 10
+        with pytest.raises(NotFoundError):
+            client.get("/sell/inventory/v1/inventory_item/GONE")
+        assert len(transport.requests) == 2
+
+        clock.now += 10
+        client.negative_cache_ttl = 0
+        with pytest.raises(NotFoundError):
+            client.get("/sell/inventory/v1/inventory_item/GONE")
+        with pytest.raises(NotFoundError):
+            client.get("/sell/inventory/v1/inventory_item/GONE")
+        assert len(transport.requests) == 4
+
+    def test_write_invalidates(self, make_base_client):
+        transport = FakeTransport()
+        client = make_base_client(transport, cache=MemoryCache())
+        inventory = InventoryClient(client)
+        with pytest.raises(NotFoundError):
+            inventory.get_inventory_item("NEW")
+
+        transport.add_response(
+            "PUT", "/sell/inventory/v1/inventory_item/NEW", json=None, status_code=204
+        )
+        transport.add_response("GET", "/sell/inventory/v1/inventory_item/NEW", json={"sku": "NEW"})
+        inventory.create_inventory_item("NEW", {"product": {"title": "Lens"}})
+
+        assert inventory.get_inventory_item("NEW")["sku"] == "NEW"
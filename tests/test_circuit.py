@@ -0,0 +1,129 @@
+"""Tests for per-API circuit breakers."""
+
+import pytest
+import requests
+from conftest import FakeClock
+
+from ebay_rest.circuit import CircuitBreaker
+from ebay_rest.errors import CircuitOpenError, EbayAPIError, NotFoundError, ServerError
+from ebay_rest.quota import QuotaLedger
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+ORDERS = "/sell/fulfillment/v1/order"
+ITEM = "/buy/browse/v1/item/v1|1|0"
+
+
+def _fail(breaker: CircuitBreaker, key: str, times: int) -> None:
+    for _ in range(times):
+        breaker.allow(key)
+        breaker.record(key, failed=True)
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker test suite."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        _fail(breaker, "sell.fulfillment", 2)
+        breaker.allow("sell.fulfillment")
+        breaker.record("sell.fulfillment", failed=False)
+        _fail(breaker, "sell.fulfillment", 2)
+        assert breaker.state("sell.fulfillment") == "closed"
+
+        _fail(breaker, "sell.fulfillment", 1)
+        assert breaker.state("sell.fulfillment") == "open"
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.allow("sell.fulfillment")
+        assert isinstance(excinfo.value, ServerError)
+        assert excinfo.value.key == "sell.fulfillment"
+        assert excinfo.value.retry_after == 30
+        breaker.allow("buy.browse")
+
+    def test_half_open_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        _fail(breaker, "sell.fulfillment", 1)
+
+        clock.now += 10
+        assert breaker.state("sell.fulfillment") == "half_open"
+        breaker.allow("sell.fulfillment")
+        with pytest.raises(CircuitOpenError):
+            breaker.allow("sell.fulfillment")
+        breaker.record("sell.fulfillment", failed=True)
+        assert breaker.state("sell.fulfillment") == "open"
+
+        clock.now += 10
+        breaker.allow("sell.fulfillment")
+        breaker.record("sell.fulfillment", failed=False)
+        assert breaker.stats() == {
+            "sell.fulfillment": {"state": "closed", "failures": 0, "trips": 2}
+        }
+
+    def test_cancelled_trial_frees_slot(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        _fail(breaker, "buy.browse", 1)
+        clock.now += 10
+        breaker.allow("buy.browse")
+        breaker.cancel("buy.browse")
+        breaker.allow("buy.browse")
+
+    def test_endpoint_keys(self):
+        breaker = CircuitBreaker(key="endpoint")
+        assert breaker.circuit_key("GET", "/sell/fulfillment/v1/order/12-34") == (
+            "GET /sell/fulfillment/v1/order/{id}"
+        )
+        with pytest.raises(ValueError):
+            CircuitBreaker(key="host")
+
+
+class TestBaseClientCircuitBreaker:
+    """Circuit breaking in BaseClient."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = FakeTransport()
+        transport.add_response("GET", ORDERS, json={}, status_code=503)
+        transport.add_response("GET", ITEM, json={"itemId": "v1|1|0"})
+        return transport
+
+    def test_failing_family_fails_fast(self, make_base_client, transport):
+        client = make_base_client(transport, circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.get(ORDERS)
+        with pytest.raises(CircuitOpenError):
+            client.get(ORDERS)
+        assert client.get(ITEM) == {"itemId": "v1|1|0"}
+        assert len(transport.requests) == 3
+
+    def test_network_errors_count_and_client_errors_do_not(self, make_base_client):
+        def handler(request):
+            if request.path == ORDERS:
+                raise requests.Timeout("read timed out")
+            return TransportResponse.from_json({}, status_code=404)
+
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = make_base_client(FakeTransport(handler=handler), circuit_breaker=breaker)
+
+        for _ in range(3):
+            with pytest.raises(NotFoundError):
+                client.get(ITEM)
+        for _ in range(2):
+            with pytest.raises(EbayAPIError):
+                client.get(ORDERS)
+
+        assert breaker.state("buy.browse") == "closed"
+        assert breaker.state("sell.fulfillment") == "open"
+
+    def test_open_circuit_spends_no_quota(self, make_base_client, transport):
+        ledger = QuotaLedger({})
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = make_base_client(transport, circuit_breaker=breaker, quota=ledger)
+
+        with pytest.raises(ServerError):
+            client.get(ORDERS)
+        with pytest.raises(CircuitOpenError):
+            client.get(ORDERS)
+        assert ledger.used("sell.fulfillment") == 1
@@ -0,0 +1,97 @@
+"""Tests for the top-level EbayClient."""
+
+import subprocess
+import sys
+
+import pytest
+
+from ebay_rest.client import EbayClient
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.token_vault import TokenVault
+
+
+class TestEbayClientAsUser:
+    """EbayClient.as_user() test suite."""
+
+    def test_as_user_shares_transport(self, mock_ebay_client: EbayClient):
+        view = mock_ebay_client.as_user(UserCredentials(access_token="seller_token"))
+
+        assert view is not mock_ebay_client
+        assert view.base_client.session is mock_ebay_client.base_client.session
+        assert view.orders.base_client is view.base_client
+        assert view.base_client.credentials.access_token == "seller_token"
+        assert view.base_client._get_headers()["Authorization"] == "Bearer seller_token"
+
+    def test_as_user_leaves_parent_untouched(self, mock_ebay_client: EbayClient):
+        mock_ebay_client.as_user("seller_token")
+        assert mock_ebay_client.base_client.user_access_token is None
+        assert mock_ebay_client.orders.base_client is mock_ebay_client.base_client
+
+
+class TestEbayClientAsSeller:
+    """EbayClient.as_seller() test suite."""
+
+    def test_as_seller_uses_vault(self, test_client_id, test_client_secret):
+        vault = TokenVault()
+        vault.add("seller-1", refresh_token="r", access_token="a")
+        client = EbayClient(test_client_id, test_client_secret, sandbox=True, token_vault=vault)
+
+        view = client.as_seller("seller-1")
+        assert view.base_client.credentials is vault.get("seller-1")
+
+    def test_as_seller_requires_vault(self, mock_ebay_client: EbayClient):
+        with pytest.raises(ValueError):
+            mock_ebay_client.as_seller("seller-1")
+
+
+class TestEbayClientOptions:
+    """EbayClient forwards transport settings to BaseClient."""
+
+    def test_base_client_options(self, test_client_id, test_client_secret):
+        client = EbayClient(
+            test_client_id, test_client_secret, sandbox=True, pool_maxsize=32, read_timeout=5
+        )
+        assert client.base_client.pool_stats()["pool_maxsize"] == 32
+        assert client.base_client.read_timeout == 5
+
+
+class TestLazyLoading:
+    """Lazy module clients and package exports."""
+
+    def test_import_defers_api_modules_and_models(self):
+        code = (
+            "import sys\n"
+            "from ebay_rest import EbayClient\n"
+            "client = EbayClient('id', 'secret')\n"
+            "assert 'pydantic' not in sys.modules\n"
+            "client.orders\n"
+            "loaded = {m for m in sys.modules if m.startswith('ebay_rest.')}\n"
+            "assert 'ebay_rest.orders.models' in loaded\n"
+            "assert not loaded & {'ebay_rest.browse.models', 'ebay_rest.account.models'}\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_import_defers_sqlite(self):
+        code = (
+            "import sys\n"
+            "from ebay_rest import EbayClient\n"
+            "EbayClient('id', 'secret')\n"
+            "assert 'sqlite3' not in sys.modules\n"
+            "assert 'ebay_rest.token_vault' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_sub_clients_built_once_per_view(self, mock_ebay_client: EbayClient):
+        assert mock_ebay_client.browse is mock_ebay_client.browse
+        view = mock_ebay_client.as_user("seller_token")
+        assert view.browse is not mock_ebay_client.browse
+        assert view.browse.base_client is view.base_client
+
+    def test_package_exports(self):
+        import ebay_rest
+        import ebay_rest.account
+
+        assert ebay_rest.EbayClient is EbayClient
+        assert "AccountProfileCache" in dir(ebay_rest.account)
+        with pytest.raises(AttributeError):
+            ebay_rest.NotAThing
@@ -0,0 +1,151 @@
+"""Stress tests for sharing one client across threads."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from ebay_rest.auth import OAuth2Client
+from ebay_rest.base_client import BaseClient
+from ebay_rest.credentials import UserCredentials
+
+THREADS = 32
+CALLS_PER_THREAD = 25
+
+
+class TestSharedBaseClient:
+    """One BaseClient used from many threads at once."""
+
+    def test_concurrent_requests_share_one_pool(self, mock_oauth_client, local_http_server):
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url=local_http_server,
+            user_access_token="token",
+            pool_maxsize=8,
+            pool_block=True,
+        )
+
+        def worker(_):
+            return [client.get("/ping") for _ in range(CALLS_PER_THREAD)]
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = [r for batch in executor.map(worker, range(THREADS)) for r in batch]
+
+        assert results == [{"ok": True}] * (THREADS * CALLS_PER_THREAD)
+        host_stats = list(client.pool_stats()["hosts"].values())[0]
+        assert host_stats["requests"] == THREADS * CALLS_PER_THREAD
+        # A blocking pool never opens more connections than its size
+        assert host_stats["connections_created"] <= 8
+
+    def test_sessions_are_per_thread(self, mock_oauth_client):
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        sessions = []
+
+        def worker():
+            sessions.append(client.session)
+            assert client.session is sessions[-1]
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(session) for session in sessions}) == 4
+        adapters = {id(session.get_adapter("https://api.ebay.com")) for session in sessions}
+        assert adapters == {id(client.transport._adapter)}
+
+    def test_seller_views_do_not_leak_across_threads(self, mock_oauth_client, local_http_server):
+        client = BaseClient(auth_client=mock_oauth_client, base_url=local_http_server)
+        views = [client.as_user(UserCredentials(access_token=f"token-{i}")) for i in range(8)]
+
+        def worker(i):
+            view = views[i % len(views)]
+            response = view.get(f"/echo/{i}")
+            return response["authorization"] == f"Bearer token-{i % len(views)}"
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            assert all(executor.map(worker, range(THREADS * 4)))
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_concurrent_401s_refresh_once(self, mock_refresh, mock_oauth_client):
+        def slow_refresh(**kwargs):
+            time.sleep(0.05)
+            return {"access_token": "fresh", "expires_in": 7200}
+
+        mock_refresh.side_effect = slow_refresh
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="stale",
+            user_refresh_token="refresh",
+        )
+
+        barrier = threading.Barrier(THREADS)
+
+        def worker(_):
+            barrier.wait()
+            return client._refresh_user_token_if_needed(client.credentials, stale_token="stale")
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            tokens = list(executor.map(worker, range(THREADS)))
+
+        assert tokens == ["fresh"] * THREADS
+        assert mock_refresh.call_count == 1
+
+    def test_set_user_access_token_is_atomic(self, mock_oauth_client):
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        stop = threading.Event()
+        seen = set()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                client.set_user_access_token(f"token-{i}", refresh_token=f"refresh-{i}")
+                i += 1
+
+        def reader():
+            while not stop.is_set():
+                with client.credentials.lock:
+                    pair = (client.user_access_token, client.user_refresh_token)
+                seen.add(pair[0].split("-")[1] == pair[1].split("-")[1])
+
+        client.set_user_access_token("token-x", refresh_token="refresh-x")
+        threads = [threading.Thread(target=writer)] + [
+            threading.Thread(target=reader) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        assert seen == {True}
+
+
+class TestSharedOAuth2Client:
+    """One OAuth2Client used from many threads at once."""
+
+    @patch("ebay_rest.auth.requests.post")
+    def test_concurrent_app_token_fetch_is_single_flight(self, mock_post):
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"access_token": "app_token", "expires_in": 7200}
+            return response
+
+        mock_post.side_effect = slow_post
+        auth = OAuth2Client(client_id="id", client_secret="secret", sandbox=True)
+        barrier = threading.Barrier(THREADS)
+
+        def worker(_):
+            barrier.wait()
+            return auth.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            tokens = list(executor.map(worker, range(THREADS)))
+
+        assert tokens == ["app_token"] * THREADS
+        assert mock_post.call_count == 1
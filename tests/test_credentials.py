@@ -0,0 +1,48 @@
+"""Tests for per-seller user credentials."""
+
+import time
+
+from ebay_rest.credentials import UserCredentials
+
+
+class TestUserCredentials:
+    """UserCredentials test suite."""
+
+    def test_defaults(self):
+        creds = UserCredentials(access_token="token")
+        assert creds.refresh_token is None
+        assert creds.scopes == []
+        assert creds.expires_at is None
+
+    def test_unknown_expiry_is_not_expired(self):
+        assert not UserCredentials(access_token="token").is_expired()
+
+    def test_missing_token_is_expired(self):
+        assert UserCredentials(refresh_token="refresh").is_expired()
+
+    def test_expiry_buffer(self):
+        creds = UserCredentials(access_token="token", expires_at=time.time() + 30)
+        assert creds.is_expired(buffer_seconds=60)
+        assert not creds.is_expired(buffer_seconds=0)
+
+    def test_update_from_token_response(self):
+        creds = UserCredentials(access_token="old", refresh_token="refresh")
+        token = creds.update({"access_token": "new", "expires_in": 7200})
+
+        assert token == "new"
+        assert creds.access_token == "new"
+        assert creds.refresh_token == "refresh"
+        assert creds.expires_at > time.time() + 7000
+
+    def test_update_rotates_refresh_token(self):
+        creds = UserCredentials(access_token="old", refresh_token="refresh")
+        creds.update({"access_token": "new", "refresh_token": "refresh2"})
+        assert creds.refresh_token == "refresh2"
+
+    def test_scope_id_prefers_seller_id(self):
+        assert UserCredentials(refresh_token="r", seller_id="seller-1").scope_id == "seller-1"
+
+    def test_scope_id_hides_secret(self):
+        creds = UserCredentials(access_token="a", refresh_token="secret-refresh")
+        assert "secret" not in creds.scope_id
+        assert creds.scope_id == UserCredentials(refresh_token="secret-refresh").scope_id
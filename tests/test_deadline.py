@@ -0,0 +1,261 @@
+"""Tests for end-to-end deadlines."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from ebay_rest.auth import OAuth2Client
+from ebay_rest.circuit import CircuitBreaker
+from ebay_rest.concurrency import AdaptiveLimiter
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.deadline import check_deadline, time_remaining, use_deadline
+from ebay_rest.errors import AuthError, DeadlineExceeded, EbayAPIError
+from ebay_rest.pagination import paginate, paginate_concurrently
+from ebay_rest.ratelimit import TokenBucket
+from ebay_rest.scheduler import RequestScheduler
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+ITEM = "/buy/browse/v1/item/v1|1|0"
+
+
+class TestUseDeadline:
+    """use_deadline test suite."""
+
+    def test_nested_blocks_only_shorten(self):
+        assert time_remaining() is None
+        with use_deadline(10):
+            with use_deadline(60):
+                assert time_remaining() <= 10
+            with use_deadline(1):
+                assert time_remaining() <= 1
+            assert 1 < time_remaining() <= 10
+        assert time_remaining() is None
+
+    def test_check(self):
+        check_deadline()
+        with use_deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                check_deadline("page 2")
+
+
+class TestBaseClientDeadline:
+    """Deadlines in BaseClient."""
+
+    def test_caps_attempt_timeout(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", ITEM, json={})
+        transport.add_response("POST", "/sell/inventory/v1/bulk_migrate_listing", json={})
+        client = make_base_client(transport)
+
+        client.get(ITEM)
+        client.get(ITEM, deadline=2.0)
+        with use_deadline(5.0):
+            client.post("/sell/inventory/v1/bulk_migrate_listing", json={})
+
+        assert transport.requests[0].timeout == 30
+        assert 1.9 < transport.requests[1].timeout <= 2.0
+        assert 4.9 < transport.requests[2].timeout <= 5.0
+
+    def test_expired_deadline_sends_nothing(self, make_base_client):
+        transport = FakeTransport()
+        client = make_base_client(transport)
+
+        with use_deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                client.get(ITEM)
+        assert transport.requests == []
+
+    def test_timeout_from_deadline_is_not_an_outage(self, make_base_client):
+        def handler(request):
+            time.sleep(request.timeout)
+            raise requests.Timeout("read timed out")
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = make_base_client(FakeTransport(handler=handler), circuit_breaker=breaker)
+
+        with pytest.raises(DeadlineExceeded):
+            client.get(ITEM, deadline=0.01)
+        assert breaker.state("buy.browse") == "closed"
+
+        with pytest.raises(EbayAPIError) as excinfo:
+            client.transport.handler = lambda request: (_ for _ in ()).throw(
+                requests.ConnectionError("reset")
+            )
+            client.get(ITEM, deadline=5)
+        assert not isinstance(excinfo.value, DeadlineExceeded)
+        assert breaker.state("buy.browse") == "open"
+
+    def test_half_open_trial_cut_short_by_deadline_keeps_circuit_half_open(self, make_base_client):
+        outcomes = [requests.ConnectionError("reset"), "hang", "ok"]
+
+        def handler(request):
+            outcome = outcomes.pop(0)
+            if outcome == "hang":
+                time.sleep(request.timeout)
+                raise requests.Timeout("read timed out")
+            if isinstance(outcome, Exception):
+                raise outcome
+            return TransportResponse.from_json({})
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        client = make_base_client(FakeTransport(handler=handler), circuit_breaker=breaker)
+        with pytest.raises(EbayAPIError):
+            client.get(ITEM)
+
+        # The trial call times out on our own deadline: no verdict on the API either way
+        with pytest.raises(DeadlineExceeded):
+            client.get(ITEM, deadline=0.05)
+        assert breaker.state("buy.browse") == "half_open"
+
+        client.get(ITEM)
+        assert breaker.state("buy.browse") == "closed"
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_refresh_failure_before_sending_leaves_breaker_alone(
+        self, mock_refresh, make_base_client
+    ):
+        mock_refresh.side_effect = AuthError("invalid_grant", status_code=400)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.allow("sell.fulfillment")
+        breaker.record("sell.fulfillment", failed=True)
+        client = make_base_client(FakeTransport(), circuit_breaker=breaker)
+        expired = UserCredentials(access_token="old", refresh_token="r", expires_at=0)
+
+        with client.use_credentials(expired):
+            with pytest.raises(AuthError):
+                client.get("/sell/fulfillment/v1/order")
+        assert client.transport.requests == []
+        assert breaker.state("sell.fulfillment") == "half_open"
+        # The trial slot was handed back, so the next call may probe
+        breaker.allow("sell.fulfillment")
+
+    @pytest.mark.parametrize("component", ["scheduler", "limiter"])
+    def test_slot_wait_ends_at_deadline(self, make_base_client, component):
+        transport = FakeTransport()
+        transport.add_response("GET", ITEM, json={})
+        if component == "scheduler":
+            scheduler = RequestScheduler(max_concurrency=1)
+            held = scheduler.acquire()
+            client = make_base_client(transport, scheduler=scheduler)
+        else:
+            limiter = AdaptiveLimiter(initial_limit=1)
+            held = limiter.acquire()
+            client = make_base_client(transport, limiter=limiter)
+
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            client.get(ITEM, deadline=0.1)
+        assert time.monotonic() - started < 0.5
+        assert transport.requests == []
+
+        if component == "scheduler":
+            assert scheduler.stats()["normal"]["queued"] == 0
+            scheduler.release(held)
+        else:
+            assert limiter.stats()["in_flight"] == 1
+            limiter.release(held)
+        client.get(ITEM)
+        assert len(transport.requests) == 1
+
+    @patch("ebay_rest.oauth.requests.post")
+    def test_token_refresh_within_deadline(self, mock_post, make_base_client):
+        mock_post.return_value = MagicMock(
+            json=MagicMock(return_value={"access_token": "fresh", "expires_in": 7200})
+        )
+        transport = FakeTransport(
+            handler=lambda request: TransportResponse.from_json(
+                {"ok": True},
+                status_code=200 if request.headers["Authorization"] == "Bearer fresh" else 401,
+            )
+        )
+        client = make_base_client(transport, user_refresh_token="refresh")
+
+        assert client.get("/sell/fulfillment/v1/order", deadline=3.0) == {"ok": True}
+        assert mock_post.call_args[1]["timeout"] <= 3.0
+        assert transport.requests[1].timeout <= 3.0
+
+    @patch("ebay_rest.oauth.requests.post")
+    def test_user_token_timeout_at_deadline(self, mock_post, make_base_client):
+        def slow_token_endpoint(*args, **kwargs):
+            time.sleep(kwargs["timeout"])
+            raise requests.Timeout("read timed out")
+
+        mock_post.side_effect = slow_token_endpoint
+        transport = FakeTransport()
+        transport.add_response("GET", ITEM, status_code=401, json={})
+        client = make_base_client(transport, user_refresh_token="refresh")
+
+        # The refresh after the 401 runs out the deadline: not a bad refresh token
+        with pytest.raises(DeadlineExceeded):
+            client.get(ITEM, deadline=0.05)
+        assert len(transport.requests) == 1
+
+    @patch("ebay_rest.auth.requests.post")
+    def test_app_token_timeout_at_deadline(self, mock_post):
+        def slow_token_endpoint(*args, **kwargs):
+            time.sleep(kwargs["timeout"])
+            raise requests.Timeout("read timed out")
+
+        mock_post.side_effect = slow_token_endpoint
+        auth = OAuth2Client("id", "secret")
+
+        with use_deadline(0.05), pytest.raises(DeadlineExceeded):
+            auth.get_access_token()
+        # Without a deadline the same timeout is an auth failure
+        mock_post.side_effect = requests.Timeout("read timed out")
+        with pytest.raises(AuthError):
+            auth.get_access_token()
+
+    def test_rate_limit_wait_past_deadline(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", ITEM, json={})
+        sleeps: list[float] = []
+        client = make_base_client(
+            transport, rate_limiter=TokenBucket(rate=1, burst=1, sleep=sleeps.append)
+        )
+        client.get(ITEM)
+
+        with pytest.raises(DeadlineExceeded):
+            client.get(ITEM, deadline=0.5)
+        assert sleeps == []
+        assert len(transport.requests) == 1
+
+
+class TestPaginationDeadline:
+    """Deadlines across paginated fetches."""
+
+    def test_paginate_abandons_remaining_pages(self):
+        calls: list[float] = []
+
+        def list_orders(offset=0, page_size=2):
+            calls.append(time_remaining())
+            time.sleep(0.03)
+            return {"orders": [{"n": offset}, {"n": offset + 1}]}
+
+        items = paginate(
+            list_orders,
+            items_key="orders",
+            limit_param="page_size",
+            page_size=2,
+            offset=0,
+            deadline=0.05,
+        )
+        with pytest.raises(DeadlineExceeded):
+            list(items)
+        assert len(calls) == 2
+        assert all(remaining is not None for remaining in calls)
+        assert time_remaining() is None
+
+    def test_paginate_concurrently_applies_deadline_to_workers(self):
+        seen: list[float] = []
+
+        def list_items(offset, limit):
+            seen.append(time_remaining())
+            return {"items": list(range(offset, min(offset + limit, 6))), "total": 6}
+
+        assert list(paginate_concurrently(list_items, page_size=2, deadline=5)) == list(range(6))
+        assert len(seen) == 3 and all(
+            remaining is not None and remaining <= 5 for remaining in seen
+        )
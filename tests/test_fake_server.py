@@ -0,0 +1,213 @@
+"""Tests for the local stand-in eBay API."""
+
+import pytest
+
+from ebay_rest import EbayClient
+from ebay_rest.base_client import BaseClient
+from ebay_rest.errors import NotFoundError, RateLimitExceeded, ServerError
+from ebay_rest.pagination import paginate
+from ebay_rest.testing import FakeEbayApi, FakeEbayServer
+from ebay_rest.testing import data
+
+AUTH = {"Authorization": "Bearer token"}
+
+
+class TestFakeEbayApi:
+    """FakeEbayApi test suite (in-process, no sockets)."""
+
+    def test_search_pages_through_generated_items(self):
+        api = FakeEbayApi(items=120)
+        first = api.handle(
+            "GET", "/buy/browse/v1/item_summary/search", {"q": "x", "limit": "50"}, headers=AUTH
+        ).json()
+
+        assert first["total"] == 120
+        assert len(first["itemSummaries"]) == 50
+        assert first["itemSummaries"][0]["itemId"] == data.item_id(0)
+        assert "offset=50" in first["next"]
+
+        last = api.handle(
+            "GET",
+            "/buy/browse/v1/item_summary/search",
+            {"q": "x", "limit": "50", "offset": "100"},
+            headers=AUTH,
+        ).json()
+        assert len(last["itemSummaries"]) == 20
+        assert "next" not in last
+
+    def test_get_item_and_order(self):
+        api = FakeEbayApi(items=10, orders=10)
+        item = api.handle("GET", f"/buy/browse/v1/item/{data.item_id(3)}", headers=AUTH)
+        order = api.handle("GET", f"/sell/fulfillment/v1/order/{data.order_id(7)}", headers=AUTH)
+
+        assert item.json()["title"] == data.item(3)["title"]
+        assert order.json()["orderId"] == data.order_id(7)
+        missing = api.handle("GET", f"/buy/browse/v1/item/{data.item_id(10)}", headers=AUTH)
+        assert missing.status_code == 404
+
+    def test_requires_bearer_token(self):
+        response = FakeEbayApi().handle("GET", "/sell/account/v1/privilege")
+        assert response.status_code == 401
+
+    def test_unknown_path_and_method(self):
+        api = FakeEbayApi()
+        assert api.handle("GET", "/nope", headers=AUTH).status_code == 404
+        assert api.handle("POST", "/sell/account/v1/privilege", headers=AUTH).status_code == 405
+
+    def test_inventory_crud_is_stateful(self):
+        api = FakeEbayApi(inventory_items=5)
+        path = "/sell/inventory/v1/inventory_item"
+
+        assert (
+            api.handle("DELETE", f"{path}/{data.inventory_sku(1)}", headers=AUTH).status_code == 204
+        )
+        assert api.handle("GET", f"{path}/{data.inventory_sku(1)}", headers=AUTH).status_code == 404
+        put = api.handle("PUT", f"{path}/NEW-1", json={"condition": "NEW"}, headers=AUTH)
+        assert put.status_code == 204
+        assert api.inventory_count == 5
+
+        listing = api.handle("GET", path, {"limit": "10"}, headers=AUTH).json()
+        skus = [record["sku"] for record in listing["inventoryItems"]]
+        assert skus == [data.inventory_sku(i) for i in (0, 2, 3, 4)] + ["NEW-1"]
+
+    def test_listing_offsets_skip_deleted_items(self):
+        api = FakeEbayApi(inventory_items=10)
+        path = "/sell/inventory/v1/inventory_item"
+        for index in (0, 2, 3):
+            api.handle("DELETE", f"{path}/{data.inventory_sku(index)}", headers=AUTH)
+
+        page = api.handle("GET", path, {"limit": "2", "offset": "1"}, headers=AUTH).json()
+        assert [record["sku"] for record in page["inventoryItems"]] == [
+            data.inventory_sku(4),
+            data.inventory_sku(5),
+        ]
+
+    def test_bulk_create_or_replace(self):
+        api = FakeEbayApi(inventory_items=0)
+        body = {
+            "requests": [{"sku": f"B-{i}", "inventoryItem": {"condition": "NEW"}} for i in range(3)]
+        }
+        response = api.handle(
+            "POST",
+            "/sell/inventory/v1/bulk_create_or_replace_inventory_item",
+            json=body,
+            headers=AUTH,
+        )
+
+        assert [entry["statusCode"] for entry in response.json()["responses"]] == [200, 200, 200]
+        assert api.inventory_count == 3
+        too_many = {"requests": body["requests"] * 9}
+        assert (
+            api.handle(
+                "POST",
+                "/sell/inventory/v1/bulk_create_or_replace_inventory_item",
+                json=too_many,
+                headers=AUTH,
+            ).status_code
+            == 400
+        )
+
+    def test_policies_require_marketplace(self):
+        api = FakeEbayApi()
+        ok = api.handle(
+            "GET", "/sell/account/v1/return_policy", {"marketplace_id": "EBAY_US"}, headers=AUTH
+        )
+        assert ok.json()["returnPolicies"][0]["marketplaceId"] == "EBAY_US"
+        assert api.handle("GET", "/sell/account/v1/payment_policy", headers=AUTH).status_code == 400
+
+    def test_fault_injection(self):
+        api = FakeEbayApi(throttle_rate=1.0, seed=1)
+        response = api.handle("GET", "/sell/account/v1/privilege", headers=AUTH)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+        api.throttle_rate, api.error_rate = 0.0, 1.0
+        status = api.handle("GET", "/sell/account/v1/privilege", headers=AUTH).status_code
+        assert status in (500, 503)
+        assert api.stats()["throttled"] == 1
+        assert api.stats()["server_errors"] == 1
+
+    def test_invalid_rates(self):
+        with pytest.raises(ValueError):
+            FakeEbayApi(error_rate=1.5)
+
+    def test_token_endpoint(self):
+        api = FakeEbayApi(token_ttl=60)
+        response = api.handle(
+            "POST",
+            "/identity/v1/oauth2/token",
+            headers={"Authorization": "Basic abc"},
+            form={"grant_type": "client_credentials"},
+        )
+        assert response.json()["expires_in"] == 60
+        unauthenticated = api.handle(
+            "POST", "/identity/v1/oauth2/token", form={"grant_type": "client_credentials"}
+        )
+        assert unauthenticated.status_code == 401
+
+    def test_in_process_transport(self, mock_oauth_client):
+        api = FakeEbayApi(orders=30)
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="token",
+            transport=api.transport(),
+        )
+        response = client.get("/sell/fulfillment/v1/order", params={"limit": 20, "offset": 20})
+        assert len(response["orders"]) == 10
+
+
+class TestFakeEbayServer:
+    """EbayClient pointed at a FakeEbayServer over HTTP."""
+
+    @pytest.fixture
+    def server(self):
+        with FakeEbayServer(
+            FakeEbayApi(items=500, orders=450, inventory_items=50, seed=0)
+        ) as server:
+            yield server
+
+    def test_app_token_and_search(self, server):
+        client = EbayClient("id", "secret", base_url=server.url)
+        result = client.browse.search_items("camera", limit=10)
+
+        assert result["total"] == 500
+        assert len(result["items"]) == 10
+        assert server.api.stats()["tokens_issued"] == 1
+
+    def test_get_item_with_encoded_id(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, user_access_token="token")
+        assert client.browse.get_item(data.item_id(42))["item_id"] == data.item_id(42)
+
+    def test_paginates_whole_dataset(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, user_access_token="token")
+        orders = list(paginate(client.orders.list_orders, items_key="orders"))
+        assert len(orders) == 450
+        assert len({order["order_id"] for order in orders}) == 450
+
+    def test_user_token_refresh(self, server):
+        client = EbayClient(
+            "id",
+            "secret",
+            base_url=server.url,
+            user_refresh_token="refresh",
+            user_token_scopes=["s"],
+        )
+        profile = client.account.get_account_profile()
+
+        assert profile["selling_limit"]["quantity"] == 5000
+        assert client.base_client.user_access_token.startswith("v^1.1")
+
+    def test_errors_mapped(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, user_access_token="token")
+        with pytest.raises(NotFoundError):
+            client.orders.get_order("00-00000-00000")
+
+        server.api.throttle_rate = 1.0
+        with pytest.raises(RateLimitExceeded) as excinfo:
+            client.orders.list_orders()
+        assert excinfo.value.retry_after == 1
+
+        server.api.throttle_rate, server.api.error_rate = 0.0, 1.0
+        with pytest.raises(ServerError):
+            client.orders.list_orders()
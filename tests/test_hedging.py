@@ -0,0 +1,191 @@
+"""Tests for hedged GET requests."""
+
+import threading
+import time
+
+import pytest
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.concurrency import AdaptiveLimiter
+from ebay_rest.errors import ServerError
+from ebay_rest.hedging import HedgePolicy
+from ebay_rest.quota import QuotaLedger
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+ITEM = "/buy/browse/v1/item/v1|{}|0"
+
+
+def _slow_first_copy(second_status: int = 200):
+    """Handler where the first copy of ``v1|slow|0`` hangs until a second copy arrives."""
+    arrived = threading.Event()
+    copies = []
+    lock = threading.Lock()
+
+    def handler(request):
+        if "slow" not in request.path:
+            return TransportResponse.from_json({"fast": True})
+        with lock:
+            copies.append(request.path)
+            copy = len(copies)
+        if copy == 1:
+            # Answer a little after the second copy, so that copy's response lands first
+            if arrived.wait(0.2):
+                time.sleep(0.05)
+            return TransportResponse.from_json({"copy": 1})
+        arrived.set()
+        return TransportResponse.from_json({"copy": copy}, status_code=second_status)
+
+    return handler
+
+
+class TestHedgePolicy:
+    """HedgePolicy test suite."""
+
+    def test_learns_delay_per_endpoint(self):
+        policy = HedgePolicy(percentile=0.9, min_samples=10, min_delay=0.0)
+        endpoint = "GET /buy/browse/v1/item/{id}"
+        for n in range(9):
+            policy.observe(endpoint, (n + 1) / 10)
+        assert policy.delay(endpoint) is None
+
+        policy.observe(endpoint, 1.0)
+        assert policy.delay(endpoint) == 1.0
+        assert policy.delay("GET /buy/browse/v1/item_summary/search") is None
+
+    def test_applies_to_listed_gets_only(self):
+        policy = HedgePolicy()
+        assert policy.applies("GET", "/buy/browse/v1/item/v1|1|0")
+        assert not policy.applies("POST", "/buy/browse/v1/item/v1|1|0")
+        assert not policy.applies("GET", "/sell/fulfillment/v1/order")
+
+    def test_busy_pool_sends_from_callers_thread(self):
+        policy = HedgePolicy(min_samples=1, min_delay=5.0, max_workers=1)
+        path = ITEM.format(1)
+        policy.observe("GET /buy/browse/v1/item/{id}", 0.01)
+        started, release = threading.Event(), threading.Event()
+
+        def hold_the_worker():
+            started.set()
+            release.wait(2)
+            return threading.current_thread().name
+
+        holder = threading.Thread(target=policy.send, args=("GET", path, hold_the_worker))
+        holder.start()
+        try:
+            assert started.wait(2)
+            # No queueing behind the held worker: the call goes out unhedged right away
+            assert policy.send("GET", path, lambda: threading.current_thread().name) == "MainThread"
+        finally:
+            release.set()
+            holder.join()
+            policy.close()
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=1.0)
+        with pytest.raises(ValueError):
+            HedgePolicy(budget=2.0)
+
+
+class TestBaseClientHedging:
+    """Hedged sends in BaseClient."""
+
+    def _client(self, mock_oauth_client, handler, policy, **kwargs):
+        transport = FakeTransport(handler=handler)
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="t",
+            transport=transport,
+            hedge=policy,
+            **kwargs,
+        )
+        for n in range(20):
+            client.get(ITEM.format(n))
+        return client, transport
+
+    def test_slow_call_is_hedged(self, mock_oauth_client):
+        policy = HedgePolicy(budget=0.05, min_samples=20)
+        client, transport = self._client(mock_oauth_client, _slow_first_copy(), policy)
+
+        assert client.get(ITEM.format("slow")) == {"copy": 2}
+        assert len(transport.requests) == 22
+        assert policy.stats()["hedges"] == 1 and policy.stats()["wins"] == 1
+        policy.close()
+
+    def test_budget_caps_hedges(self, mock_oauth_client):
+        policy = HedgePolicy(budget=0.01, min_samples=20)
+        client, transport = self._client(mock_oauth_client, _slow_first_copy(), policy)
+
+        # 21 hedgeable calls allow 0.21 hedges: none is sent and the call waits it out
+        assert client.get(ITEM.format("slow")) == {"copy": 1}
+        assert policy.stats()["hedges"] == 0
+        policy.close()
+
+    def test_fast_server_error_does_not_win(self, mock_oauth_client):
+        policy = HedgePolicy(min_samples=20)
+        client, _ = self._client(mock_oauth_client, _slow_first_copy(second_status=503), policy)
+
+        assert client.get(ITEM.format("slow")) == {"copy": 1}
+        assert policy.stats()["wins"] == 0
+        policy.close()
+
+    def test_hedges_are_charged_to_quota(self, mock_oauth_client):
+        ledger = QuotaLedger({"buy.browse": 100})
+        policy = HedgePolicy(min_samples=20)
+        client, _ = self._client(mock_oauth_client, _slow_first_copy(), policy, quota=ledger)
+        ledger.set_used("buy.browse", 85)
+
+        # BULK ceiling reached: the hedge is skipped, the call itself still goes out
+        assert client.get(ITEM.format("slow")) == {"copy": 1}
+        assert policy.stats()["hedges"] == 0
+        assert ledger.used("buy.browse") == 86
+        policy.close()
+
+    def test_both_copies_failing_raises(self, mock_oauth_client):
+        def handler(request):
+            if "slow" in request.path:
+                return TransportResponse.from_json({}, status_code=503)
+            return TransportResponse.from_json({})
+
+        policy = HedgePolicy(min_samples=20)
+        client, _ = self._client(mock_oauth_client, handler, policy)
+        with pytest.raises(ServerError):
+            client.get(ITEM.format("slow"))
+        policy.close()
+
+    def test_hedges_are_paced_and_limited(self, mock_oauth_client):
+        class CountingLimiter:
+            def __init__(self):
+                self.calls = 0
+
+            def acquire(self, cost=1.0):
+                self.calls += 1
+                return 0.0
+
+        pacer = CountingLimiter()
+        limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=None)
+        policy = HedgePolicy(min_samples=20)
+        client, _ = self._client(
+            mock_oauth_client,
+            _slow_first_copy(second_status=503),
+            policy,
+            rate_limiter=pacer,
+            limiter=limiter,
+        )
+
+        assert client.get(ITEM.format("slow")) == {"copy": 1}
+        # 20 warm-up calls, the slow call and its hedge
+        assert pacer.calls == 22
+        # The hedge's 503 is eBay pushing back, and cuts the limit like any other
+        assert limiter.stats()["decreases"] == 1
+        assert limiter.stats()["in_flight"] == 0
+        client.close()
+
+    def test_close_stops_hedging_threads(self, mock_oauth_client):
+        policy = HedgePolicy(min_samples=20)
+        client, _ = self._client(mock_oauth_client, _slow_first_copy(), policy)
+        client.get(ITEM.format("slow"))
+
+        client.close()
+        assert policy._executor is None
@@ -0,0 +1,238 @@
+"""Tests for request hooks and the observability adapters built on them."""
+
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from ebay_rest.contrib.prometheus import PrometheusExporter
+from ebay_rest.errors import EbayAPIError, NotFoundError
+from ebay_rest.hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    EVENTS,
+    ON_ERROR,
+    ON_RETRY,
+    ON_TOKEN_REFRESH,
+    HookRegistry,
+)
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+
+def _record_all(hooks: HookRegistry) -> list[tuple[str, object]]:
+    seen: list[tuple[str, object]] = []
+    for name in EVENTS:
+        hooks.register(name, lambda event, name=name: seen.append((name, event)))
+    return seen
+
+
+def _refreshing_transport() -> FakeTransport:
+    return FakeTransport(
+        handler=lambda request: TransportResponse.from_json(
+            {"ok": True},
+            status_code=200 if request.headers["Authorization"] == "Bearer fresh" else 401,
+        )
+    )
+
+
+class TestHookRegistry:
+    """HookRegistry test suite."""
+
+    def test_disabled_until_registered(self):
+        hooks = HookRegistry()
+        assert not hooks.enabled
+
+        hook = hooks.register(BEFORE_REQUEST, lambda event: None)
+        assert hooks.enabled
+        hooks.unregister(BEFORE_REQUEST, hook)
+        assert not hooks.enabled
+
+    def test_rejects_unknown_events_and_coroutines(self):
+        hooks = HookRegistry()
+        with pytest.raises(ValueError):
+            hooks.register("before_sending", lambda event: None)
+
+        async def hook(event):
+            pass
+
+        with pytest.raises(TypeError):
+            hooks.register(BEFORE_REQUEST, hook)
+
+    def test_failing_hook_is_isolated(self, caplog):
+        hooks = HookRegistry()
+        calls = []
+
+        @hooks.on(AFTER_RESPONSE)
+        def broken(event):
+            raise RuntimeError("boom")
+
+        hooks.register(AFTER_RESPONSE, calls.append)
+        hooks.emit(AFTER_RESPONSE, "event")
+
+        assert calls == ["event"]
+        assert "boom" in caplog.text
+
+
+class TestBaseClientHooks:
+    """Hook dispatch from BaseClient."""
+
+    def test_success(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", "/x", json={"ok": True})
+        client = make_base_client(transport)
+        seen = _record_all(client.hooks)
+
+        @client.hooks.on(BEFORE_REQUEST)
+        def add_header(event):
+            event.headers["traceparent"] = "00-abc-def-01"
+
+        client.get("/x", params={"q": "1"})
+
+        assert [name for name, _ in seen] == [BEFORE_REQUEST, AFTER_RESPONSE]
+        event = seen[-1][1]
+        assert (event.method, event.path, event.params) == ("GET", "/x", {"q": "1"})
+        assert event.status_code == 200 and event.error is None and event.elapsed >= 0
+        assert transport.requests[0].headers["traceparent"] == "00-abc-def-01"
+
+    def test_http_error(self, make_base_client):
+        client = make_base_client(FakeTransport())
+        seen = _record_all(client.hooks)
+
+        with pytest.raises(NotFoundError):
+            client.get("/missing")
+
+        assert [name for name, _ in seen] == [BEFORE_REQUEST, AFTER_RESPONSE, ON_ERROR]
+        assert seen[1][1].status_code == 404
+        assert isinstance(seen[1][1].error, NotFoundError)
+
+    def test_network_error(self, make_base_client):
+        def handler(request):
+            raise requests.ConnectionError("refused")
+
+        client = make_base_client(FakeTransport(handler=handler))
+        seen = _record_all(client.hooks)
+
+        with pytest.raises(EbayAPIError):
+            client.get("/x")
+
+        assert [name for name, _ in seen] == [BEFORE_REQUEST, ON_ERROR]
+        assert seen[-1][1].response is None
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_token_refresh_retry(self, mock_refresh, make_base_client):
+        mock_refresh.return_value = {"access_token": "fresh", "expires_in": 7200}
+        client = make_base_client(_refreshing_transport(), user_refresh_token="refresh")
+        seen = _record_all(client.hooks)
+
+        client.get("/x")
+
+        assert [name for name, _ in seen] == [
+            BEFORE_REQUEST,
+            ON_TOKEN_REFRESH,
+            ON_RETRY,
+            AFTER_RESPONSE,
+        ]
+        refresh, retry = seen[1][1], seen[2][1]
+        assert refresh.error is None and refresh.elapsed >= 0
+        assert retry.retry_reason == "token_refresh" and retry.attempt == 2
+        assert seen[-1][1].status_code == 200
+
+    def test_no_hooks_dispatches_nothing(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", "/x", json={})
+        client = make_base_client(transport)
+
+        with patch.object(client.hooks, "emit") as emit:
+            client.get("/x")
+        emit.assert_not_called()
+
+
+class TestPrometheusExporter:
+    """PrometheusExporter test suite."""
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_render(self, mock_refresh, make_base_client):
+        mock_refresh.return_value = {"access_token": "fresh", "expires_in": 7200}
+        transport = _refreshing_transport()
+        client = make_base_client(transport, user_refresh_token="refresh")
+        exporter = PrometheusExporter(buckets=(0.1, 1.0)).install(client.hooks)
+
+        client.get("/buy/browse/v1/item/v1|1|0")
+        client.get("/buy/browse/v1/item/v1|2|0")
+        transport.handler = lambda request: (_ for _ in ()).throw(requests.Timeout("slow"))
+        with pytest.raises(EbayAPIError):
+            client.get("/buy/browse/v1/item/v1|3|0")
+
+        text = exporter.render()
+        item = 'method="GET",endpoint="/buy/browse/v1/item/{id}"'
+        assert f'ebay_rest_requests_total{{{item},status="200"}} 2' in text
+        assert f'ebay_rest_requests_total{{{item},status="error"}} 1' in text
+        assert f'ebay_rest_request_duration_seconds_bucket{{{item},le="+Inf"}} 3' in text
+        assert f"ebay_rest_request_duration_seconds_count{{{item}}} 3" in text
+        assert 'ebay_rest_retries_total{reason="token_refresh"} 1' in text
+        assert 'ebay_rest_token_refreshes_total{result="success"} 1' in text
+        assert 'ebay_rest_errors_total{type="EbayAPIError"} 1' in text
+
+        exporter.uninstall(client.hooks)
+        assert not client.hooks.enabled
+
+    def test_serve(self):
+        exporter = PrometheusExporter()
+        server = exporter.serve(port=0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                assert b"# TYPE ebay_rest_requests_total counter" in response.read()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestOpenTelemetryHooks:
+    """OpenTelemetryHooks test suite."""
+
+    @pytest.fixture
+    def spans(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        return provider.get_tracer("test"), exporter
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_spans(self, mock_refresh, make_base_client, spans):
+        from opentelemetry.trace import StatusCode
+
+        from ebay_rest.contrib.opentelemetry import OpenTelemetryHooks
+
+        tracer, exporter = spans
+        mock_refresh.return_value = {"access_token": "fresh", "expires_in": 7200}
+        transport = _refreshing_transport()
+        client = make_base_client(transport, user_refresh_token="refresh")
+        OpenTelemetryHooks(tracer).install(client.hooks)
+
+        client.get("/buy/browse/v1/item/v1|1|0")
+        transport.handler = lambda request: TransportResponse.from_json({}, status_code=503)
+        with pytest.raises(EbayAPIError):
+            client.get("/sell/fulfillment/v1/order/1-2-3")
+
+        finished = {span.name: span for span in exporter.get_finished_spans()}
+        assert set(finished) == {
+            "ebay_rest token refresh",
+            "GET /buy/browse/v1/item/{id}",
+            "GET /sell/fulfillment/v1/order/{id}",
+        }
+        ok = finished["GET /buy/browse/v1/item/{id}"]
+        assert ok.attributes["http.response.status_code"] == 200
+        assert ok.attributes["http.request.resend_count"] == 1
+        assert [event.name for event in ok.events] == ["retry"]
+        failed = finished["GET /sell/fulfillment/v1/order/{id}"]
+        assert failed.status.status_code == StatusCode.ERROR
+        assert failed.attributes["error.type"] == "ServerError"
+        assert "traceparent" in transport.requests[-1].headers
@@ -0,0 +1,116 @@
+"""Tests for the optional HTTP/2 transport."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+from ebay_rest.base_client import BaseClient  # noqa: E402
+from ebay_rest.errors import EbayAPIError, NotFoundError  # noqa: E402
+from ebay_rest.http2 import Http2Transport, _to_httpx_timeout  # noqa: E402
+
+
+def _mock_transport(handler) -> Http2Transport:
+    return Http2Transport(transport=httpx.MockTransport(handler))
+
+
+class TestHttp2Transport:
+    """Http2Transport test suite."""
+
+    def test_request_passes_params_json_and_headers(self):
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["body"] = request.content
+            seen["auth"] = request.headers["Authorization"]
+            return httpx.Response(201, json={"created": True})
+
+        response = _mock_transport(handler).send(
+            "POST",
+            "https://api.ebay.com/x",
+            json={"a": 1},
+            headers={"Authorization": "Bearer t"},
+            timeout=30,
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"created": True}
+        assert seen["body"] == b'{"a":1}'
+        assert seen["auth"] == "Bearer t"
+
+    def test_none_params_are_dropped(self):
+        seen = {}
+
+        def handler(request):
+            seen["query"] = dict(request.url.params)
+            return httpx.Response(200, json={})
+
+        _mock_transport(handler).send(
+            "GET", "https://api.ebay.com/x", params={"q": "lens", "offset": None}, timeout=1
+        )
+
+        assert seen["query"] == {"q": "lens"}
+
+    def test_timeout_is_mapped_to_requests(self):
+        def handler(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        with pytest.raises(requests.Timeout):
+            _mock_transport(handler).send("GET", "https://api.ebay.com/x", timeout=1)
+
+    def test_transport_error_is_mapped_to_requests(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(requests.ConnectionError):
+            _mock_transport(handler).send("GET", "https://api.ebay.com/x", timeout=1)
+
+    def test_connect_read_timeout_tuple(self):
+        timeout = _to_httpx_timeout((3.0, 20.0))
+        assert timeout.connect == 3.0
+        assert timeout.read == 20.0
+
+
+class TestBaseClientHttp2:
+    """BaseClient routed over the HTTP/2 transport."""
+
+    def _client(self, handler) -> BaseClient:
+        client = BaseClient(
+            auth_client=MagicMock(),
+            base_url="https://api.ebay.com",
+            user_access_token="token",
+            http2=True,
+        )
+        client.transport = _mock_transport(handler)
+        return client
+
+    def test_http2_transport_selected(self):
+        client = BaseClient(auth_client=MagicMock(), base_url="https://api.ebay.com", http2=True)
+        assert isinstance(client.transport, Http2Transport)
+        assert client.transport.prior_knowledge is False
+        assert "http2_connections" in client.pool_stats()
+
+    def test_plain_http_uses_prior_knowledge(self):
+        client = BaseClient(auth_client=MagicMock(), base_url="http://127.0.0.1:8080", http2=True)
+        assert client.transport.prior_knowledge is True
+
+    def test_get_success(self):
+        client = self._client(lambda request: httpx.Response(200, json={"items": []}))
+        assert client.get("/buy/browse/v1/item_summary/search", params={"q": "x"}) == {"items": []}
+
+    def test_error_mapping_unchanged(self):
+        client = self._client(
+            lambda request: httpx.Response(404, json={"errors": [{"message": "Gone"}]})
+        )
+        with pytest.raises(NotFoundError, match="Gone"):
+            client.get("/buy/browse/v1/item/1")
+
+    def test_network_error_mapping_unchanged(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(EbayAPIError, match="Network error during GET request"):
+            self._client(handler).get("/x")
@@ -0,0 +1,175 @@
+"""Tests for request metrics."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ebay_rest.browse.client import BrowseClient
+from ebay_rest.browse.models import SearchResponse
+from ebay_rest.cache import MemoryCache
+from ebay_rest.credentials import UserCredentials
+from ebay_rest.errors import EbayAPIError, NotFoundError
+from ebay_rest.metrics import ClientMetrics, Histogram, endpoint_template
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+
+class TestHistogram:
+    """Histogram test suite."""
+
+    def test_buckets_and_summary(self):
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 5
+        assert snapshot["buckets"] == {"0.01": 1, "0.1": 2, "1.0": 1, "+Inf": 1}
+        assert snapshot["min"] == 0.005
+        assert snapshot["max"] == 5.0
+        assert snapshot["mean"] == pytest.approx(1.121)
+
+    def test_percentiles_use_bucket_upper_bounds(self):
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for _ in range(99):
+            histogram.observe(0.005)
+        histogram.observe(0.7)
+
+        assert histogram.percentile(0.5) == 0.01
+        assert histogram.percentile(0.99) == 0.01
+        assert histogram.percentile(1.0) == 0.7  # capped at the observed max
+
+    def test_empty(self):
+        assert Histogram().percentile(0.5) is None
+        assert Histogram().snapshot()["mean"] is None
+
+
+class TestEndpointTemplate:
+    """endpoint_template test suite."""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/buy/browse/v1/item/v1|123|0", "GET /buy/browse/v1/item/{id}"),
+            ("/buy/browse/v1/item_summary/search", "GET /buy/browse/v1/item_summary/search"),
+            (
+                "/sell/inventory/v1/inventory_item/my-shirt",
+                "GET /sell/inventory/v1/inventory_item/{id}",
+            ),
+            ("/sell/fulfillment/v1/order/12-34567-89012", "GET /sell/fulfillment/v1/order/{id}"),
+        ],
+    )
+    def test_ids_collapsed(self, path, expected):
+        assert endpoint_template("GET", path) == expected
+
+
+class TestBaseClientMetrics:
+    """Metrics recorded by BaseClient."""
+
+    def test_breakdown_counters_and_bytes(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", "/buy/browse/v1/item/v1|1|0", json={"itemId": "v1|1|0"})
+        transport.add_response(
+            "PUT", "/sell/inventory/v1/inventory_item/A", json=None, status_code=204
+        )
+        client = make_base_client(transport)
+
+        client.get("/buy/browse/v1/item/v1|1|0")
+        client.put("/sell/inventory/v1/inventory_item/A", json={"sku": "A"})
+        with pytest.raises(NotFoundError):
+            client.get("/buy/browse/v1/item/v1|2|0")
+
+        snapshot = client.metrics.snapshot()
+        assert snapshot["requests"] == 3
+        assert snapshot["status_codes"] == {"200": 1, "204": 1, "404": 1}
+        assert snapshot["endpoints"]["GET /buy/browse/v1/item/{id}"]["count"] == 2
+        assert snapshot["bytes_out"] == len(b'{"sku": "A"}')
+        assert snapshot["bytes_in"] > 0
+        for phase in ("token", "ttfb", "body", "decode"):
+            assert snapshot["phases"][phase]["count"] == 3
+        assert snapshot["recent"][-1]["status"] == 404
+
+    def test_network_errors_counted(self, make_base_client):
+        import requests
+
+        def handler(request):
+            raise requests.ConnectionError("refused")
+
+        client = make_base_client(FakeTransport(handler=handler))
+        with pytest.raises(EbayAPIError):
+            client.get("/x")
+        assert client.metrics.snapshot()["errors"] == {"ConnectionError": 1}
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_token_refresh_retry_counted(self, mock_refresh, make_base_client):
+        mock_refresh.return_value = {"access_token": "fresh", "expires_in": 7200}
+        transport = FakeTransport(
+            handler=lambda request: TransportResponse.from_json(
+                {}, status_code=200 if request.headers["Authorization"] == "Bearer fresh" else 401
+            )
+        )
+        client = make_base_client(transport, user_refresh_token="refresh")
+
+        client.get("/x")
+
+        snapshot = client.metrics.snapshot()
+        assert snapshot["retries"] == {"token_refresh": 1}
+        assert snapshot["status_codes"] == {"200": 1, "401": 1}
+        assert snapshot["recent"][-1]["retries"] == 1
+
+    def test_validation_attributed_to_last_request(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response(
+            "GET",
+            "/buy/browse/v1/item_summary/search",
+            json={"itemSummaries": [{"itemId": "1", "title": "t"}], "total": 1},
+        )
+        client = make_base_client(transport)
+
+        BrowseClient(client).search_items("q")
+
+        snapshot = client.metrics.snapshot()
+        assert snapshot["validation"]["SearchResponse"]["count"] == 1
+        assert "validate" in snapshot["recent"][-1]["phases"]
+        assert isinstance(client.parse(SearchResponse, {"total": 0}), SearchResponse)
+
+    def test_validation_after_cache_hit_not_attributed(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response(
+            "GET",
+            "/buy/browse/v1/item_summary/search",
+            json={"itemSummaries": [{"itemId": "1", "title": "t"}], "total": 1},
+        )
+        client = make_base_client(transport, cache=MemoryCache())
+        browse = BrowseClient(client)
+        browse.search_items("q")
+        phases = dict(client.metrics.snapshot()["recent"][-1]["phases"])
+
+        browse.search_items("q")
+
+        snapshot = client.metrics.snapshot()
+        assert len(transport.requests) == 1
+        assert snapshot["validation"]["SearchResponse"]["count"] == 2
+        assert snapshot["recent"][-1]["phases"] == phases
+
+    def test_disabled(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response("GET", "/x", json={})
+        client = make_base_client(transport, metrics=False)
+
+        assert client.get("/x") == {}
+        assert client.metrics is None
+        assert client.parse(SearchResponse, {}).total == 0
+
+    def test_shared_collector_and_seller_views(self, make_base_client):
+        shared = ClientMetrics()
+        transport = FakeTransport()
+        transport.add_response("GET", "/x", json={})
+        first = make_base_client(transport, metrics=shared)
+        second = make_base_client(transport, metrics=shared)
+
+        first.get("/x")
+        second.as_user(UserCredentials(access_token="seller")).get("/x")
+
+        assert shared.snapshot()["requests"] == 2
+        shared.reset()
+        assert shared.snapshot()["requests"] == 0
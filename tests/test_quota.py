@@ -0,0 +1,181 @@
+"""Tests for the daily quota ledger and quota-aware degradation."""
+
+import datetime
+import time
+
+import pytest
+from conftest import FakeClock
+
+from ebay_rest.cache import MemoryCache
+from ebay_rest.concurrency import AdaptiveLimiter
+from ebay_rest.errors import DeadlineExceeded, QuotaExhausted, RateLimitExceeded
+from ebay_rest.metrics import api_family
+from ebay_rest.priority import Priority, current_priority, use_priority
+from ebay_rest.quota import QuotaLedger
+from ebay_rest.transport import FakeTransport
+
+# 2026-03-01 18:00:00 UTC
+EVENING = datetime.datetime(2026, 3, 1, 18, tzinfo=datetime.timezone.utc).timestamp()
+
+
+def _drain(ledger: QuotaLedger, family: str, priority: Priority) -> int:
+    calls = 0
+    while True:
+        try:
+            ledger.acquire(family, priority)
+        except QuotaExhausted:
+            return calls
+        calls += 1
+
+
+class TestPriority:
+    """use_priority test suite."""
+
+    def test_scoped_to_block(self):
+        assert current_priority() is Priority.NORMAL
+        with use_priority(Priority.BULK):
+            assert current_priority() is Priority.BULK
+        assert current_priority() is Priority.NORMAL
+
+
+class TestQuotaLedger:
+    """QuotaLedger test suite."""
+
+    def test_api_family(self):
+        assert api_family("/buy/browse/v1/item/v1|1|0") == "buy.browse"
+        assert api_family("sell/fulfillment/v1/order?limit=1") == "sell.fulfillment"
+
+    def test_ceilings_by_priority(self):
+        ledger = QuotaLedger({"buy.browse": 100}, clock=FakeClock(EVENING))
+
+        assert _drain(ledger, "buy.browse", Priority.BULK) == 85
+        assert _drain(ledger, "buy.browse", Priority.NORMAL) == 10
+        assert _drain(ledger, "buy.browse", Priority.CRITICAL) == 5
+        assert ledger.stats()["buy.browse"] == {"used": 100, "limit": 100, "remaining": 0}
+
+    def test_refusal_retries_after_reset(self):
+        clock = FakeClock(EVENING)
+        ledger = QuotaLedger({"buy.browse": 1}, reserve=0.0, clock=clock)
+        ledger.acquire("buy.browse")
+
+        with pytest.raises(QuotaExhausted) as excinfo:
+            ledger.acquire("buy.browse")
+        assert isinstance(excinfo.value, RateLimitExceeded)
+        assert excinfo.value.retry_after == 6 * 3600
+        assert excinfo.value.family == "buy.browse"
+
+        clock.now += 6 * 3600
+        assert ledger.acquire("buy.browse") == 1
+
+    def test_unlimited_families_are_counted(self):
+        ledger = QuotaLedger({}, clock=FakeClock(EVENING))
+        for _ in range(3):
+            ledger.acquire("sell.account", Priority.BULK)
+        assert ledger.stats() == {"sell.account": {"used": 3, "limit": None, "remaining": None}}
+        assert not ledger.prefer_stale("sell.account")
+
+    def test_persists_and_shares_file(self, tmp_path):
+        clock = FakeClock(EVENING)
+        path = str(tmp_path / "quota.db")
+        first = QuotaLedger({"buy.browse": 10}, path=path, clock=clock)
+        second = QuotaLedger({"buy.browse": 10}, path=path, clock=clock)
+
+        first.acquire("buy.browse")
+        second.acquire("buy.browse")
+        first.block("buy.browse", 30)
+        first.close()
+
+        restarted = QuotaLedger({"buy.browse": 10}, path=path, clock=clock)
+        assert restarted.used("buy.browse") == 2
+        with pytest.raises(QuotaExhausted) as excinfo:
+            restarted.acquire("buy.browse", Priority.CRITICAL)
+        assert excinfo.value.retry_after == 30
+
+    def test_set_used_and_stale_threshold(self):
+        ledger = QuotaLedger({"buy.browse": 1000}, stale_at=0.5, clock=FakeClock(EVENING))
+        ledger.set_used("buy.browse", 499)
+        assert not ledger.prefer_stale("buy.browse")
+        ledger.acquire("buy.browse")
+        assert ledger.prefer_stale("buy.browse")
+        assert ledger.usage("buy.browse") == 0.5
+
+
+class TestBaseClientQuota:
+    """Quota-aware degradation in BaseClient."""
+
+    ITEM = "/buy/browse/v1/item/v1|1|0"
+
+    @pytest.fixture
+    def transport(self):
+        transport = FakeTransport()
+        transport.add_response("GET", self.ITEM, json={"itemId": "v1|1|0"})
+        return transport
+
+    def test_fails_fast_without_sending(self, make_base_client, transport):
+        ledger = QuotaLedger({"buy.browse": 100})
+        ledger.set_used("buy.browse", 95)
+        client = make_base_client(transport, quota=ledger)
+
+        with pytest.raises(QuotaExhausted):
+            client.get(self.ITEM)
+        with use_priority(Priority.CRITICAL):
+            assert client.get(self.ITEM) == {"itemId": "v1|1|0"}
+
+        assert len(transport.requests) == 1
+        assert ledger.used("buy.browse") == 96
+
+    def test_call_given_up_in_queue_is_not_charged(self, make_base_client, transport):
+        ledger = QuotaLedger({"buy.browse": 100})
+        limiter = AdaptiveLimiter(initial_limit=1)
+        client = make_base_client(transport, quota=ledger, limiter=limiter)
+        limiter.acquire()
+
+        with pytest.raises(DeadlineExceeded):
+            client.get(self.ITEM, deadline=0.05)
+
+        assert ledger.used("buy.browse") == 0
+        assert transport.requests == []
+
+    def test_serves_stale_when_budget_is_low(self, make_base_client, transport):
+        ledger = QuotaLedger({"buy.browse": 100}, stale_at=0.5)
+        client = make_base_client(transport, quota=ledger, cache=MemoryCache(), cache_ttl=0.01)
+        client.get(self.ITEM)
+        time.sleep(0.02)
+
+        client.get(self.ITEM)
+        assert len(transport.requests) == 2
+
+        ledger.set_used("buy.browse", 50)
+        time.sleep(0.02)
+        assert client.get(self.ITEM) == {"itemId": "v1|1|0"}
+        assert len(transport.requests) == 2
+        assert client.metrics.snapshot()["cache"] == {"miss": 2, "stale_hit": 1}
+
+    def test_deferred_bulk_call_falls_back_to_stale(self, make_base_client, transport):
+        ledger = QuotaLedger({"buy.browse": 100}, stale_at=1.0)
+        client = make_base_client(transport, quota=ledger, cache=MemoryCache(), cache_ttl=0.01)
+        client.get(self.ITEM)
+        ledger.set_used("buy.browse", 90)
+        time.sleep(0.02)
+
+        with use_priority(Priority.BULK):
+            assert client.get(self.ITEM) == {"itemId": "v1|1|0"}
+            with pytest.raises(QuotaExhausted):
+                client.get("/buy/browse/v1/item/v1|2|0")
+        assert len(transport.requests) == 1
+
+    def test_throttle_blocks_family(self, make_base_client):
+        transport = FakeTransport()
+        transport.add_response(
+            "GET", self.ITEM, json={}, status_code=429, headers={"Retry-After": "120"}
+        )
+        ledger = QuotaLedger({})
+        client = make_base_client(transport, quota=ledger)
+
+        with pytest.raises(RateLimitExceeded):
+            client.get(self.ITEM)
+        with pytest.raises(QuotaExhausted) as excinfo:
+            client.get("/buy/browse/v1/item_summary/search")
+
+        assert excinfo.value.retry_after <= 120
+        assert len(transport.requests) == 1
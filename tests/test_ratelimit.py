@@ -0,0 +1,117 @@
+"""Tests for in-process and host-wide rate limiting."""
+
+import multiprocessing
+import time
+
+import pytest
+from conftest import FakeClock
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.errors import RateLimitExceeded
+from ebay_rest.ratelimit import RateLimiter, SharedTokenBucket, TokenBucket
+from ebay_rest.transport import FakeTransport
+
+
+def _send_paced(path: str, calls: int, stamps) -> None:
+    bucket = SharedTokenBucket(path, rate=100, burst=5)
+    for _ in range(calls):
+        bucket.acquire()
+        stamps.put(time.time())
+    bucket.close()
+
+
+class TestTokenBucket:
+    """TokenBucket test suite."""
+
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=3, clock=clock, sleep=clock.sleep)
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert bucket.acquire() == pytest.approx(0.1)
+
+        clock.now += 10
+        assert bucket.acquire() == 0.0
+
+    def test_max_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, max_wait=0.5, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+
+        with pytest.raises(RateLimitExceeded) as excinfo:
+            bucket.acquire()
+        assert excinfo.value.retry_after == 1
+        # The refused call took nothing: the next token is still due in 1s
+        clock.now += 0.6
+        assert bucket.acquire() == pytest.approx(0.4)
+
+    def test_rejects_bad_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestSharedTokenBucket:
+    """SharedTokenBucket test suite."""
+
+    def test_same_interface(self, tmp_path):
+        assert isinstance(TokenBucket(rate=1), RateLimiter)
+        shared = SharedTokenBucket(str(tmp_path / "rate.db"), rate=1)
+        assert isinstance(shared, RateLimiter)
+        shared.close()
+
+    def test_instances_share_one_bucket(self, tmp_path):
+        clock = FakeClock()
+        path = str(tmp_path / "rate.db")
+        first = SharedTokenBucket(path, rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        second = SharedTokenBucket(path, rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+        assert first.acquire() == 0.0
+        assert second.acquire() == 0.0
+        assert first.acquire() == pytest.approx(0.1)
+        # An idle peer leaves the whole rate to a busy one
+        for _ in range(5):
+            assert second.acquire() == pytest.approx(0.1)
+
+        other = SharedTokenBucket(
+            path, rate=10, burst=2, name="other", clock=clock, sleep=clock.sleep
+        )
+        assert other.acquire() == 0.0
+
+    def test_processes_stay_under_combined_rate(self, tmp_path):
+        path = str(tmp_path / "rate.db")
+        SharedTokenBucket(path, rate=100, burst=5).close()
+        context = multiprocessing.get_context("spawn")
+        stamps = context.Queue()
+        workers = [context.Process(target=_send_paced, args=(path, 15, stamps)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        sent = sorted(stamps.get(timeout=60) for _ in range(60))
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+        # 60 calls with a burst of 5 at 100/s take at least 0.55s whatever the split
+        assert sent[-1] - sent[0] >= 0.5
+
+
+class TestBaseClientRateLimiter:
+    """Rate limiting of BaseClient requests."""
+
+    def test_paces_calls(self, mock_oauth_client):
+        clock = FakeClock()
+        transport = FakeTransport()
+        transport.add_response("GET", "/buy/browse/v1/item/v1|1|0", json={})
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="t",
+            transport=transport,
+            rate_limiter=TokenBucket(rate=5, burst=1, clock=clock, sleep=clock.sleep),
+        )
+
+        for _ in range(3):
+            client.get("/buy/browse/v1/item/v1|1|0")
+
+        assert clock.slept == [pytest.approx(0.2), pytest.approx(0.2)]
+        assert client.metrics.snapshot()["phases"]["queue"]["count"] == 2
@@ -0,0 +1,133 @@
+"""Tests for the priority-aware request scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.priority import Priority, use_priority
+from ebay_rest.scheduler import RequestScheduler
+from ebay_rest.transport import FakeTransport, TransportResponse
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.001)
+
+
+def _queued(scheduler: RequestScheduler) -> int:
+    return sum(state["queued"] for state in scheduler.stats().values())
+
+
+def _start_waiter(
+    scheduler: RequestScheduler, priority: Priority, granted: list
+) -> threading.Thread:
+    def run():
+        scheduler.acquire(priority)
+        granted.append(priority)
+
+    thread = threading.Thread(target=run, daemon=True)
+    queued = _queued(scheduler)
+    thread.start()
+    _wait_for(lambda: _queued(scheduler) > queued or priority in granted)
+    return thread
+
+
+class TestRequestScheduler:
+    """RequestScheduler test suite."""
+
+    def test_weighted_fair_order(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        scheduler.acquire(Priority.NORMAL)
+        granted: list[Priority] = []
+        for priority in [Priority.BULK] * 4 + [Priority.NORMAL] * 4:
+            _start_waiter(scheduler, priority, granted)
+
+        scheduler.release(Priority.NORMAL)
+        for expected in range(1, 9):
+            _wait_for(lambda: len(granted) == expected)
+            scheduler.release(granted[-1])
+
+        n, b = Priority.NORMAL, Priority.BULK
+        assert granted == [n, n, b, n, n, b, b, b]
+
+    def test_class_limit(self):
+        scheduler = RequestScheduler(max_concurrency=4, class_limits={Priority.BULK: 1})
+        scheduler.acquire(Priority.BULK)
+        granted: list[Priority] = []
+        _start_waiter(scheduler, Priority.BULK, granted)
+
+        scheduler.acquire(Priority.NORMAL)
+        assert granted == []
+
+        scheduler.release(Priority.BULK)
+        _wait_for(lambda: granted == [Priority.BULK])
+
+    def test_interactive_preempts_bulk(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        scheduler.acquire(Priority.BULK)
+        scheduler.acquire(Priority.BULK)
+        granted: list[Priority] = []
+
+        scheduler.acquire(Priority.INTERACTIVE)
+        _start_waiter(scheduler, Priority.NORMAL, granted)
+        scheduler.release(Priority.BULK)
+        time.sleep(0.01)
+        assert granted == []
+
+        scheduler.release(Priority.INTERACTIVE)
+        _wait_for(lambda: granted == [Priority.NORMAL])
+        assert scheduler.stats()["interactive"]["mean_wait"] == 0.0
+
+    def test_rejects_bad_settings(self):
+        with pytest.raises(ValueError):
+            RequestScheduler(max_concurrency=0)
+        with pytest.raises(ValueError):
+            RequestScheduler(weights={Priority.BULK: 0})
+
+
+class TestBaseClientScheduler:
+    """Scheduling of BaseClient requests."""
+
+    def test_interactive_calls_skip_bulk_backlog(self, mock_oauth_client):
+        def handler(request):
+            time.sleep(0.02)
+            return TransportResponse.from_json({"ok": True})
+
+        scheduler = RequestScheduler(max_concurrency=2)
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="t",
+            transport=FakeTransport(handler=handler),
+            scheduler=scheduler,
+        )
+        stop = threading.Event()
+
+        def bulk_sync():
+            with use_priority(Priority.BULK):
+                while not stop.is_set():
+                    client.get("/sell/inventory/v1/inventory_item")
+
+        workers = [threading.Thread(target=bulk_sync) for _ in range(6)]
+        for worker in workers:
+            worker.start()
+        _wait_for(lambda: scheduler.stats()["bulk"]["queued"] >= 3)
+
+        with use_priority(Priority.INTERACTIVE):
+            for _ in range(3):
+                client.get("/buy/browse/v1/item/v1|1|0")
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+        stats = scheduler.stats()
+        assert stats["interactive"]["dispatched"] == 3
+        # Well under one 20ms bulk call: interactive calls never wait for a bulk slot
+        assert stats["interactive"]["mean_wait"] < 0.005
+        assert stats["bulk"]["mean_wait"] > 0.005
+        assert client.metrics.snapshot()["phases"]["queue"]["count"] > 0
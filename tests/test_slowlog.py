@@ -0,0 +1,105 @@
+"""Tests for the slow-call log."""
+
+import json
+import logging
+
+import pytest
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.errors import NotFoundError
+from ebay_rest.slowlog import SlowRequestLog
+from ebay_rest.transport import FakeTransport
+
+
+@pytest.fixture
+def transport():
+    transport = FakeTransport()
+    transport.add_response(
+        "GET", "/buy/browse/v1/item_summary/search", json={"itemSummaries": [], "total": 0}
+    )
+    transport.add_response("POST", "/sell/inventory/v1/offer", json={"offerId": "1"})
+    return transport
+
+
+@pytest.fixture
+def client(mock_oauth_client, transport):
+    return BaseClient(
+        auth_client=mock_oauth_client,
+        base_url="https://api.ebay.com",
+        user_access_token="token",
+        transport=transport,
+    )
+
+
+class TestSlowRequestLog:
+    """SlowRequestLog test suite."""
+
+    def test_logs_sanitized_details(self, client, caplog):
+        SlowRequestLog(threshold=0).install(client.hooks)
+
+        with caplog.at_level(logging.WARNING, logger="ebay_rest"):
+            client.get(
+                "/buy/browse/v1/item_summary/search",
+                params={"q": "drone", "access_token": "secret"},
+            )
+
+        (record,) = caplog.records
+        details = record.ebay_rest_slow_call
+        assert details["endpoint"] == "GET /buy/browse/v1/item_summary/search"
+        assert details["status"] == 200
+        assert details["bytes_in"] == len(b'{"itemSummaries": [], "total": 0}')
+        assert details["params"] == {"q": "drone", "access_token": "***REDACTED***"}
+        assert {"token", "ttfb", "body", "decode"} <= set(details["phases"])
+        assert "secret" not in caplog.text
+        assert "Bearer" not in caplog.text
+
+    def test_per_endpoint_thresholds(self, client, caplog):
+        slowlog = SlowRequestLog(
+            threshold=0,
+            thresholds={
+                "GET /buy/browse/v1/item_summary/search": 60,
+                "/sell/inventory/v1/offer": 0,
+            },
+        ).install(client.hooks)
+
+        with caplog.at_level(logging.WARNING, logger="ebay_rest"):
+            client.get("/buy/browse/v1/item_summary/search", params={"q": "x"})
+            client.post("/sell/inventory/v1/offer", json={"sku": "A"})
+            with pytest.raises(NotFoundError):
+                client.get("/sell/fulfillment/v1/order/1-2-3")
+
+        assert slowlog.slow_calls == 2
+        assert [r.ebay_rest_slow_call["endpoint"] for r in caplog.records] == [
+            "POST /sell/inventory/v1/offer",
+            "GET /sell/fulfillment/v1/order/{id}",
+        ]
+        assert slowlog.threshold_for("GET /other") == 0
+
+    def test_sampled_payload_capture_rotates(self, client, tmp_path):
+        path = tmp_path / "slow.jsonl"
+        slowlog = SlowRequestLog(
+            threshold=0, capture_path=str(path), sample_rate=1.0, max_bytes=600, backup_count=2
+        ).install(client.hooks)
+
+        for _ in range(10):
+            client.post("/sell/inventory/v1/offer", json={"sku": "A", "refresh_token": "r"})
+        slowlog.close()
+
+        line = json.loads(path.read_text().splitlines()[-1])
+        assert line["request_json"] == {"sku": "A", "refresh_token": "***REDACTED***"}
+        assert line["response_body"] == {"offerId": "1"}
+        assert (tmp_path / "slow.jsonl.1").exists()
+        assert not (tmp_path / "slow.jsonl.3").exists()
+
+    def test_sampling_rate_zero_captures_nothing(self, client, tmp_path):
+        path = tmp_path / "slow.jsonl"
+        slowlog = SlowRequestLog(threshold=0, capture_path=str(path), sample_rate=0.0)
+        slowlog.install(client.hooks)
+
+        client.post("/sell/inventory/v1/offer", json={"sku": "A"})
+        slowlog.uninstall(client.hooks)
+        slowlog.close()
+
+        assert slowlog.slow_calls == 1
+        assert path.read_text() == ""
+        assert not client.hooks.enabled
@@ -0,0 +1,116 @@
+"""Tests for client snapshots and warm-start restore."""
+
+import gzip
+import os
+import stat
+import time
+
+import pytest
+
+from ebay_rest import EbayClient
+from ebay_rest.concurrency import AdaptiveLimiter
+from ebay_rest.ratelimit import TokenBucket
+from ebay_rest.snapshot import read_snapshot, write_snapshot
+from ebay_rest.testing import FakeEbayApi, FakeEbayServer, data
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeEbayServer(FakeEbayApi(items=100, seed=0)) as server:
+        yield server
+
+
+class TestSnapshotFile:
+    """write_snapshot/read_snapshot test suite."""
+
+    def test_round_trip_is_private_gzip(self, tmp_path):
+        path = tmp_path / "state.gz"
+        write_snapshot(str(path), {"version": 1, "app_token": {"access_token": "t"}})
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert gzip.decompress(path.read_bytes()).startswith(b"{")
+        assert read_snapshot(str(path))["app_token"] == {"access_token": "t"}
+        assert [p.name for p in tmp_path.iterdir()] == ["state.gz"]
+
+    def test_missing_corrupt_or_foreign_files_start_cold(self, tmp_path):
+        assert read_snapshot(str(tmp_path / "missing.gz")) is None
+        (tmp_path / "corrupt.gz").write_bytes(b"not gzip")
+        assert read_snapshot(str(tmp_path / "corrupt.gz")) is None
+        write_snapshot(str(tmp_path / "future.gz"), {"version": 99})
+        assert read_snapshot(str(tmp_path / "future.gz")) is None
+
+
+class TestEbayClientSnapshot:
+    """EbayClient.snapshot()/restore() test suite."""
+
+    def test_restored_client_skips_token_fetch(self, server, tmp_path):
+        path = str(tmp_path / "client.gz")
+        first = EbayClient("id", "secret", base_url=server.url)
+        first.browse.get_item(data.item_id(1))
+        first.snapshot(path)
+        tokens_issued = server.api.stats()["tokens_issued"]
+
+        second = EbayClient("id", "secret", base_url=server.url)
+        assert second.restore(path) == ["app_token"]
+        second.browse.get_item(data.item_id(2))
+
+        assert server.api.stats()["tokens_issued"] == tokens_issued
+        assert second.auth.access_token == first.auth.access_token
+
+    def test_user_token_and_account_profile(self, server):
+        first = EbayClient("id", "secret", base_url=server.url, user_refresh_token="r")
+        first.set_user_access_token("user-token", refresh_token="r")
+        first.base_client.credentials.expires_at = time.time() + 3600
+        first.account.get_profile_cache().get_profile()
+        state = first.snapshot()
+        assert "refresh_token" not in str(state)
+
+        second = EbayClient("id", "secret", base_url=server.url, user_refresh_token="r")
+        assert second.restore(state) == ["user_token", "account_profile"]
+        assert second.base_client.user_access_token == "user-token"
+        cache = second.account.get_profile_cache()
+        assert not cache.is_stale()
+        assert cache.get_profile() == first.account.get_profile_cache().get_profile()
+
+    def test_limiter_and_rate_limiter_levels(self, server):
+        def client() -> EbayClient:
+            return EbayClient(
+                "id",
+                "secret",
+                base_url=server.url,
+                limiter=AdaptiveLimiter(initial_limit=4, max_limit=16),
+                rate_limiter=TokenBucket(rate=1, burst=10, sleep=lambda seconds: None),
+            )
+
+        first = client()
+        first.base_client.limiter.restore_state({"limit": 12})
+        for _ in range(10):
+            first.base_client.rate_limiter.acquire()
+        state = first.snapshot()
+
+        second = client()
+        assert second.restore(state) == ["limiter", "rate_limiter"]
+        assert second.base_client.limiter.limit == 12
+        # The drained bucket stays drained instead of granting a fresh burst
+        assert second.base_client.rate_limiter.export_state()["tokens"] < 1
+
+    def test_skips_expired_and_mismatched_state(self, server):
+        state = {
+            "version": 1,
+            "created_at": time.time() - 600,
+            "client_id": "id",
+            "base_url": server.url,
+            "app_token": {
+                "access_token": "old",
+                "expires_at": time.time() - 1,
+                "scope": "https://api.ebay.com/oauth/api_scope",
+            },
+            "user_token": {"access_token": "other", "expires_at": None, "scope_id": "someone-else"},
+            "account_profile": {"profile": {}, "age": 0.0, "ttl": 300.0},
+        }
+        client = EbayClient("id", "secret", base_url=server.url, user_refresh_token="r")
+        assert client.restore(state) == []
+        assert client.auth.access_token is None
+
+        other_app = EbayClient("other-app", "secret", base_url=server.url)
+        assert other_app.restore(dict(state, app_token={})) == []
@@ -0,0 +1,177 @@
+"""Tests for the seller token vault."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.errors import AuthError
+from ebay_rest.token_vault import InMemoryTokenStore, SQLiteTokenStore, TokenVault
+
+
+class TestTokenVault:
+    """TokenVault test suite."""
+
+    def test_add_and_get(self):
+        vault = TokenVault()
+        vault.add("seller-1", refresh_token="r1", access_token="a1")
+
+        creds = vault.get("seller-1")
+        assert creds.seller_id == "seller-1"
+        assert creds.access_token == "a1"
+        assert vault.get("seller-1") is creds
+
+    def test_unknown_seller_raises(self):
+        with pytest.raises(AuthError):
+            TokenVault().get("missing")
+
+    def test_lru_eviction_keeps_store(self):
+        store = InMemoryTokenStore()
+        vault = TokenVault(store, max_size=2)
+        for seller in ("a", "b", "c"):
+            vault.add(seller, refresh_token=f"r-{seller}")
+
+        assert len(vault) == 2
+        assert "a" in vault
+        # Evicted sellers are reloaded from the store on demand
+        assert vault.get("a").refresh_token == "r-a"
+        assert len(vault) == 2
+
+    def test_get_marks_recently_used(self):
+        vault = TokenVault(max_size=2)
+        vault.add("a", refresh_token="ra")
+        vault.add("b", refresh_token="rb")
+        creds_a = vault.get("a")
+        vault.add("c", refresh_token="rc")
+
+        # "b" was least recently used, so "a" keeps its in-memory object
+        assert vault.get("a") is creds_a
+
+    def test_evicted_credentials_in_use_are_not_reloaded(self):
+        vault = TokenVault(max_size=1)
+        vault.add("a", refresh_token="ra")
+        held = vault.get("a")
+        vault.add("b", refresh_token="rb")
+
+        assert len(vault) == 1
+        assert vault.get("a") is held
+
+    def test_slow_store_load_does_not_block_other_sellers(self):
+        class SlowStore(InMemoryTokenStore):
+            def load(self, seller_id):
+                if seller_id == "slow":
+                    release.wait(timeout=5)
+                return super().load(seller_id)
+
+        release = threading.Event()
+        store = SlowStore()
+        store.save("slow", {"refresh_token": "r"})
+        vault = TokenVault(store)
+        vault.add("fast", refresh_token="rf")
+
+        loader = threading.Thread(target=vault.get, args=("slow",))
+        loader.start()
+        try:
+            started = time.perf_counter()
+            assert vault.get("fast").refresh_token == "rf"
+            assert time.perf_counter() - started < 1
+        finally:
+            release.set()
+            loader.join()
+
+    def test_default_scopes(self):
+        vault = TokenVault(scopes=["scope-a"])
+        assert vault.add("seller", refresh_token="r").scopes == ["scope-a"]
+
+    def test_refresh_is_persisted(self):
+        store = InMemoryTokenStore()
+        vault = TokenVault(store)
+        creds = vault.add("seller", refresh_token="r1")
+
+        creds.update({"access_token": "fresh", "expires_in": 7200, "refresh_token": "r2"})
+
+        record = store.load("seller")
+        assert record["access_token"] == "fresh"
+        assert record["refresh_token"] == "r2"
+        assert record["expires_at"] > time.time()
+
+    def test_remove(self):
+        store = InMemoryTokenStore()
+        vault = TokenVault(store)
+        vault.add("seller", refresh_token="r")
+        vault.remove("seller")
+        assert "seller" not in vault
+        assert store.load("seller") is None
+
+
+class TestSQLiteTokenStore:
+    """SQLiteTokenStore test suite."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        path = str(tmp_path / "tokens.db")
+        SQLiteTokenStore(path).save("seller", {"refresh_token": "r", "scopes": ["s"]})
+
+        record = SQLiteTokenStore(path).load("seller")
+        assert record == {"refresh_token": "r", "scopes": ["s"]}
+
+    def test_delete(self, tmp_path):
+        store = SQLiteTokenStore(str(tmp_path / "tokens.db"))
+        store.save("seller", {"refresh_token": "r"})
+        store.delete("seller")
+        assert store.load("seller") is None
+
+    def test_file_is_private(self, tmp_path):
+        path = tmp_path / "tokens.db"
+        SQLiteTokenStore(str(path))
+        assert path.stat().st_mode & 0o077 == 0
+
+
+class TestVaultWithBaseClient:
+    """Lazy, single-flight refresh of vault credentials."""
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_lazy_refresh_on_first_use(self, mock_refresh, mock_oauth_client):
+        mock_refresh.return_value = {"access_token": "fresh", "expires_in": 7200}
+        store = InMemoryTokenStore()
+        vault = TokenVault(store)
+        vault.add("seller", refresh_token="r")
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+
+        creds = vault.get("seller")
+        mock_refresh.assert_not_called()
+
+        with client.use_credentials(creds):
+            assert client._get_headers()["Authorization"] == "Bearer fresh"
+            client._get_headers()
+
+        mock_refresh.assert_called_once()
+        assert store.load("seller")["access_token"] == "fresh"
+
+    @patch("ebay_rest.base_client.oauth.refresh_user_token")
+    def test_single_flight_refresh(self, mock_refresh, mock_oauth_client):
+        def slow_refresh(**kwargs):
+            time.sleep(0.05)
+            return {"access_token": "fresh", "expires_in": 7200}
+
+        mock_refresh.side_effect = slow_refresh
+        vault = TokenVault()
+        vault.add("seller", refresh_token="r", access_token="old", expires_at=0)
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        seller = client.as_user(vault.get("seller"))
+
+        tokens = []
+
+        def worker():
+            with client.use_credentials(seller.credentials):
+                tokens.append(client._get_headers()["Authorization"])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_refresh.call_count == 1
+        assert tokens == ["Bearer fresh"] * 8
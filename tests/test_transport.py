@@ -0,0 +1,172 @@
+"""Tests for pluggable HTTP transports."""
+
+import pytest
+import requests
+
+from ebay_rest.base_client import BaseClient
+from ebay_rest.errors import EbayAPIError, NotFoundError, RateLimitExceeded
+from ebay_rest.transport import (
+    FakeTransport,
+    RequestsTransport,
+    TransportResponse,
+    Urllib3Transport,
+)
+
+
+class TestTransportResponse:
+    """TransportResponse test suite."""
+
+    def test_from_json(self):
+        response = TransportResponse.from_json({"a": 1}, status_code=201)
+        assert response.status_code == 201
+        assert response.json() == {"a": 1}
+        assert response.text == '{"a": 1}'
+        assert response.headers["Content-Type"] == "application/json"
+
+    def test_empty_body(self):
+        response = TransportResponse.from_json(None, status_code=204)
+        assert response.content == b""
+        assert response.text == ""
+
+
+class TestUrllib3Transport:
+    """Urllib3Transport test suite."""
+
+    def test_get_encodes_params_and_drops_none(self, local_http_server):
+        transport = Urllib3Transport()
+        response = transport.send(
+            "GET",
+            f"{local_http_server}/echo",
+            params={"q": "a b", "limit": 5, "offset": None},
+            headers={"Authorization": "Bearer t"},
+            timeout=5,
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["path"] == "/echo?q=a+b&limit=5"
+        assert body["authorization"] == "Bearer t"
+        assert response.elapsed is not None
+
+    def test_post_json(self, local_http_server):
+        response = Urllib3Transport().send(
+            "POST", f"{local_http_server}/echo", json={"a": 1}, timeout=5
+        )
+        assert response.status_code == 200
+
+    def test_connections_reused(self, local_http_server):
+        transport = Urllib3Transport()
+        for _ in range(3):
+            transport.send("GET", f"{local_http_server}/ping", timeout=5)
+
+        host_stats = list(transport.pool_stats()["hosts"].values())[0]
+        assert host_stats["requests"] == 3
+        assert host_stats["connections_created"] == 1
+
+    def test_connection_error_mapped_to_requests(self):
+        with pytest.raises(requests.ConnectionError):
+            Urllib3Transport().send("GET", "http://127.0.0.1:1/x", timeout=1)
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError):
+            Urllib3Transport(pool_maxsize=0)
+
+
+class TestFakeTransport:
+    """FakeTransport test suite."""
+
+    def test_routes_match_method_and_path(self):
+        transport = FakeTransport()
+        transport.add_response("GET", "/item/1", json={"itemId": "1"})
+
+        response = transport.send("GET", "https://api.ebay.com/item/1", params={"x": 1})
+        assert response.json() == {"itemId": "1"}
+        assert transport.send("DELETE", "https://api.ebay.com/item/1").status_code == 404
+
+    def test_handler_used_for_unrouted_requests(self):
+        transport = FakeTransport(
+            handler=lambda request: TransportResponse.from_json({"path": request.path})
+        )
+        assert transport.send("GET", "https://api.ebay.com/a/b").json() == {"path": "/a/b"}
+
+    def test_records_requests(self):
+        transport = FakeTransport()
+        transport.send("POST", "https://api.ebay.com/x", json={"a": 1}, headers={"H": "v"})
+
+        request = transport.requests[0]
+        assert request.method == "POST"
+        assert request.json == {"a": 1}
+        assert request.headers == {"H": "v"}
+        assert transport.pool_stats() == {"requests": 1}
+
+    def test_recording_can_be_disabled(self):
+        transport = FakeTransport(record=False)
+        transport.send("GET", "https://api.ebay.com/x")
+        assert transport.requests == []
+
+
+class TestBaseClientTransport:
+    """BaseClient routed through a custom transport."""
+
+    def _client(self, mock_oauth_client, transport) -> BaseClient:
+        return BaseClient(
+            auth_client=mock_oauth_client,
+            base_url="https://api.ebay.com",
+            user_access_token="token",
+            transport=transport,
+        )
+
+    def test_default_transport_is_requests(self, mock_oauth_client):
+        client = BaseClient(auth_client=mock_oauth_client, base_url="https://api.ebay.com")
+        assert isinstance(client.transport, RequestsTransport)
+        assert client.session is client.transport.session
+
+    def test_all_verbs_use_transport(self, mock_oauth_client):
+        transport = FakeTransport()
+        transport.add_response("GET", "/r", json={"verb": "get"})
+        transport.add_response("POST", "/r", json={"verb": "post"})
+        transport.add_response("PUT", "/r", json={"verb": "put"})
+        transport.add_response("DELETE", "/r", json=None, status_code=204)
+        client = self._client(mock_oauth_client, transport)
+
+        assert client.get("/r", params={"a": 1}) == {"verb": "get"}
+        assert client.post("/r", json={"b": 2}) == {"verb": "post"}
+        assert client.put("/r", json={"c": 3}) == {"verb": "put"}
+        assert client.delete("/r") == {}
+
+        methods = [request.method for request in transport.requests]
+        assert methods == ["GET", "POST", "PUT", "DELETE"]
+        assert transport.requests[0].params == {"a": 1}
+        assert transport.requests[1].json == {"b": 2}
+        assert transport.requests[0].headers["Authorization"] == "Bearer token"
+        assert transport.requests[0].timeout == 30
+
+    def test_error_mapping(self, mock_oauth_client):
+        transport = FakeTransport()
+        transport.add_response(
+            "GET", "/limited", json={"errors": [{"message": "Slow down"}]}, status_code=429
+        )
+        client = self._client(mock_oauth_client, transport)
+
+        with pytest.raises(RateLimitExceeded, match="Slow down"):
+            client.get("/limited")
+        with pytest.raises(NotFoundError):
+            client.get("/missing")
+
+    def test_network_error_mapping(self, mock_oauth_client):
+        def handler(request):
+            raise requests.ConnectionError("refused")
+
+        client = self._client(mock_oauth_client, FakeTransport(handler=handler))
+        with pytest.raises(EbayAPIError, match="Network error during PUT request"):
+            client.put("/x", json={})
+
+    def test_urllib3_transport_end_to_end(self, mock_oauth_client, local_http_server):
+        client = BaseClient(
+            auth_client=mock_oauth_client,
+            base_url=local_http_server,
+            user_access_token="token",
+            transport=Urllib3Transport(),
+        )
+        assert client.get("/echo/item", params={"q": "x"})["authorization"] == "Bearer token"
+        client.close()
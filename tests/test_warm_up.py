@@ -0,0 +1,64 @@
+"""Tests for connection and token pre-warming."""
+
+import asyncio
+
+import pytest
+
+from ebay_rest import EbayClient
+from ebay_rest.testing import FakeEbayApi, FakeEbayServer, data
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeEbayServer(FakeEbayApi(items=100, seed=0)) as server:
+        yield server
+
+
+def _host_stats(client: EbayClient) -> dict[str, int]:
+    (stats,) = client.base_client.pool_stats()["hosts"].values()
+    return stats
+
+
+class TestWarmUp:
+    """warm_up() test suite."""
+
+    def test_opens_pooled_connections_and_fetches_token(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, pool_maxsize=4)
+
+        report = client.warm_up(connections=4)
+
+        assert report["errors"] == []
+        assert report["resolved"]["127.0.0.1"] == ["127.0.0.1"]
+        assert report["app_token"] and not report["user_token"]
+        assert report["connections"] == 4
+        assert _host_stats(client)["idle"] == 4
+        assert client.auth.access_token is not None
+
+        client.browse.get_item(data.item_id(1))
+        assert _host_stats(client)["connections_created"] == 4  # first call reused one
+
+    def test_connections_capped_at_pool_size(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, pool_maxsize=2)
+        assert client.warm_up(connections=8, app_token=False)["connections"] == 2
+        assert client.auth.access_token is None
+
+    def test_refreshes_user_token_and_loads_profile(self, server):
+        client = EbayClient("id", "secret", base_url=server.url, user_refresh_token="refresh")
+
+        report = client.warm_up(account_profile=True)
+
+        assert report["user_token"] and report["account_profile"]
+        assert client.base_client.user_access_token is not None
+        assert not client.account.get_profile_cache().is_stale()
+
+    def test_failures_are_reported(self):
+        client = EbayClient("id", "secret", base_url="http://127.0.0.1:9", connect_timeout=1)
+        report = client.warm_up(connections=2)
+        assert report["connections"] == 0
+        assert any(error.startswith("token") for error in report["errors"])
+        assert any(error.startswith("connect") for error in report["errors"])
+
+    def test_async(self, server):
+        client = EbayClient("id", "secret", base_url=server.url)
+        report = asyncio.run(client.warm_up_async(connections=2))
+        assert report["connections"] == 2 and report["app_token"]